@@ -1,4 +1,55 @@
+import os
+
 CALCULATION_TIMEOUT = 5
 CALCULATION_TIMEOUT_ERROR_MESSAGE = (
     f"Calculation timed out. Maximum calculation time is {CALCULATION_TIMEOUT} seconds"
 )
+
+EXPRESSION_CACHE_MAX_SIZE = 512
+EXPRESSION_CACHE_MAX_MEMORY_BYTES = 32 * 1024 * 1024
+
+PROCESS_POOL_SIZE = int(os.environ.get("PROCESS_POOL_SIZE", os.cpu_count() or 1))
+PROCESS_POOL_MAX_QUEUE_DEPTH = int(os.environ.get("PROCESS_POOL_MAX_QUEUE_DEPTH", 64))
+PROCESS_POOL_TASK_DEADLINE = float(
+    os.environ.get("PROCESS_POOL_TASK_DEADLINE", CALCULATION_TIMEOUT + 1)
+)
+PROCESS_POOL_QUEUE_FULL_ERROR_MESSAGE = (
+    "Server is busy. Too many calculations are queued, please try again later"
+)
+PROCESS_POOL_INTERRUPTED_ERROR_MESSAGE = (
+    "Calculation was interrupted because its worker was restarted, please try again"
+)
+
+RESULT_CACHE_MAX_SIZE = 1024
+RESULT_CACHE_MAX_MEMORY_BYTES = 64 * 1024 * 1024
+# Interpolations of more data points are not cached for plotting, their arguments would be sent back from the worker
+RESULT_CACHE_MAX_PLOT_POINTS = 10000
+RESULT_NOT_FOUND_ERROR_MESSAGE = (
+    "Result not found. It may have been removed from the cache"
+)
+
+FACTORIZATION_CACHE_MAX_SIZE = 64
+FACTORIZATION_CACHE_MAX_MEMORY_BYTES = 256 * 1024 * 1024
+
+INTERPOLANT_STORE_MAX_SIZE = 1024
+INTERPOLANT_STORE_MAX_MEMORY_BYTES = 64 * 1024 * 1024
+INTERPOLANT_STORE_TTL_SECONDS = 60 * 60
+INTERPOLANT_NOT_FOUND_ERROR_MESSAGE = (
+    "Interpolant not found. It may have expired or been removed from the store"
+)
+# Stored interpolants are updated and evaluated in the API process, so the work of one request is limited
+INTERPOLANT_EVALUATION_MAX_POINTS = 1 << 18
+INTERPOLANT_EVALUATION_MAX_OPERATIONS = 1 << 24
+INTERPOLANT_UPDATE_MAX_OPERATIONS = 1 << 20
+
+ROMBERG_MAX_INTERVAL_PARTITIONS = 1 << 24
+
+GAUSSIAN_QUADRATURE_MAX_ORDER = 256
+
+INTEGRATION_CHUNK_SIZE = 1 << 18
+INTEGRATION_THREADS = int(os.environ.get("INTEGRATION_THREADS", 1))
+
+MULTIDIMENSIONAL_INTEGRATION_MAX_SAMPLES = 1 << 26
+QUASI_MONTE_CARLO_REPLICATES = 8
+
+NUMEXPR_MIN_ARRAY_SIZE = 1 << 16
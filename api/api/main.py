@@ -1,45 +1,133 @@
 import asyncio
 
-from fastapi import FastAPI, HTTPException, WebSocket
+from fastapi import FastAPI, Header, HTTPException, Request, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
 from websockets.exceptions import ConnectionClosedOK
 
-from api.constants import CALCULATION_TIMEOUT_ERROR_MESSAGE
+from api.constants import (
+    INTERPOLANT_NOT_FOUND_ERROR_MESSAGE,
+    RESULT_NOT_FOUND_ERROR_MESSAGE,
+)
+from core.helpers.compile_expression import get_expression_cache_stats
+from core.helpers.plotting import PlotMode, PlotResponse
 from core.helpers.validate_expression import validate_expression
+from core.integration.adaptive_quadrature import (
+    AdaptiveQuadratureMethod,
+    AdaptiveQuadratureResponse,
+    adaptive_quadrature,
+)
+from core.integration.batch_integration import (
+    BatchIntegrationRequest,
+    BatchIntegrationResponse,
+    batch_integration,
+)
+from core.integration.gaussian_quadrature import (
+    GaussianQuadratureResponse,
+    GaussianQuadratureRule,
+    gaussian_quadrature,
+)
+from core.integration.multidimensional_integration import (
+    MultidimensionalIntegrationRequest,
+    MultidimensionalIntegrationResponse,
+    multidimensional_integration,
+)
 from core.integration.rectangles_rule import (
     rectangles_rule,
     RectanglesRuleResponse,
     RectangleRuleType,
 )
 from core.integration.simpsons_rule import SimpsonsRuleResponse, simpsons_rule
-from core.integration.trapezoidal_rule import trapezoidal_rule, TrapezoidalRuleResponse
+from core.integration.trapezoidal_rule import (
+    TrapezoidalRuleMode,
+    trapezoidal_rule,
+    TrapezoidalRuleResponse,
+)
+from core.interpolation.chebyshev_nodes import (
+    chebyshev_nodes,
+    ChebyshevNodesKind,
+    ChebyshevNodesResponse,
+)
+from core.interpolation.interpolant import (
+    add_interpolant_points,
+    build_interpolant,
+    evaluate_interpolant,
+    InterpolantEvaluationRequest,
+    InterpolantEvaluationResponse,
+    InterpolantPointsRequest,
+    InterpolantRequest,
+    InterpolantResponse,
+)
 from core.interpolation.lagranges_interpolation_method import (
     lagranges_interpolation_method,
+    render_lagranges_interpolation_method_plot,
     LagrangesInterpolationMethodResponse,
 )
 from core.interpolation.newtons_interpolation_method import (
     NewtonsInterpolationMethodResponse,
     newtons_interpolation_method,
+    render_newtons_interpolation_method_plot,
 )
 from core.linear_systems.fixed_point_iteration_system import (
+    FixedPointIterationSystemMethod,
+    FixedPointIterationSystemMethodRequest,
     FixedPointIterationSystemMethodResponse,
     fixed_point_iteration_system_method,
+    Preconditioner,
 )
+from core.linear_systems.factorization_cache import get_factorization_cache_stats
 from core.linear_systems.gaussian_elimination_method import (
     GaussianEliminationMethodResponse,
     gaussian_elimination_method,
 )
+from core.linear_systems.matrix_input import LinearSystemRequest
 from core.linear_systems.least_squares_method import (
+    LeastSquaresMethodRequest,
     LeastSquaresMethodResponse,
     least_squares_method,
+    LeastSquaresSolver,
+)
+from core.non_linear.batch_root_finding import (
+    batch_root_finding,
+    BatchRootFindingRequest,
+    BatchRootFindingResponse,
+)
+from core.non_linear.brents_method import (
+    BrentsMethodResponse,
+    brents_method,
+    render_brents_method_plot,
 )
 from core.non_linear.fixed_point_iteration_method import (
     fixed_point_iteration,
     FixedPointIterationMethodResponse,
+    render_fixed_point_iteration_plot,
+)
+from core.non_linear.newtons_method import (
+    NewtonsMethodVariant,
+    newtons_method,
+    NewtonsMethodResponse,
+    render_newtons_method_plot,
+)
+from core.non_linear.secant_method import (
+    render_secant_method_plot,
+    secant_method,
+    SecantMethodResponse,
 )
-from core.non_linear.newtons_method import newtons_method, NewtonsMethodResponse
-from core.non_linear.secant_method import secant_method, SecantMethodResponse
+from helpers.binary_transport import (
+    array_response,
+    BINARY_REQUEST_BODY,
+    interpolate_binary,
+    solve_linear_system_binary,
+    wants_binary_response,
+)
+from helpers.interpolant_store import (
+    get_interpolant,
+    interpolant_lock,
+    store_interpolant,
+)
+from helpers.cache_stats import collect_cache_stats
+from helpers.process_pool import process_pool
+from helpers.result_cache import cache_result, get_cached_result
 from helpers.server_load import get_server_load
 
 app = FastAPI(title="Numerical Methods Labs API")
@@ -53,6 +141,11 @@ app.add_middleware(
 )
 
 
+@app.on_event("shutdown")
+def __shutdown_process_pool():
+    process_pool.shutdown()
+
+
 @app.websocket(
     "/server_health",
     name="Server health",
@@ -79,10 +172,61 @@ async def __server_load(websocket: WebSocket):
     ),
 )
 async def __validate_expression(expression: str) -> bool:
-    try:
-        return validate_expression(expression)
-    except TimeoutError:
-        raise HTTPException(status_code=408, detail=CALCULATION_TIMEOUT_ERROR_MESSAGE)
+    return await process_pool.run(validate_expression, expression)
+
+
+@app.get(
+    "/expression_cache_stats",
+    name="Expression cache statistics",
+    tags=["Helpers"],
+    summary="Returns statistics of the compiled expression cache",
+    description=(
+        "Returns statistics of the compiled expression cache.\n"
+        "Includes the number of cached expressions, estimated memory usage, limits and hit, miss and eviction counters.\n"
+        "Every worker process has its own cache, so the statistics are returned for every worker by its process ID "
+        "and summed over all workers in total."
+    ),
+)
+async def __expression_cache_stats() -> dict:
+    return await collect_cache_stats(get_expression_cache_stats)
+
+
+@app.get(
+    "/factorization_cache_stats",
+    name="Factorization cache statistics",
+    tags=["Helpers"],
+    summary="Returns statistics of the matrix factorization cache",
+    description=(
+        "Returns statistics of the LU and QR factorization cache used by the linear systems methods.\n"
+        "Includes the number of cached factorizations, estimated memory usage, limits and hit, miss and eviction counters.\n"
+        "Every worker process has its own cache, so the statistics are returned for every worker by its process ID "
+        "and summed over all workers in total."
+    ),
+)
+async def __factorization_cache_stats() -> dict:
+    return await collect_cache_stats(get_factorization_cache_stats)
+
+
+@app.get(
+    "/plot/{result_id}",
+    name="Plot",
+    tags=["Helpers"],
+    summary="Creates the SVG plot of a previous calculation",
+    description=(
+        "Creates the SVG plot of a previous calculation.\n"
+        "The result ID is returned by the calculations that support plotting, including those requested without a plot, "
+        "except for interpolations of too many data points.\n"
+        "Results are kept for a limited time, so the plot of an old calculation may not be available anymore.\n"
+        "Returns the SVG plot."
+    ),
+)
+async def __plot(result_id: str) -> PlotResponse:
+    cached_result = get_cached_result(result_id)
+    if cached_result is None:
+        raise HTTPException(status_code=404, detail=RESULT_NOT_FOUND_ERROR_MESSAGE)
+
+    render_plot, plot_args = cached_result
+    return {"plot_svg": await process_pool.run(render_plot, **plot_args)}
 
 
 @app.get(
@@ -91,19 +235,27 @@ async def __validate_expression(expression: str) -> bool:
     tags=["Non-linear"],
     summary="Computes the root of a function using Newton's method",
     description=(
-        "Computes the root of a function using Newton's method.\n"
-        "The function and its derivative must be provided in string expression format.\n"
+        "Computes the root of a function using Newton's method or Halley's method.\n"
+        "The function and optionally its derivative must be provided in string expression format, "
+        "the derivatives that are not provided are derived symbolically.\n"
         "Tolerance and maximum number of iterations are optional.\n"
-        "Returns the root, number of iterations, number of function calls, execution time and SVG plot."
+        "Returns the root, number of iterations, number of function calls, the used derivative, execution time and SVG plot.\n"
+        "Set plot to 'none' to skip plotting or to 'data' to get the plotted values instead of the SVG plot."
     ),
 )
 async def __newtons_method(
-    f_string: str, df_string: str, x0: float, tol: float = 1e-6, max_iter: int = 100
+    f_string: str,
+    x0: float,
+    df_string: str | None = None,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+    plot: PlotMode = PlotMode.SVG,
+    method: NewtonsMethodVariant = NewtonsMethodVariant.NEWTON,
 ) -> NewtonsMethodResponse:
-    try:
-        return newtons_method(f_string, df_string, x0, tol, max_iter)
-    except TimeoutError:
-        raise HTTPException(status_code=400, detail=CALCULATION_TIMEOUT_ERROR_MESSAGE)
+    result = await process_pool.run(
+        newtons_method, f_string, df_string, x0, tol, max_iter, plot, method
+    )
+    return cache_result(result, render_newtons_method_plot)
 
 
 @app.get(
@@ -115,16 +267,21 @@ async def __newtons_method(
         "Computes the root of a function using fixed-point iteration method.\n"
         "The function must be provided in string expression format.\n"
         "Tolerance and maximum number of iterations are optional.\n"
-        "Returns the root, number of iterations, number of function calls, execution time and SVG plot."
+        "Returns the root, number of iterations, number of function calls, execution time and SVG plot.\n"
+        "Set plot to 'none' to skip plotting or to 'data' to get the plotted values instead of the SVG plot."
     ),
 )
 async def __fixed_point_iteration(
-    f_string: str, x0: float, tol: float = 1e-6, max_iter: int = 100
+    f_string: str,
+    x0: float,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+    plot: PlotMode = PlotMode.SVG,
 ) -> FixedPointIterationMethodResponse:
-    try:
-        return fixed_point_iteration(f_string, x0, tol, max_iter)
-    except TimeoutError:
-        raise HTTPException(status_code=400, detail=CALCULATION_TIMEOUT_ERROR_MESSAGE)
+    result = await process_pool.run(
+        fixed_point_iteration, f_string, x0, tol, max_iter, plot
+    )
+    return cache_result(result, render_fixed_point_iteration_plot)
 
 
 @app.get(
@@ -136,16 +293,76 @@ async def __fixed_point_iteration(
         "Computes the root of a function using secant method.\n"
         "The function must be provided in string expression format.\n"
         "Tolerance and maximum number of iterations are optional.\n"
-        "Returns the root, number of iterations, execution time and SVG plot."
+        "Returns the root, number of iterations, execution time and SVG plot.\n"
+        "Set plot to 'none' to skip plotting or to 'data' to get the plotted values instead of the SVG plot."
     ),
 )
 async def __secant_method(
-    f_string: str, x0: float, x1: float, tol: float = 1e-6, max_iter: int = 100
+    f_string: str,
+    x0: float,
+    x1: float,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+    plot: PlotMode = PlotMode.SVG,
 ) -> SecantMethodResponse:
-    try:
-        return secant_method(f_string, x0, x1, tol, max_iter)
-    except TimeoutError:
-        raise HTTPException(status_code=400, detail=CALCULATION_TIMEOUT_ERROR_MESSAGE)
+    result = await process_pool.run(
+        secant_method, f_string, x0, x1, tol, max_iter, plot
+    )
+    return cache_result(result, render_secant_method_plot)
+
+
+@app.get(
+    "/brents_method",
+    name="Brent's method",
+    tags=["Non-linear"],
+    summary="Computes the root of a function using Brent's method",
+    description=(
+        "Computes the root of a function in an interval using Brent's method, "
+        "combining bisection, secant method and inverse quadratic interpolation.\n"
+        "The function must be provided in string expression format and must have different signs at a and b, "
+        "then the method always converges.\n"
+        "Tolerance and maximum number of iterations are optional.\n"
+        "Returns the root, number of iterations and function evaluations, execution time and SVG plot.\n"
+        "Set plot to 'none' to skip plotting or to 'data' to get the plotted values instead of the SVG plot."
+    ),
+)
+async def __brents_method(
+    f_string: str,
+    a: float,
+    b: float,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+    plot: PlotMode = PlotMode.SVG,
+) -> BrentsMethodResponse:
+    result = await process_pool.run(brents_method, f_string, a, b, tol, max_iter, plot)
+    return cache_result(result, render_brents_method_plot)
+
+
+@app.post(
+    "/batch_root_finding",
+    name="Batch root finding",
+    tags=["Non-linear"],
+    summary="Computes the roots of functions from many initial guesses at once",
+    description=(
+        "Computes the roots of one or more functions from many initial guesses at once using Newton's or secant method.\n"
+        "The functions (and optionally their derivatives for Newton's method) must be provided in string expression format.\n"
+        "All initial guesses are iterated together, and no plots are created.\n"
+        "Returns the roots, number of iterations and convergence flags for every initial guess and the execution time."
+    ),
+)
+async def __batch_root_finding(
+    request: BatchRootFindingRequest,
+) -> BatchRootFindingResponse:
+    return await process_pool.run(
+        batch_root_finding,
+        request.f_strings,
+        request.x0,
+        request.method,
+        request.df_strings,
+        request.x1,
+        request.tol,
+        request.max_iter,
+    )
 
 
 @app.get(
@@ -155,17 +372,75 @@ async def __secant_method(
     summary="Computes the solution of a system of linear equations using Gaussian elimination method",
     description=(
         "Computes the solution of a system of linear equations using Gaussian elimination method.\n"
-        "The system of linear equations must be provided in a matrix format.\n"
+        "The system of linear equations must be provided in a matrix format. "
+        "The coefficient matrix may also be a sparse matrix in COO or CSR format given as a JSON object.\n"
+        "The constants may be a matrix with one right-hand side per column to solve several systems at once.\n"
+        "The factorization of the coefficient matrix is cached, so repeated solves with the same matrix are faster.\n"
         "Returns the solution of the system of linear equations and the execution time."
     ),
 )
 async def __gaussian_elimination_method(
     coefficient_matrix: str, constants: str
 ) -> GaussianEliminationMethodResponse:
-    try:
-        return gaussian_elimination_method(coefficient_matrix, constants)
-    except TimeoutError:
-        raise HTTPException(status_code=400, detail=CALCULATION_TIMEOUT_ERROR_MESSAGE)
+    return await process_pool.run(
+        gaussian_elimination_method, coefficient_matrix, constants
+    )
+
+
+@app.post(
+    "/gaussian_elimination_method",
+    name="Gaussian elimination method (request body)",
+    tags=["Linear systems"],
+    summary="Computes the solution of a large or sparse system of linear equations using Gaussian elimination method",
+    description=(
+        "Computes the solution of a system of linear equations using Gaussian elimination method.\n"
+        "The system of linear equations is provided in the request body, either as a dense matrix "
+        "or as a sparse matrix in COO or CSR format. Sparse matrices are solved with a sparse LU factorization.\n"
+        "Returns the solution of the system of linear equations and the execution time."
+    ),
+)
+async def __gaussian_elimination_method_post(
+    request: LinearSystemRequest,
+) -> GaussianEliminationMethodResponse:
+    return await process_pool.run(
+        gaussian_elimination_method, request.coefficient_matrix, request.constants
+    )
+
+
+@app.post(
+    "/gaussian_elimination_method/binary",
+    name="Gaussian elimination method (binary)",
+    tags=["Linear systems"],
+    summary="Computes the solution of a system of linear equations sent as a binary matrix using Gaussian elimination method",
+    description=(
+        "Computes the solution of a system of linear equations using Gaussian elimination method.\n"
+        "The augmented matrix [A|b] is sent as the request body, either as raw little-endian float64 values in row-major order "
+        "with the number of rows in the rows parameter, or as a .npy file.\n"
+        "The last constants_columns columns hold the constants, one right-hand side per column.\n"
+        "Send Accept: application/octet-stream or application/x-npy to get the roots in the same binary form, "
+        "with their shape in the X-Shape header and the execution time in the X-Execution-Time-Ms header.\n"
+        "Returns the solution of the system of linear equations and the execution time."
+    ),
+    openapi_extra=BINARY_REQUEST_BODY,
+)
+async def __gaussian_elimination_method_binary(
+    request: Request,
+    rows: int | None = None,
+    constants_columns: int = 1,
+    accept: str | None = Header(default=None),
+) -> GaussianEliminationMethodResponse:
+    result = await process_pool.run(
+        solve_linear_system_binary,
+        gaussian_elimination_method,
+        await request.body(),
+        rows,
+        constants_columns,
+    )
+
+    media_type = wants_binary_response(accept)
+    if media_type is not None:
+        return array_response(result["roots"], media_type, result["execution_time_ms"])
+    return result
 
 
 @app.get(
@@ -175,17 +450,85 @@ async def __gaussian_elimination_method(
     summary="Computes the solution of a system of linear equations using least squares method",
     description=(
         "Computes the solution of a system of linear equations using least squares method.\n"
-        "The system of linear equations must be provided in a matrix format.\n"
-        "Returns the solution of the system of linear equations and the execution time."
+        "The system of linear equations must be provided in a matrix format. "
+        "The coefficient matrix may also be a sparse matrix in COO or CSR format given as a JSON object.\n"
+        "The constants may be a matrix with one right-hand side per column to solve several systems at once.\n"
+        "The factorization of the coefficient matrix is cached, so repeated solves with the same matrix are faster.\n"
+        "The solver can be QR, SVD or Cholesky of the normal equations. "
+        "The automatic choice uses Cholesky for well-conditioned matrices, QR for ill-conditioned ones "
+        "and SVD for rank-deficient or underdetermined systems.\n"
+        "Returns the solution of the system of linear equations, the residual norm, the rank of the matrix and the execution time."
     ),
 )
 async def __least_squares_method(
-    coefficient_matrix: str, constants: str
+    coefficient_matrix: str,
+    constants: str,
+    solver: LeastSquaresSolver = LeastSquaresSolver.AUTO,
 ) -> LeastSquaresMethodResponse:
-    try:
-        return least_squares_method(coefficient_matrix, constants)
-    except TimeoutError:
-        raise HTTPException(status_code=400, detail=CALCULATION_TIMEOUT_ERROR_MESSAGE)
+    return await process_pool.run(
+        least_squares_method, coefficient_matrix, constants, solver
+    )
+
+
+@app.post(
+    "/least_squares_method",
+    name="Least squares method (request body)",
+    tags=["Linear systems"],
+    summary="Computes the solution of a large or sparse system of linear equations using least squares method",
+    description=(
+        "Computes the solution of a system of linear equations using least squares method.\n"
+        "The system of linear equations is provided in the request body, either as a dense matrix "
+        "or as a sparse matrix in COO or CSR format. Sparse matrices are solved with the iterative LSMR solver.\n"
+        "Returns the solution of the system of linear equations, the residual norm, the rank of the matrix and the execution time."
+    ),
+)
+async def __least_squares_method_post(
+    request: LeastSquaresMethodRequest,
+) -> LeastSquaresMethodResponse:
+    return await process_pool.run(
+        least_squares_method,
+        request.coefficient_matrix,
+        request.constants,
+        request.solver,
+    )
+
+
+@app.post(
+    "/least_squares_method/binary",
+    name="Least squares method (binary)",
+    tags=["Linear systems"],
+    summary="Computes the solution of a system of linear equations sent as a binary matrix using least squares method",
+    description=(
+        "Computes the solution of a system of linear equations using least squares method.\n"
+        "The augmented matrix [A|b] is sent as the request body, either as raw little-endian float64 values in row-major order "
+        "with the number of rows in the rows parameter, or as a .npy file.\n"
+        "The last constants_columns columns hold the constants, one right-hand side per column.\n"
+        "Send Accept: application/octet-stream or application/x-npy to get the roots in the same binary form, "
+        "with their shape in the X-Shape header and the execution time in the X-Execution-Time-Ms header.\n"
+        "Returns the solution of the system of linear equations, the residual norm, the rank of the matrix and the execution time."
+    ),
+    openapi_extra=BINARY_REQUEST_BODY,
+)
+async def __least_squares_method_binary(
+    request: Request,
+    rows: int | None = None,
+    constants_columns: int = 1,
+    solver: LeastSquaresSolver = LeastSquaresSolver.AUTO,
+    accept: str | None = Header(default=None),
+) -> LeastSquaresMethodResponse:
+    result = await process_pool.run(
+        solve_linear_system_binary,
+        least_squares_method,
+        await request.body(),
+        rows,
+        constants_columns,
+        solver,
+    )
+
+    media_type = wants_binary_response(accept)
+    if media_type is not None:
+        return array_response(result["roots"], media_type, result["execution_time_ms"])
+    return result
 
 
 @app.get(
@@ -196,18 +539,104 @@ async def __least_squares_method(
     description=(
         "Computes the solution of a system of linear equations using fixed-point iteration method.\n"
         "The system of linear equations must be provided in a matrix format.\n"
-        "Returns the solution of the system of linear equations and the execution time."
+        "The iteration can be Jacobi, Gauss-Seidel or SOR with the relaxation factor omega, "
+        "or a Krylov subspace method (CG, GMRES, BiCGSTAB) with an optional Jacobi or ILU preconditioner.\n"
+        "Splitting methods stop when the update is smaller than the tolerance, Krylov methods when the relative residual is.\n"
+        "Systems for which a splitting iteration cannot converge are rejected before iterating.\n"
+        "Returns the solution of the system of linear equations, the convergence history and the execution time."
     ),
 )
 async def __fixed_point_iteration_system_method(
-    coefficient_matrix: str, constants: str, tol: float = 1e-6, max_iter: int = 100
+    coefficient_matrix: str,
+    constants: str,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+    method: FixedPointIterationSystemMethod = FixedPointIterationSystemMethod.JACOBI,
+    omega: float = 1.0,
+    preconditioner: Preconditioner = Preconditioner.NONE,
 ) -> FixedPointIterationSystemMethodResponse:
-    try:
-        return fixed_point_iteration_system_method(
-            coefficient_matrix, constants, tol, max_iter
-        )
-    except TimeoutError:
-        raise HTTPException(status_code=400, detail=CALCULATION_TIMEOUT_ERROR_MESSAGE)
+    return await process_pool.run(
+        fixed_point_iteration_system_method,
+        coefficient_matrix,
+        constants,
+        tol,
+        max_iter,
+        method,
+        omega,
+        preconditioner,
+    )
+
+
+@app.post(
+    "/fixed_point_iteration_system_method",
+    name="Fixed-point iteration (request body)",
+    tags=["Linear systems"],
+    summary="Computes the solution of a large or sparse system of linear equations using an iterative method",
+    description=(
+        "Computes the solution of a system of linear equations using fixed-point iteration method.\n"
+        "The system of linear equations and the options are provided in the request body, "
+        "the matrix either as a dense matrix or as a sparse matrix in COO or CSR format.\n"
+        "Sparse matrices are never converted to dense ones, so each iteration costs time proportional to the nonzeros.\n"
+        "Returns the solution of the system of linear equations, the convergence history and the execution time."
+    ),
+)
+async def __fixed_point_iteration_system_method_post(
+    request: FixedPointIterationSystemMethodRequest,
+) -> FixedPointIterationSystemMethodResponse:
+    return await process_pool.run(
+        fixed_point_iteration_system_method,
+        request.coefficient_matrix,
+        request.constants,
+        request.tol,
+        request.max_iter,
+        request.method,
+        request.omega,
+        request.preconditioner,
+    )
+
+
+@app.post(
+    "/fixed_point_iteration_system_method/binary",
+    name="Fixed-point iteration (binary)",
+    tags=["Linear systems"],
+    summary="Computes the solution of a system of linear equations sent as a binary matrix using an iterative method",
+    description=(
+        "Computes the solution of a system of linear equations using fixed-point iteration method.\n"
+        "The augmented matrix [A|b] is sent as the request body, either as raw little-endian float64 values in row-major order "
+        "with the number of rows in the rows parameter, or as a .npy file. The last column holds the constants.\n"
+        "Send Accept: application/octet-stream or application/x-npy to get the roots in the same binary form, "
+        "with their shape in the X-Shape header and the execution time in the X-Execution-Time-Ms header.\n"
+        "Returns the solution of the system of linear equations, the convergence history and the execution time."
+    ),
+    openapi_extra=BINARY_REQUEST_BODY,
+)
+async def __fixed_point_iteration_system_method_binary(
+    request: Request,
+    rows: int | None = None,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+    method: FixedPointIterationSystemMethod = FixedPointIterationSystemMethod.JACOBI,
+    omega: float = 1.0,
+    preconditioner: Preconditioner = Preconditioner.NONE,
+    accept: str | None = Header(default=None),
+) -> FixedPointIterationSystemMethodResponse:
+    result = await process_pool.run(
+        solve_linear_system_binary,
+        fixed_point_iteration_system_method,
+        await request.body(),
+        rows,
+        1,
+        tol,
+        max_iter,
+        method,
+        omega,
+        preconditioner,
+    )
+
+    media_type = wants_binary_response(accept)
+    if media_type is not None:
+        return array_response(result["roots"], media_type, result["execution_time_ms"])
+    return result
 
 
 @app.get(
@@ -218,16 +647,52 @@ async def __fixed_point_iteration_system_method(
     description=(
         "Interpolate a polynomial using Newton's interpolation method.\n"
         "The data points must be provided in a vector format.\n"
-        "Returns the execution time and SVG plot."
+        "Returns the execution time and SVG plot.\n"
+        "Set plot to 'none' to skip plotting or to 'data' to get the plotted values instead of the SVG plot."
     ),
 )
 async def __newtons_interpolation_method(
-    x: str, y: str, number_of_points: int = 100, x_value: float = 0.0
+    x: str,
+    y: str,
+    number_of_points: int = 100,
+    x_value: float = 0.0,
+    plot: PlotMode = PlotMode.SVG,
+) -> NewtonsInterpolationMethodResponse:
+    result = await process_pool.run(
+        newtons_interpolation_method, x, y, number_of_points, x_value, plot
+    )
+    return cache_result(result, render_newtons_interpolation_method_plot)
+
+
+@app.post(
+    "/newtons_interpolation_method/binary",
+    name="Newton's interpolation method (binary)",
+    tags=["Interpolation"],
+    summary="Interpolate a polynomial through binary data points using Newton's interpolation method",
+    description=(
+        "Interpolate a polynomial using Newton's interpolation method.\n"
+        "The data points are sent as the request body, a matrix with the x values in the first row and the y values in the second row, "
+        "either as raw little-endian float64 values in row-major order or as a .npy file.\n"
+        "Returns the execution time and SVG plot.\n"
+        "Set plot to 'none' to skip plotting or to 'data' to get the plotted values instead of the SVG plot."
+    ),
+    openapi_extra=BINARY_REQUEST_BODY,
+)
+async def __newtons_interpolation_method_binary(
+    request: Request,
+    number_of_points: int = 100,
+    x_value: float = 0.0,
+    plot: PlotMode = PlotMode.SVG,
 ) -> NewtonsInterpolationMethodResponse:
-    try:
-        return newtons_interpolation_method(x, y, number_of_points, x_value)
-    except TimeoutError:
-        raise HTTPException(status_code=400, detail=CALCULATION_TIMEOUT_ERROR_MESSAGE)
+    result = await process_pool.run(
+        interpolate_binary,
+        newtons_interpolation_method,
+        await request.body(),
+        number_of_points,
+        x_value,
+        plot,
+    )
+    return cache_result(result, render_newtons_interpolation_method_plot)
 
 
 @app.get(
@@ -238,16 +703,155 @@ async def __newtons_interpolation_method(
     description=(
         "Interpolate a polynomial using Lagrange's interpolation method.\n"
         "The data points must be provided in a vector format.\n"
-        "Returns the execution time and SVG plot."
+        "Returns the execution time and SVG plot.\n"
+        "Set plot to 'none' to skip plotting or to 'data' to get the plotted values instead of the SVG plot."
     ),
 )
 async def __lagranges_interpolation_method(
-    x: str, y: str, number_of_points: int = 100, x_value: float = 0.0
+    x: str,
+    y: str,
+    number_of_points: int = 100,
+    x_value: float = 0.0,
+    plot: PlotMode = PlotMode.SVG,
+) -> LagrangesInterpolationMethodResponse:
+    result = await process_pool.run(
+        lagranges_interpolation_method, x, y, number_of_points, x_value, plot
+    )
+    return cache_result(result, render_lagranges_interpolation_method_plot)
+
+
+@app.post(
+    "/lagranges_interpolation_method/binary",
+    name="Lagrange's interpolation method (binary)",
+    tags=["Interpolation"],
+    summary="Interpolate a polynomial through binary data points using Lagrange's interpolation method",
+    description=(
+        "Interpolate a polynomial using Lagrange's interpolation method.\n"
+        "The data points are sent as the request body, a matrix with the x values in the first row and the y values in the second row, "
+        "either as raw little-endian float64 values in row-major order or as a .npy file.\n"
+        "Returns the execution time and SVG plot.\n"
+        "Set plot to 'none' to skip plotting or to 'data' to get the plotted values instead of the SVG plot."
+    ),
+    openapi_extra=BINARY_REQUEST_BODY,
+)
+async def __lagranges_interpolation_method_binary(
+    request: Request,
+    number_of_points: int = 100,
+    x_value: float = 0.0,
+    plot: PlotMode = PlotMode.SVG,
 ) -> LagrangesInterpolationMethodResponse:
-    try:
-        return lagranges_interpolation_method(x, y, number_of_points, x_value)
-    except TimeoutError:
-        raise HTTPException(status_code=400, detail=CALCULATION_TIMEOUT_ERROR_MESSAGE)
+    result = await process_pool.run(
+        interpolate_binary,
+        lagranges_interpolation_method,
+        await request.body(),
+        number_of_points,
+        x_value,
+        plot,
+    )
+    return cache_result(result, render_lagranges_interpolation_method_plot)
+
+
+@app.get(
+    "/chebyshev_nodes",
+    name="Chebyshev nodes",
+    tags=["Interpolation"],
+    summary="Generate Chebyshev nodes on an interval",
+    description=(
+        "Generate Chebyshev nodes of the first kind (roots) or of the second kind (extrema including the end points) on an interval.\n"
+        "Interpolating data sampled at these nodes avoids the oscillations of high-degree polynomials at equidistant nodes.\n"
+        "Returns the nodes in increasing order and the execution time."
+    ),
+)
+async def __chebyshev_nodes(
+    a: float,
+    b: float,
+    number_of_nodes: int,
+    kind: ChebyshevNodesKind = ChebyshevNodesKind.SECOND,
+) -> ChebyshevNodesResponse:
+    return await process_pool.run(chebyshev_nodes, a, b, number_of_nodes, kind)
+
+
+@app.post(
+    "/interpolants",
+    name="Build interpolant",
+    tags=["Interpolation"],
+    summary="Build an interpolation polynomial and store it for later evaluation",
+    description=(
+        "Build an interpolation polynomial using Newton's or Lagrange's interpolation method and store it on the server.\n"
+        "The returned interpolant ID can be used to evaluate the polynomial at any points or to add data points to it "
+        "without sending the data again. Interpolants expire an hour after they were last built or extended, "
+        "and the least recently used ones are removed when the store is full.\n"
+        "Returns the interpolant ID, the number of nodes, their range and the execution time."
+    ),
+)
+async def __build_interpolant(request: InterpolantRequest) -> InterpolantResponse:
+    result = await process_pool.run(
+        build_interpolant, request.x, request.y, request.method
+    )
+    result["interpolant_id"] = store_interpolant(
+        result.pop("interpolant"), request.method
+    )
+    return result
+
+
+@app.post(
+    "/interpolants/{interpolant_id}/points",
+    name="Add interpolant points",
+    tags=["Interpolation"],
+    summary="Add data points to a stored interpolation polynomial",
+    description=(
+        "Add data points to a stored interpolation polynomial.\n"
+        "Each point updates the polynomial in time proportional to the number of nodes instead of rebuilding it, "
+        "so streamed data can be interpolated live.\n"
+        "The number of added points times the number of nodes is limited per request.\n"
+        "Returns the interpolant ID, the number of nodes, their range and the execution time."
+    ),
+)
+async def __add_interpolant_points(
+    interpolant_id: str, request: InterpolantPointsRequest
+) -> InterpolantResponse:
+    # Concurrent updates of the same interpolant are applied one after another, so no points are lost
+    async with interpolant_lock(interpolant_id):
+        stored = get_interpolant(interpolant_id)
+        if stored is None:
+            raise HTTPException(
+                status_code=404, detail=INTERPOLANT_NOT_FOUND_ERROR_MESSAGE
+            )
+
+        # Adding points is O(n) per point and the work per request is limited, so it runs in a thread instead of
+        # sending the interpolant to a worker and back
+        interpolant, method = stored
+        result = await asyncio.to_thread(
+            add_interpolant_points, interpolant, method, request.x, request.y
+        )
+        result["interpolant_id"] = store_interpolant(
+            result.pop("interpolant"), method, interpolant_id
+        )
+        return result
+
+
+@app.post(
+    "/interpolants/{interpolant_id}/evaluate",
+    name="Evaluate interpolant",
+    tags=["Interpolation"],
+    summary="Evaluate a stored interpolation polynomial at many points",
+    description=(
+        "Evaluate a stored interpolation polynomial at many points at once.\n"
+        "The number of points and the number of points times the number of nodes are limited per request.\n"
+        "Returns the values of the polynomial and the execution time."
+    ),
+)
+async def __evaluate_interpolant(
+    interpolant_id: str, request: InterpolantEvaluationRequest
+) -> InterpolantEvaluationResponse:
+    stored = get_interpolant(interpolant_id)
+    if stored is None:
+        raise HTTPException(status_code=404, detail=INTERPOLANT_NOT_FOUND_ERROR_MESSAGE)
+
+    # The work per request is limited and checks the deadline, so the stored interpolant is evaluated in a thread
+    # instead of being sent to a worker
+    interpolant, _ = stored
+    return await asyncio.to_thread(evaluate_interpolant, interpolant, request.x)
 
 
 @app.get(
@@ -268,10 +872,9 @@ async def __rectangles_rule(
     rule_type: RectangleRuleType = RectangleRuleType.MIDDLE,
     number_of_interval_partitions: int = 100,
 ) -> RectanglesRuleResponse:
-    try:
-        return rectangles_rule(f_string, a, b, rule_type, number_of_interval_partitions)
-    except TimeoutError:
-        raise HTTPException(status_code=400, detail=CALCULATION_TIMEOUT_ERROR_MESSAGE)
+    return await process_pool.run(
+        rectangles_rule, f_string, a, b, rule_type, number_of_interval_partitions
+    )
 
 
 @app.get(
@@ -282,16 +885,31 @@ async def __rectangles_rule(
     description=(
         "Find the area under the curve of a function using trapezoidal rule.\n"
         "The function must be provided in string expression format.\n"
-        "Returns the result and execution time."
+        "In Romberg mode the step is halved until the extrapolated estimates differ by less than the tolerance, "
+        "evaluating the function only at the new midpoints.\n"
+        "Returns the result and execution time, and in Romberg mode also the error estimate, "
+        "number of function evaluations, whether the tolerance was met and the Romberg tableau."
     ),
 )
 async def __trapezoidal_rule(
-    f_string: str, a: float, b: float, number_of_interval_partitions: int = 100
+    f_string: str,
+    a: float,
+    b: float,
+    number_of_interval_partitions: int = 100,
+    mode: TrapezoidalRuleMode = TrapezoidalRuleMode.FIXED,
+    tol: float = 1e-8,
+    max_romberg_levels: int = 16,
 ) -> TrapezoidalRuleResponse:
-    try:
-        return trapezoidal_rule(f_string, a, b, number_of_interval_partitions)
-    except TimeoutError:
-        raise HTTPException(status_code=400, detail=CALCULATION_TIMEOUT_ERROR_MESSAGE)
+    return await process_pool.run(
+        trapezoidal_rule,
+        f_string,
+        a,
+        b,
+        number_of_interval_partitions,
+        mode,
+        tol,
+        max_romberg_levels,
+    )
 
 
 @app.get(
@@ -308,10 +926,113 @@ async def __trapezoidal_rule(
 async def __simpsons_rule(
     f_string: str, a: float, b: float, number_of_interval_partitions: int = 100
 ) -> SimpsonsRuleResponse:
-    try:
-        return simpsons_rule(f_string, a, b, number_of_interval_partitions)
-    except TimeoutError:
-        raise HTTPException(status_code=400, detail=CALCULATION_TIMEOUT_ERROR_MESSAGE)
+    return await process_pool.run(
+        simpsons_rule, f_string, a, b, number_of_interval_partitions
+    )
+
+
+@app.get(
+    "/adaptive_quadrature",
+    name="Adaptive quadrature",
+    tags=["Integration"],
+    summary="Find the area under the curve of a function using adaptive quadrature",
+    description=(
+        "Find the area under the curve of a function using adaptive Simpson's rule or adaptive Gauss-Kronrod rule.\n"
+        "The function must be provided in string expression format.\n"
+        "Only the subintervals whose error estimate is above their share of the tolerance are subdivided, "
+        "until the tolerance or the maximum number of function evaluations is reached.\n"
+        "Returns the result, error estimate, number of function evaluations and subintervals, "
+        "whether the tolerance was met and execution time."
+    ),
+)
+async def __adaptive_quadrature(
+    f_string: str,
+    a: float,
+    b: float,
+    tol: float = 1e-8,
+    method: AdaptiveQuadratureMethod = AdaptiveQuadratureMethod.GAUSS_KRONROD,
+    max_function_evaluations: int = 100000,
+) -> AdaptiveQuadratureResponse:
+    return await process_pool.run(
+        adaptive_quadrature, f_string, a, b, tol, method, max_function_evaluations
+    )
+
+
+@app.get(
+    "/gaussian_quadrature",
+    name="Gaussian quadrature",
+    tags=["Integration"],
+    summary="Find the area under the curve of a function using Gaussian quadrature",
+    description=(
+        "Find the area under the curve of a function using Gauss-Legendre, Gauss-Laguerre or Gauss-Hermite rule.\n"
+        "The function must be provided in string expression format.\n"
+        "The bounds may be infinite, for example a=0 and b=inf, by default the rule matching the interval is used.\n"
+        "The nodes and weights of each rule and order are computed once and reused.\n"
+        "The error is estimated by the difference to the rule of half the order, "
+        "a large estimate means the order is too low or the function does not suit the rule.\n"
+        "Returns the result, error estimate, the used rule, order and execution time."
+    ),
+)
+async def __gaussian_quadrature(
+    f_string: str,
+    a: float,
+    b: float,
+    rule: GaussianQuadratureRule = GaussianQuadratureRule.AUTO,
+    order: int = 20,
+) -> GaussianQuadratureResponse:
+    return await process_pool.run(gaussian_quadrature, f_string, a, b, rule, order)
+
+
+@app.post(
+    "/batch_integration",
+    name="Batch integration",
+    tags=["Integration"],
+    summary="Find the areas under the curves of functions over many intervals at once",
+    description=(
+        "Find the areas under the curves of one or more functions over many intervals at once "
+        "using rectangles, trapezoidal, Simpson's or Gauss-Legendre rule.\n"
+        "The functions must be provided in string expression format.\n"
+        "Every function is parsed once and evaluated on the grids of all intervals with one vectorized call.\n"
+        "Returns the results for every function and interval and the execution time."
+    ),
+)
+async def __batch_integration(
+    request: BatchIntegrationRequest,
+) -> BatchIntegrationResponse:
+    return await process_pool.run(
+        batch_integration,
+        request.f_strings,
+        request.a,
+        request.b,
+        request.rule,
+        request.number_of_interval_partitions,
+    )
+
+
+@app.post(
+    "/multidimensional_integration",
+    name="Multidimensional integration",
+    tags=["Integration"],
+    summary="Find the integral of a function of two or three variables over a rectangular domain",
+    description=(
+        "Find the integral of a function f(x, y) or f(x, y, z) over a rectangular domain using tensor product "
+        "Simpson's rule, Monte Carlo method or quasi-Monte Carlo method with Sobol or Halton sequences.\n"
+        "The function must be provided in string expression format.\n"
+        "Returns the result, error estimate, number of function evaluations and execution time."
+    ),
+)
+async def __multidimensional_integration(
+    request: MultidimensionalIntegrationRequest,
+) -> MultidimensionalIntegrationResponse:
+    return await process_pool.run(
+        multidimensional_integration,
+        request.f_string,
+        request.bounds,
+        request.method,
+        request.number_of_interval_partitions,
+        request.samples,
+        request.seed,
+    )
 
 
 def custom_openapi():
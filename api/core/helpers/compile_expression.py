@@ -0,0 +1,194 @@
+import sys
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+
+from api.constants import (
+    EXPRESSION_CACHE_MAX_MEMORY_BYTES,
+    EXPRESSION_CACHE_MAX_SIZE,
+    NUMEXPR_MIN_ARRAY_SIZE,
+)
+from core.helpers.lru_cache import LRUCache, LRUCacheStats
+
+
+@dataclass(frozen=True)
+class CompiledExpression:
+    expression: str
+    f: "sympy.Basic"
+    f_np: Callable
+    variables: tuple[str, ...] = ("x",)
+
+
+def normalize_expression(expression: str) -> str:
+    """
+    Normalize a string expression so that equivalent spellings share a cache entry.
+
+    :param expression:  String expression of the function f(x).
+
+    :return: The expression with surrounding whitespace removed and inner whitespace collapsed.
+    """
+    return " ".join(expression.split())
+
+
+def _sizeof_compiled_expression(compiled: CompiledExpression) -> int:
+    import sympy as sp
+
+    # Estimate memory as the expression tree nodes plus the generated NumPy source code
+    tree_size = sum(sys.getsizeof(node) for node in sp.preorder_traversal(compiled.f))
+    source_size = sys.getsizeof(compiled.f_np.__doc__ or "")
+    return sys.getsizeof(compiled.expression) + tree_size + source_size
+
+
+_cache = LRUCache(
+    max_size=EXPRESSION_CACHE_MAX_SIZE,
+    max_memory_bytes=EXPRESSION_CACHE_MAX_MEMORY_BYTES,
+    sizeof=_sizeof_compiled_expression,
+)
+
+
+def _lambdify_numexpr(symbols, f, f_numpy: Callable) -> Callable | None:
+    # numexpr is optional, it evaluates large arrays in one pass over memory without temporary arrays
+    try:
+        import numexpr  # noqa: F401
+    except ImportError:
+        return None
+
+    import sympy as sp
+
+    try:
+        f_numexpr = sp.lambdify(symbols, f, "numexpr")
+
+        # Expressions using functions unknown to numexpr fail only when they are evaluated
+        probe = [np.linspace(-0.75, 0.75, 4)] * len(symbols)
+        with np.errstate(all="ignore"):
+            if not np.allclose(f_numexpr(*probe), f_numpy(*probe), equal_nan=True):
+                return None
+    except Exception:
+        return None
+
+    return f_numexpr
+
+
+def lambdify_expression(symbols: tuple, f: "sympy.Basic") -> Callable:
+    """
+    Convert a symbolic expression to a NumPy function computing common subexpressions once.
+
+    If numexpr is installed and supports the expression, arrays of at least NUMEXPR_MIN_ARRAY_SIZE values are
+    evaluated with numexpr instead, which fuses the whole expression into a single loop.
+
+    :param symbols: Symbols of the variables, in the order of the arguments of the function.
+    :param f:       The symbolic expression.
+
+    :return: The NumPy function.
+    """
+    # Import SymPy on first use, it is slow to import
+    import sympy as sp
+
+    f_numpy = sp.lambdify(symbols, f, "numpy", cse=True)
+    f_numexpr = _lambdify_numexpr(symbols, f, f_numpy)
+    if f_numexpr is None:
+        return f_numpy
+
+    def f_np(*x):
+        if np.broadcast(*x).size >= NUMEXPR_MIN_ARRAY_SIZE:
+            return f_numexpr(*x)
+        return f_numpy(*x)
+
+    # The generated source code is kept for the memory estimate of the cache
+    f_np.__doc__ = f_numpy.__doc__
+    return f_np
+
+
+def compile_expression(
+    expression: str, variables: tuple[str, ...] = ("x",)
+) -> CompiledExpression:
+    """
+    Parse a string expression of f(x) and convert it to a NumPy function, reusing previously compiled expressions.
+
+    :param expression:  String expression of the function f(x).
+    :param variables:   Names of the variables, in the order of the arguments of the NumPy function, for example
+                        ("x", "y") for f(x, y).
+
+    :return: The compiled expression containing the symbolic tree and the NumPy function.
+    """
+    expression = normalize_expression(expression)
+
+    def compile_uncached():
+        # Import SymPy on first use, it is slow to import
+        import sympy as sp
+
+        symbols = sp.symbols(variables)
+
+        # Parse string expression to symbolic methods
+        f = sp.sympify(expression)
+
+        # Convert to numpy methods for numerical calculations
+        f_np = lambdify_expression(symbols, f)
+
+        return CompiledExpression(
+            expression=expression, f=f, f_np=f_np, variables=variables
+        )
+
+    # Single variable expressions keep the expression as the key, it is the most common case
+    key = expression if variables == ("x",) else (variables, expression)
+    return _cache.get_or_create(key, compile_uncached)
+
+
+def compile_derivatives(expression: str, order: int) -> CompiledExpression:
+    """
+    Parse a string expression of f(x), differentiate it symbolically and convert the function and its derivatives
+    to a single NumPy function, reusing previously compiled expressions.
+
+    Common subexpressions of the function and its derivatives are computed once per call.
+
+    :param expression:  String expression of the function f(x).
+    :param order:       Highest order of the derivatives.
+
+    :return: The compiled expression, its symbolic tree is a tuple of the function and its derivatives and its
+             NumPy function returns a list of their values.
+    """
+    expression = normalize_expression(expression)
+
+    def compile_uncached():
+        # Import SymPy on first use, it is slow to import
+        import sympy as sp
+
+        x = sp.symbols("x")
+
+        # Differentiate the parsed expression, sharing the parsed tree with compile_expression
+        derivatives = [compile_expression(expression).f]
+        for _ in range(order):
+            derivatives.append(sp.diff(derivatives[-1], x))
+
+        # Convert to a single numpy function, evaluating common subexpressions once
+        f_np = sp.lambdify(x, derivatives, "numpy", cse=True)
+
+        return CompiledExpression(
+            expression=expression, f=sp.Tuple(*derivatives), f_np=f_np
+        )
+
+    return _cache.get_or_create(("derivatives", order, expression), compile_uncached)
+
+
+def evaluate(f_np: Callable, *x: np.ndarray) -> np.ndarray:
+    """
+    Evaluate a compiled NumPy function on arrays of points.
+
+    :param f_np:    NumPy function of a compiled expression.
+    :param x:       Arrays of the coordinates of the points, one per variable, broadcast against each other.
+
+    :return: Array of function values with the broadcast shape of the points, also for constant expressions,
+             which are lambdified to functions returning a scalar.
+    """
+    shape = np.broadcast_shapes(*(np.shape(coordinates) for coordinates in x))
+    return np.broadcast_to(np.asarray(f_np(*x), dtype=float), shape)
+
+
+def get_expression_cache_stats() -> LRUCacheStats:
+    """
+    Get hit, miss and eviction counters of the compiled expression cache of the current process.
+
+    :return: The cache statistics.
+    """
+    return _cache.stats()
@@ -0,0 +1,47 @@
+import time
+from contextvars import ContextVar
+from functools import wraps
+
+_deadline: ContextVar[float | None] = ContextVar("deadline", default=None)
+
+
+def with_deadline(seconds: float):
+    """
+    Set a deadline for the calculation running inside the decorated function.
+
+    The deadline is stored in a context variable, so unlike signal-based timeouts it works in any thread.
+    Long-running loops must call check_deadline() to stop when the deadline has passed.
+
+    :param seconds: Maximum calculation time in seconds.
+
+    :return: The decorator.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            deadline = time.monotonic() + seconds
+
+            # Never extend a deadline set by an outer calculation
+            outer_deadline = _deadline.get()
+            if outer_deadline is not None:
+                deadline = min(deadline, outer_deadline)
+
+            token = _deadline.set(deadline)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _deadline.reset(token)
+
+        return wrapper
+
+    return decorator
+
+
+def check_deadline():
+    """
+    Raise TimeoutError if the deadline of the current calculation has passed.
+    """
+    deadline = _deadline.get()
+    if deadline is not None and time.monotonic() > deadline:
+        raise TimeoutError()
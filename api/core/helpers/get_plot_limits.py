@@ -1,7 +1,7 @@
 import math
 
 
-def set_plot_limits_by_points(plt, points, margin=2):
+def set_plot_limits_by_points(ax, points, margin=2):
     if not points:
         return None  # Handle the case of an empty list
 
@@ -27,5 +27,5 @@ def set_plot_limits_by_points(plt, points, margin=2):
     y_min = center_y - min_distance * margin
     y_max = center_y + min_distance * margin
 
-    plt.xlim(x_min, x_max)
-    plt.ylim(y_min, y_max)
+    ax.set_xlim(x_min, x_max)
+    ax.set_ylim(y_min, y_max)
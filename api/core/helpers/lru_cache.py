@@ -0,0 +1,164 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+
+
+@dataclass
+class LRUCacheStats:
+    size: int
+    memory_bytes: int
+    max_size: int
+    max_memory_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+
+    def to_dict(self):
+        return asdict(self)
+
+    @classmethod
+    def total(cls, stats: list["LRUCacheStats"]) -> "LRUCacheStats":
+        """
+        Add up the statistics of the caches of several processes.
+
+        :param stats:   Statistics of every cache.
+
+        :return: The sums of the counters, sizes and limits.
+        """
+        return cls(
+            **{
+                name: sum(getattr(cache_stats, name) for cache_stats in stats)
+                for name in cls.__dataclass_fields__
+            }
+        )
+
+
+class LRUCache:
+    """
+    Thread-safe least-recently-used cache bounded by number of entries and by estimated memory usage.
+    Entries can optionally expire a fixed time after they were stored.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        max_memory_bytes: int,
+        sizeof=sys.getsizeof,
+        ttl_seconds: float | None = None,
+    ):
+        """
+        :param max_size:            Maximum number of entries kept in the cache.
+        :param max_memory_bytes:    Maximum estimated memory used by the cached values.
+        :param sizeof:              Function estimating the memory used by a cached value in bytes.
+        :param ttl_seconds:         Time after which an entry expires, or None if entries do not expire.
+        """
+        self.max_size = max_size
+        self.max_memory_bytes = max_memory_bytes
+        self.ttl_seconds = ttl_seconds
+        self._sizeof = sizeof
+        self._entries = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key):
+        """
+        Get a value from the cache and mark it as recently used.
+
+        :param key: Key of the entry.
+
+        :return: The cached value or None if the key is not cached.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if (
+                entry is not None
+                and entry[2] is not None
+                and entry[2] <= time.monotonic()
+            ):
+                self._memory_bytes -= self._entries.pop(key)[1]
+                self._expirations += 1
+                entry = None
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key, value):
+        """
+        Store a value in the cache, evicting the least recently used entries if the limits are exceeded.
+
+        Values larger than the memory limit are not cached at all.
+
+        :param key:     Key of the entry.
+        :param value:   Value to store.
+        """
+        size = self._sizeof(value)
+        if size > self.max_memory_bytes:
+            return
+
+        expires_at = (
+            time.monotonic() + self.ttl_seconds
+            if self.ttl_seconds is not None
+            else None
+        )
+
+        with self._lock:
+            if key in self._entries:
+                self._memory_bytes -= self._entries.pop(key)[1]
+
+            self._entries[key] = (value, size, expires_at)
+            self._memory_bytes += size
+
+            while (
+                len(self._entries) > self.max_size
+                or self._memory_bytes > self.max_memory_bytes
+            ):
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._memory_bytes -= evicted_size
+                self._evictions += 1
+
+    def get_or_create(self, key, factory):
+        """
+        Get a value from the cache or create and store it if the key is not cached.
+
+        The factory is called outside the lock, so concurrent misses for the same key may both compute the value.
+
+        :param key:     Key of the entry.
+        :param factory: Function without arguments creating the value.
+
+        :return: The cached or newly created value.
+        """
+        value = self.get(key)
+        if value is None:
+            value = factory()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._memory_bytes = 0
+
+    def stats(self) -> LRUCacheStats:
+        with self._lock:
+            return LRUCacheStats(
+                size=len(self._entries),
+                memory_bytes=self._memory_bytes,
+                max_size=self.max_size,
+                max_memory_bytes=self.max_memory_bytes,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+            )
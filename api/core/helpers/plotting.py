@@ -0,0 +1,95 @@
+from contextlib import contextmanager
+from enum import Enum
+from io import BytesIO
+
+import numpy as np
+from pydantic import BaseModel
+
+
+class PlotMode(Enum):
+    NONE = "none"
+    SVG = "svg"
+    DATA = "data"
+
+
+class PlotResponse(BaseModel):
+    plot_svg: str
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "plot_svg": "<svg>...</svg>",
+                }
+            ]
+        }
+    }
+
+
+def to_json_list(values) -> list[float | None]:
+    """
+    Convert an array of values to a list that can be serialized to JSON.
+
+    :param values:  Array of values.
+
+    :return: A list of floats where NaN and infinite values are replaced with None.
+    """
+    values = np.asarray(values, dtype=float)
+    return [float(value) if np.isfinite(value) else None for value in values]
+
+
+def plot_data_to_json(plot_data: dict) -> dict[str, list[float | None]]:
+    """
+    Convert the arrays of plot data to lists that can be serialized to JSON.
+
+    :param plot_data:   Dictionary of arrays.
+
+    :return: Dictionary of lists of floats where NaN and infinite values are replaced with None.
+    """
+    return {name: to_json_list(values) for name, values in plot_data.items()}
+
+
+@contextmanager
+def create_figure(figsize=(12, 12)):
+    """
+    Create a figure with a single plot that is not registered in the global pyplot state.
+
+    Each call creates its own figure, so plots can be created concurrently from several threads.
+    The figure is cleared when the context exits, even if an exception is raised.
+
+    :param figsize: Size of the figure in inches.
+
+    :return: A context manager yielding the figure and its axes.
+    """
+    # Import Matplotlib only when a plot is requested, it is slow to import
+    from matplotlib.figure import Figure
+
+    figure = Figure(figsize=figsize)
+    try:
+        yield figure, figure.add_subplot()
+    finally:
+        figure.clear()
+
+
+def figure_to_svg(figure) -> str:
+    """
+    Save a figure to an SVG string with a transparent background.
+
+    :param figure:  The figure to save.
+
+    :return: The SVG plot.
+    """
+    from matplotlib.backends.backend_svg import FigureCanvasSVG
+
+    # Attach the SVG canvas to the figure instead of relying on the global pyplot backend
+    FigureCanvasSVG(figure)
+
+    svg_buffer = BytesIO()
+    figure.savefig(
+        svg_buffer,
+        format="svg",
+        transparent=True,
+        bbox_inches="tight",
+        pad_inches=0,
+    )
+    return svg_buffer.getvalue().decode("utf-8")
@@ -1,14 +1,11 @@
-import sympy as sp
 from fastapi import HTTPException
-from timeout_decorator import timeout
 
 from api.constants import CALCULATION_TIMEOUT, CALCULATION_TIMEOUT_ERROR_MESSAGE
+from core.helpers.compile_expression import compile_expression
+from core.helpers.deadline import with_deadline
 
 
-@timeout(
-    CALCULATION_TIMEOUT,
-    timeout_exception=TimeoutError,
-)
+@with_deadline(CALCULATION_TIMEOUT)
 def validate_expression(expression: str) -> bool:
     """
     Validates a mathematical expression.
@@ -20,12 +17,8 @@ def validate_expression(expression: str) -> bool:
         bool: A boolean indicating whether the expression is valid or not.
     """
     try:
-        x = sp.symbols("x")
-
-        # Parse string expressions to symbolic methods
-        f = sp.sympify(expression)
-
-        sp.lambdify(x, f, "numpy")
+        # Parse and compile the expression, caching it for the calculation that usually follows
+        compile_expression(expression)
     except TimeoutError:
         # Handle timeout error and raise an HTTPException with a specific status code and detail message
         raise HTTPException(status_code=408, detail=CALCULATION_TIMEOUT_ERROR_MESSAGE)
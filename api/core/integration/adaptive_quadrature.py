@@ -0,0 +1,331 @@
+import math
+import time
+from enum import Enum
+
+import numpy as np
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+from api.constants import CALCULATION_TIMEOUT, CALCULATION_TIMEOUT_ERROR_MESSAGE
+from core.helpers.compile_expression import compile_expression, evaluate
+from core.helpers.deadline import check_deadline, with_deadline
+
+
+class AdaptiveQuadratureMethod(Enum):
+    SIMPSON = "simpson"
+    GAUSS_KRONROD = "gauss_kronrod"
+
+
+class AdaptiveQuadratureResponse(BaseModel):
+    result: float
+    error_estimate: float
+    function_evaluations: int
+    intervals: int
+    converged: bool
+    execution_time_ms: float
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "result": 0.7390851332151607,
+                    "error_estimate": 1.2e-12,
+                    "function_evaluations": 45,
+                    "intervals": 3,
+                    "converged": True,
+                    "execution_time_ms": 0.05000114440917969,
+                }
+            ]
+        }
+    }
+
+
+# Nodes on [0, 1] and weights of the 15-point Kronrod rule and its embedded 7-point Gauss rule (symmetric halves)
+KRONROD_NODES = np.array(
+    [
+        0.991455371120812639206854697526329,
+        0.949107912342758524526189684047851,
+        0.864864423359769072789712788640926,
+        0.741531185599394439863864773280788,
+        0.586087235467691130294144845693013,
+        0.405845151377397166906606412076961,
+        0.207784955007898467600689403773245,
+        0.000000000000000000000000000000000,
+    ]
+)
+KRONROD_WEIGHTS = np.array(
+    [
+        0.022935322010529224963732008058970,
+        0.063092092629978553290700663189204,
+        0.104790010322250183839876322541518,
+        0.140653259715525918745189590510238,
+        0.169004726639267902826583426598550,
+        0.190350578064785409913256402421014,
+        0.204432940075298892414161999234649,
+        0.209482141084727828012999174891714,
+    ]
+)
+# Gauss weights of the nodes with odd indices of KRONROD_NODES
+GAUSS_WEIGHTS = np.array(
+    [
+        0.129484966168869693270611432679082,
+        0.279705391489276667901467771423780,
+        0.381830050505118944950369775488975,
+        0.417959183673469387755102040816327,
+    ]
+)
+
+_KRONROD_ABSCISSAE = np.concatenate([-KRONROD_NODES[:-1], KRONROD_NODES[::-1]])
+_KRONROD_FULL_WEIGHTS = np.concatenate([KRONROD_WEIGHTS[:-1], KRONROD_WEIGHTS[::-1]])
+_GAUSS_FULL_WEIGHTS = np.zeros(15)
+_GAUSS_FULL_WEIGHTS[[1, 3, 5, 13, 11, 9]] = np.concatenate(
+    [GAUSS_WEIGHTS[:-1], GAUSS_WEIGHTS[:-1]]
+)
+_GAUSS_FULL_WEIGHTS[7] = GAUSS_WEIGHTS[-1]
+
+# Intervals narrower than this fraction of the whole interval are not split further
+MINIMUM_RELATIVE_WIDTH = 1e-12
+
+
+def adaptive_simpson_implementation(f, a, b, tol, max_function_evaluations):
+    """
+    Integrate a function with the adaptive Simpson's rule, refining only the subintervals whose error is too large.
+
+    All subintervals of one refinement level are evaluated with a single vectorized call, and the function values
+    at the end points and midpoints of the subintervals are reused, so each split costs two new evaluations.
+
+    :param f:                           The integrated function.
+    :param a:                           Lower bound of the interval.
+    :param b:                           Upper bound of the interval.
+    :param tol:                         Target absolute error of the whole integral.
+    :param max_function_evaluations:    Maximum number of function evaluations.
+
+    :return: The integral, the error estimate, number of function evaluations, number of subintervals and whether the tolerance was met.
+    """
+    left = np.array([a], dtype=float)
+    right = np.array([b], dtype=float)
+    f_left, f_middle, f_right = evaluate(f, np.array([a, (a + b) / 2, b]))
+    f_left, f_middle, f_right = (
+        np.array([f_left]),
+        np.array([f_middle]),
+        np.array([f_right]),
+    )
+    function_evaluations = 3
+
+    accepted_values = []
+    accepted_errors = []
+    accepted_intervals = 0
+
+    while len(left) > 0:
+        check_deadline()
+
+        middle = (left + right) / 2
+        width = right - left
+
+        quarter_points = evaluate(
+            f, np.concatenate([(left + middle) / 2, (middle + right) / 2])
+        )
+        f_left_quarter, f_right_quarter = np.split(quarter_points, 2)
+        function_evaluations += 2 * len(left)
+
+        whole = width / 6 * (f_left + 4 * f_middle + f_right)
+        halves = (
+            width
+            / 12
+            * (
+                f_left
+                + 4 * f_left_quarter
+                + 2 * f_middle
+                + 4 * f_right_quarter
+                + f_right
+            )
+        )
+        errors = np.abs(halves - whole) / 15
+
+        # Each subinterval gets a share of the tolerance proportional to its width
+        done = (errors <= tol * width / (b - a)) | (
+            width <= MINIMUM_RELATIVE_WIDTH * (b - a)
+        )
+        out_of_budget = function_evaluations + 4 * np.count_nonzero(~done) > (
+            max_function_evaluations
+        )
+        if out_of_budget:
+            done[:] = True
+
+        # Richardson extrapolation of the two Simpson's estimates
+        accepted_values.extend((halves + (halves - whole) / 15)[done])
+        accepted_errors.extend(errors[done])
+        accepted_intervals += np.count_nonzero(done)
+
+        if out_of_budget:
+            break
+
+        split = ~done
+        left, right = (
+            np.concatenate([left[split], middle[split]]),
+            np.concatenate([middle[split], right[split]]),
+        )
+        f_left, f_middle, f_right = (
+            np.concatenate([f_left[split], f_middle[split]]),
+            np.concatenate([f_left_quarter[split], f_right_quarter[split]]),
+            np.concatenate([f_middle[split], f_right[split]]),
+        )
+
+    error_estimate = math.fsum(accepted_errors)
+    return (
+        math.fsum(accepted_values),
+        error_estimate,
+        function_evaluations,
+        accepted_intervals,
+        error_estimate <= tol,
+    )
+
+
+def gauss_kronrod_implementation(f, a, b, tol, max_function_evaluations):
+    """
+    Integrate a function with the adaptive 15-point Gauss-Kronrod rule, refining only the subintervals whose
+    difference between the Kronrod and the embedded 7-point Gauss estimate is too large.
+
+    All subintervals of one refinement level are evaluated with a single vectorized call.
+
+    :param f:                           The integrated function.
+    :param a:                           Lower bound of the interval.
+    :param b:                           Upper bound of the interval.
+    :param tol:                         Target absolute error of the whole integral.
+    :param max_function_evaluations:    Maximum number of function evaluations.
+
+    :return: The integral, the error estimate, number of function evaluations, number of subintervals and whether the tolerance was met.
+    """
+    left = np.array([a], dtype=float)
+    right = np.array([b], dtype=float)
+    function_evaluations = 0
+
+    accepted_values = []
+    accepted_errors = []
+    accepted_intervals = 0
+
+    while len(left) > 0:
+        check_deadline()
+
+        center = (left + right) / 2
+        half_width = (right - left) / 2
+
+        x = center[:, None] + half_width[:, None] * _KRONROD_ABSCISSAE[None, :]
+        y = evaluate(f, x)
+        function_evaluations += x.size
+
+        kronrod = half_width * (y @ _KRONROD_FULL_WEIGHTS)
+        gauss = half_width * (y @ _GAUSS_FULL_WEIGHTS)
+        errors = np.abs(kronrod - gauss)
+
+        # Each subinterval gets a share of the tolerance proportional to its width
+        done = (errors <= tol * 2 * half_width / (b - a)) | (
+            2 * half_width <= MINIMUM_RELATIVE_WIDTH * (b - a)
+        )
+        out_of_budget = function_evaluations + 30 * np.count_nonzero(~done) > (
+            max_function_evaluations
+        )
+        if out_of_budget:
+            done[:] = True
+
+        accepted_values.extend(kronrod[done])
+        accepted_errors.extend(errors[done])
+        accepted_intervals += np.count_nonzero(done)
+
+        if out_of_budget:
+            break
+
+        split = ~done
+        left, right = (
+            np.concatenate([left[split], center[split]]),
+            np.concatenate([center[split], right[split]]),
+        )
+
+    error_estimate = math.fsum(accepted_errors)
+    return (
+        math.fsum(accepted_values),
+        error_estimate,
+        function_evaluations,
+        accepted_intervals,
+        error_estimate <= tol,
+    )
+
+
+@with_deadline(CALCULATION_TIMEOUT)
+def adaptive_quadrature(
+    f_string: str,
+    a: float,
+    b: float,
+    tol: float = 1e-8,
+    method: AdaptiveQuadratureMethod = AdaptiveQuadratureMethod.GAUSS_KRONROD,
+    max_function_evaluations: int = 100000,
+):
+    """
+    Find the area under the curve of a function using adaptive quadrature.
+
+    :param f_string:                    String expression of the function f(x).
+    :param a:                           Lower bound of the interval.
+    :param b:                           Upper bound of the interval.
+    :param tol:                         Target absolute error of the result.
+    :param method:                      Adaptive Simpson's rule or Gauss-Kronrod rule.
+    :param max_function_evaluations:    Maximum number of function evaluations.
+
+    :return: A dictionary containing the result, error estimate, number of function evaluations and subintervals, whether the tolerance was met and execution time.
+    """
+
+    try:
+        if a >= b:
+            raise ValueError("Upper bound must be greater than lower bound.")
+
+        if not (math.isfinite(a) and math.isfinite(b)):
+            raise ValueError("Bounds must be finite.")
+
+        if tol <= 0:
+            raise ValueError("Tolerance must be positive.")
+
+        if max_function_evaluations < 15:
+            raise ValueError(
+                "Maximum number of function evaluations must be at least 15."
+            )
+
+        # Parse string expression and convert it to numpy methods for numerical calculations
+        f_np = compile_expression(f_string).f_np
+
+        # Measure execution time
+        start_time = time.time()
+
+        # Find the result
+        implementation = (
+            adaptive_simpson_implementation
+            if method == AdaptiveQuadratureMethod.SIMPSON
+            else gauss_kronrod_implementation
+        )
+        (
+            result,
+            error_estimate,
+            function_evaluations,
+            intervals,
+            converged,
+        ) = implementation(f_np, a, b, tol, max_function_evaluations)
+
+        if not (math.isfinite(result) and math.isfinite(error_estimate)):
+            raise ValueError("The function is not finite on the interval.")
+
+        # Calculate execution time in milliseconds
+        execution_time_ms = (time.time() - start_time) * 1000
+
+        # Return the results
+        return {
+            "result": result,
+            "error_estimate": error_estimate,
+            "function_evaluations": function_evaluations,
+            "intervals": intervals,
+            "converged": converged,
+            "execution_time_ms": execution_time_ms,
+        }
+    except TimeoutError:
+        # Handle timeout error and raise an HTTPException with a specific status code and detail message
+        raise HTTPException(status_code=408, detail=CALCULATION_TIMEOUT_ERROR_MESSAGE)
+    except Exception as e:
+        # Handle any errors and raise an HTTPException with a specific status code and detail message
+        raise HTTPException(status_code=422, detail=str(e))
@@ -0,0 +1,236 @@
+import time
+from enum import Enum
+
+import numpy as np
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+from api.constants import (
+    CALCULATION_TIMEOUT,
+    CALCULATION_TIMEOUT_ERROR_MESSAGE,
+    GAUSSIAN_QUADRATURE_MAX_ORDER,
+    INTEGRATION_CHUNK_SIZE,
+)
+from core.helpers.compile_expression import compile_expression, evaluate
+from core.helpers.deadline import check_deadline, with_deadline
+from core.integration.gaussian_quadrature import (
+    GaussianQuadratureRule,
+    gauss_nodes_and_weights,
+)
+
+
+class BatchIntegrationRule(Enum):
+    RECTANGLES = "rectangles"
+    TRAPEZOIDAL = "trapezoidal"
+    SIMPSON = "simpson"
+    GAUSS_LEGENDRE = "gauss_legendre"
+
+
+class BatchIntegrationRequest(BaseModel):
+    f_strings: list[str]
+    a: list[float]
+    b: list[float]
+    rule: BatchIntegrationRule = BatchIntegrationRule.SIMPSON
+    number_of_interval_partitions: int = 100
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "f_strings": ["cos(x)", "x**2"],
+                    "a": [0.0, 1.0, 2.0],
+                    "b": [1.0, 2.0, 3.0],
+                    "rule": "simpson",
+                    "number_of_interval_partitions": 100,
+                }
+            ]
+        }
+    }
+
+
+class BatchIntegrationResult(BaseModel):
+    f_string: str
+    results: list[float | None]
+
+
+class BatchIntegrationResponse(BaseModel):
+    results: list[BatchIntegrationResult]
+    execution_time_ms: float
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "results": [
+                        {
+                            "f_string": "cos(x)",
+                            "results": [
+                                0.8414709848546456,
+                                0.06782644202155338,
+                                -0.7681774188084917,
+                            ],
+                        },
+                        {
+                            "f_string": "x**2",
+                            "results": [
+                                0.3333333333333334,
+                                2.333333333333333,
+                                6.333333333333335,
+                            ],
+                        },
+                    ],
+                    "execution_time_ms": 0.05000114440917969,
+                }
+            ]
+        }
+    }
+
+
+def reference_rule(
+    rule: BatchIntegrationRule, number_of_interval_partitions: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the points and weights of an integration rule on the interval [0, 1].
+
+    :param rule:                            The integration rule.
+    :param number_of_interval_partitions:   Number of interval partitions, the order of Gauss-Legendre rule.
+
+    :return: The points and weights, the integral over [a, b] is (b - a) times the weighted sum of f(a + (b - a) * t).
+    """
+    n = number_of_interval_partitions
+
+    if rule == BatchIntegrationRule.RECTANGLES:
+        return (np.arange(n) + 0.5) / n, np.full(n, 1 / n)
+
+    if rule == BatchIntegrationRule.TRAPEZOIDAL:
+        weights = np.full(n + 1, 1 / n)
+        weights[[0, -1]] /= 2
+        return np.linspace(0, 1, n + 1), weights
+
+    if rule == BatchIntegrationRule.SIMPSON:
+        weights = np.tile([2.0, 4.0], n // 2 + 1)[: n + 1] / (3 * n)
+        weights[[0, -1]] = 1 / (3 * n)
+        return np.linspace(0, 1, n + 1), weights
+
+    nodes, weights = gauss_nodes_and_weights(GaussianQuadratureRule.LEGENDRE, n)
+    return (nodes + 1) / 2, weights / 2
+
+
+def batch_integration_implementation(f, a, b, points, weights):
+    """
+    Integrate a function over many intervals at once, mapping the same reference rule onto every interval.
+
+    The intervals are processed in blocks of rows, so that the evaluated grid has a bounded size.
+
+    :param f:       The integrated function.
+    :param a:       Lower bounds of the intervals.
+    :param b:       Upper bounds of the intervals.
+    :param points:  Points of the rule on [0, 1].
+    :param weights: Weights of the rule on [0, 1].
+
+    :return: The integrals over the intervals.
+    """
+    widths = b - a
+    results = np.empty(len(a))
+
+    block_rows = max(1, INTEGRATION_CHUNK_SIZE // len(points))
+    for first in range(0, len(a), block_rows):
+        check_deadline()
+
+        rows = slice(first, first + block_rows)
+        x = a[rows, None] + widths[rows, None] * points[None, :]
+        results[rows] = widths[rows] * (evaluate(f, x) @ weights)
+
+    return results
+
+
+@with_deadline(CALCULATION_TIMEOUT)
+def batch_integration(
+    f_strings: list[str],
+    a: list[float],
+    b: list[float],
+    rule: BatchIntegrationRule = BatchIntegrationRule.SIMPSON,
+    number_of_interval_partitions: int = 100,
+):
+    """
+    Find the areas under the curves of one or more functions over many intervals at once.
+
+    :param f_strings:                       String expressions of the functions f(x).
+    :param a:                               Lower bounds of the intervals.
+    :param b:                               Upper bounds of the intervals.
+    :param rule:                            The integration rule.
+    :param number_of_interval_partitions:   Number of interval partitions of every interval, the order of Gauss-Legendre rule.
+
+    :return: A dictionary containing the results for every function and interval and the execution time.
+    """
+
+    try:
+        if not f_strings:
+            raise ValueError("At least one function must be provided.")
+
+        if not a or len(a) != len(b):
+            raise ValueError(
+                "The lists of lower and upper bounds must be non-empty and have the same length."
+            )
+
+        a = np.asarray(a, dtype=float)
+        b = np.asarray(b, dtype=float)
+
+        if not np.all(np.isfinite(a) & np.isfinite(b)):
+            raise ValueError("Bounds must be finite.")
+
+        if np.any(a >= b):
+            raise ValueError("Upper bounds must be greater than lower bounds.")
+
+        if number_of_interval_partitions < 1:
+            raise ValueError("Number of interval partitions must be greater than 0.")
+
+        if rule == BatchIntegrationRule.SIMPSON and number_of_interval_partitions % 2:
+            raise ValueError(
+                "Number of interval partitions must be even for Simpson's rule."
+            )
+
+        if (
+            rule == BatchIntegrationRule.GAUSS_LEGENDRE
+            and number_of_interval_partitions > GAUSSIAN_QUADRATURE_MAX_ORDER
+        ):
+            raise ValueError(
+                f"Order of Gauss-Legendre rule must be at most {GAUSSIAN_QUADRATURE_MAX_ORDER}."
+            )
+
+        # Measure execution time
+        start_time = time.time()
+
+        points, weights = reference_rule(rule, number_of_interval_partitions)
+
+        results = []
+        for f_string in f_strings:
+            f_np = compile_expression(f_string).f_np
+
+            integrals = batch_integration_implementation(f_np, a, b, points, weights)
+
+            results.append(
+                {
+                    "f_string": f_string,
+                    # NaN and infinity can not be represented in JSON
+                    "results": [
+                        float(integral) if np.isfinite(integral) else None
+                        for integral in integrals
+                    ],
+                }
+            )
+
+        # Calculate execution time in milliseconds
+        execution_time_ms = (time.time() - start_time) * 1000
+
+        # Return the results
+        return {
+            "results": results,
+            "execution_time_ms": execution_time_ms,
+        }
+    except TimeoutError:
+        # Handle timeout error and raise an HTTPException with a specific status code and detail message
+        raise HTTPException(status_code=408, detail=CALCULATION_TIMEOUT_ERROR_MESSAGE)
+    except Exception as e:
+        # Handle any errors and raise an HTTPException with a specific status code and detail message
+        raise HTTPException(status_code=422, detail=str(e))
@@ -0,0 +1,210 @@
+import math
+import time
+from enum import Enum
+from functools import lru_cache
+
+import numpy as np
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+from api.constants import (
+    CALCULATION_TIMEOUT,
+    CALCULATION_TIMEOUT_ERROR_MESSAGE,
+    GAUSSIAN_QUADRATURE_MAX_ORDER,
+)
+from core.helpers.compile_expression import compile_expression, evaluate
+from core.helpers.deadline import with_deadline
+
+
+class GaussianQuadratureRule(Enum):
+    AUTO = "auto"
+    LEGENDRE = "legendre"
+    LAGUERRE = "laguerre"
+    HERMITE = "hermite"
+
+
+class GaussianQuadratureResponse(BaseModel):
+    result: float
+    error_estimate: float | None
+    rule: GaussianQuadratureRule
+    order: int
+    execution_time_ms: float
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "result": 1.772453850905516,
+                    "error_estimate": 2.220446049250313e-16,
+                    "rule": "hermite",
+                    "order": 20,
+                    "execution_time_ms": 0.05000114440917969,
+                }
+            ]
+        }
+    }
+
+
+@lru_cache(maxsize=None)
+def gauss_nodes_and_weights(
+    rule: GaussianQuadratureRule, order: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the nodes and weights of a Gaussian quadrature rule, once per rule and order in each process.
+
+    The weights of the Gauss-Laguerre and Gauss-Hermite rules are multiplied by the inverse of their weight
+    functions, e^x and e^(x^2), so that all rules integrate f(x) directly.
+
+    :param rule:    Gauss-Legendre rule on [-1, 1], Gauss-Laguerre rule on [0, inf) or Gauss-Hermite rule on (-inf, inf).
+    :param order:   Number of nodes.
+
+    :return: Read-only arrays of the nodes and weights.
+    """
+    if rule == GaussianQuadratureRule.LEGENDRE:
+        nodes, weights = np.polynomial.legendre.leggauss(order)
+    elif rule == GaussianQuadratureRule.LAGUERRE:
+        nodes, weights = np.polynomial.laguerre.laggauss(order)
+        # Combine in logarithms, the weights underflow where e^x overflows
+        with np.errstate(divide="ignore"):
+            weights = np.exp(np.log(weights) + nodes)
+    else:
+        nodes, weights = np.polynomial.hermite.hermgauss(order)
+        with np.errstate(divide="ignore"):
+            weights = np.exp(np.log(weights) + nodes**2)
+
+    nodes.flags.writeable = False
+    weights.flags.writeable = False
+    return nodes, weights
+
+
+def default_rule(a: float, b: float) -> GaussianQuadratureRule:
+    """
+    Choose the Gaussian quadrature rule matching the interval.
+
+    :param a:   Lower bound of the interval, may be -inf.
+    :param b:   Upper bound of the interval, may be inf.
+
+    :return: Gauss-Legendre rule for finite, Gauss-Laguerre rule for semi-infinite and Gauss-Hermite rule for infinite intervals.
+    """
+    infinite_bounds = math.isinf(a) + math.isinf(b)
+    return [
+        GaussianQuadratureRule.LEGENDRE,
+        GaussianQuadratureRule.LAGUERRE,
+        GaussianQuadratureRule.HERMITE,
+    ][infinite_bounds]
+
+
+def gaussian_quadrature_implementation(f, a, b, rule, order):
+    """
+    Integrate a function with a Gaussian quadrature rule, mapping the rule onto the interval.
+
+    The error is estimated by the difference to the rule of half the order, whose nodes and weights are cached too.
+
+    :param f:       The integrated function.
+    :param a:       Lower bound of the interval, may be -inf.
+    :param b:       Upper bound of the interval, may be inf.
+    :param rule:    Gaussian quadrature rule matching the interval.
+    :param order:   Number of nodes.
+
+    :return: The integral and the error estimate, None for a rule with one node or if it is not finite.
+    """
+
+    def integrate(order):
+        nodes, weights = gauss_nodes_and_weights(rule, order)
+
+        if rule == GaussianQuadratureRule.LEGENDRE:
+            half_width = (b - a) / 2
+            x = (a + b) / 2 + half_width * nodes
+            scale = half_width
+        elif rule == GaussianQuadratureRule.LAGUERRE:
+            # Substitute x = a + t on [a, inf) and x = b - t on (-inf, b]
+            x = a + nodes if math.isinf(b) else b - nodes
+            scale = 1
+        else:
+            x = nodes
+            scale = 1
+
+        return scale * math.fsum(weights * evaluate(f, x))
+
+    result = integrate(order)
+    if order < 2:
+        return result, None
+
+    # NaN and infinity can not be represented in JSON, the lower order rule may hit a singularity the result avoids
+    with np.errstate(all="ignore"):
+        error_estimate = abs(result - integrate(order // 2))
+    return result, error_estimate if math.isfinite(error_estimate) else None
+
+
+@with_deadline(CALCULATION_TIMEOUT)
+def gaussian_quadrature(
+    f_string: str,
+    a: float,
+    b: float,
+    rule: GaussianQuadratureRule = GaussianQuadratureRule.AUTO,
+    order: int = 20,
+):
+    """
+    Find the area under the curve of a function using Gaussian quadrature.
+
+    :param f_string:    String expression of the function f(x).
+    :param a:           Lower bound of the interval, may be -inf.
+    :param b:           Upper bound of the interval, may be inf.
+    :param rule:        Gauss-Legendre, Gauss-Laguerre or Gauss-Hermite rule, or the rule matching the interval.
+    :param order:       Number of nodes of the rule.
+
+    :return: A dictionary containing the result, error estimate, the used rule, order and execution time.
+    """
+
+    try:
+        if a >= b:
+            raise ValueError("Upper bound must be greater than lower bound.")
+
+        if math.isnan(a) or math.isnan(b):
+            raise ValueError("Bounds must be numbers.")
+
+        if not 1 <= order <= GAUSSIAN_QUADRATURE_MAX_ORDER:
+            raise ValueError(
+                f"Order must be between 1 and {GAUSSIAN_QUADRATURE_MAX_ORDER}."
+            )
+
+        interval_rule = default_rule(a, b)
+        if rule == GaussianQuadratureRule.AUTO:
+            rule = interval_rule
+        elif rule != interval_rule:
+            raise ValueError(
+                "Gauss-Legendre rule requires a finite interval, Gauss-Laguerre rule requires one infinite bound "
+                "and Gauss-Hermite rule requires both bounds to be infinite."
+            )
+
+        # Parse string expression and convert it to numpy methods for numerical calculations
+        f_np = compile_expression(f_string).f_np
+
+        # Measure execution time
+        start_time = time.time()
+
+        # Find the result
+        result, error_estimate = gaussian_quadrature_implementation(
+            f_np, a, b, rule, order
+        )
+
+        if not math.isfinite(result):
+            raise ValueError("The function is not finite on the nodes of the rule.")
+
+        # Calculate execution time in milliseconds
+        execution_time_ms = (time.time() - start_time) * 1000
+
+        # Return the results
+        return {
+            "result": result,
+            "error_estimate": error_estimate,
+            "rule": rule,
+            "order": order,
+            "execution_time_ms": execution_time_ms,
+        }
+    except TimeoutError:
+        # Handle timeout error and raise an HTTPException with a specific status code and detail message
+        raise HTTPException(status_code=408, detail=CALCULATION_TIMEOUT_ERROR_MESSAGE)
+    except Exception as e:
+        # Handle any errors and raise an HTTPException with a specific status code and detail message
+        raise HTTPException(status_code=422, detail=str(e))
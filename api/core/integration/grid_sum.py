@@ -0,0 +1,60 @@
+import math
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+
+import numpy as np
+
+from api.constants import INTEGRATION_CHUNK_SIZE, INTEGRATION_THREADS
+from core.helpers.compile_expression import evaluate
+from core.helpers.deadline import check_deadline
+
+
+def grid_sum(
+    f,
+    start: float,
+    step: float,
+    count: int,
+    weights: tuple[float, ...] = (1.0,),
+    threads: int = INTEGRATION_THREADS,
+) -> float:
+    """
+    Sum the weighted values of a function on an evenly spaced grid without allocating the whole grid.
+
+    The grid is processed in blocks of a fixed size, each block is summed with NumPy pairwise summation and the
+    block sums are added with math.fsum, so memory usage is constant and rounding errors do not grow with the
+    number of points. NumPy releases the GIL while evaluating a block, so blocks can be evaluated in threads.
+
+    :param f:           NumPy function of the summed expression.
+    :param start:       The first grid point.
+    :param step:        Distance between the grid points.
+    :param count:       Number of grid points.
+    :param weights:     Weights of the grid points, repeated cyclically starting at the first point.
+    :param threads:     Number of threads evaluating the blocks.
+
+    :return: The sum of weights[i % len(weights)] * f(start + i * step) over the grid points.
+    """
+    # Blocks start at multiples of the weight pattern length, so that every block starts with the first weight
+    block_size = INTEGRATION_CHUNK_SIZE - INTEGRATION_CHUNK_SIZE % len(weights)
+    block_weights = np.resize(np.asarray(weights, dtype=float), block_size)
+
+    def block_sum(first: int) -> float:
+        check_deadline()
+
+        size = min(block_size, count - first)
+        x = start + np.arange(first, first + size) * step
+        return float(np.sum(evaluate(f, x) * block_weights[:size]))
+
+    blocks = range(0, count, block_size)
+
+    if threads <= 1 or len(blocks) <= 1:
+        return math.fsum(block_sum(first) for first in blocks)
+
+    executor = ThreadPoolExecutor(max_workers=threads)
+    try:
+        # Threads do not inherit context variables, copy them to keep the deadline of the calculation
+        futures = [
+            executor.submit(copy_context().run, block_sum, first) for first in blocks
+        ]
+        return math.fsum(future.result() for future in futures)
+    finally:
+        executor.shutdown(cancel_futures=True)
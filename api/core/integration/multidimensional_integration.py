@@ -0,0 +1,341 @@
+import inspect
+import math
+import time
+from enum import Enum
+
+import numpy as np
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+from api.constants import (
+    CALCULATION_TIMEOUT,
+    CALCULATION_TIMEOUT_ERROR_MESSAGE,
+    INTEGRATION_CHUNK_SIZE,
+    MULTIDIMENSIONAL_INTEGRATION_MAX_SAMPLES,
+    QUASI_MONTE_CARLO_REPLICATES,
+)
+from core.helpers.compile_expression import compile_expression, evaluate
+from core.helpers.deadline import check_deadline, with_deadline
+
+VARIABLES = ("x", "y", "z")
+
+
+class MultidimensionalIntegrationMethod(Enum):
+    SIMPSON = "simpson"
+    MONTE_CARLO = "monte_carlo"
+    SOBOL = "sobol"
+    HALTON = "halton"
+
+
+class MultidimensionalIntegrationRequest(BaseModel):
+    f_string: str
+    bounds: list[tuple[float, float]]
+    method: MultidimensionalIntegrationMethod = MultidimensionalIntegrationMethod.SOBOL
+    number_of_interval_partitions: int = 40
+    samples: int = 1 << 16
+    seed: int | None = None
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "f_string": "exp(-x**2 - y**2)",
+                    "bounds": [[0, 1], [0, 1]],
+                    "method": "sobol",
+                    "samples": 65536,
+                },
+                {
+                    "f_string": "x*y*z",
+                    "bounds": [[0, 1], [0, 2], [0, 3]],
+                    "method": "simpson",
+                    "number_of_interval_partitions": 40,
+                },
+            ]
+        }
+    }
+
+
+class MultidimensionalIntegrationResponse(BaseModel):
+    result: float
+    error_estimate: float
+    samples: int
+    execution_time_ms: float
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "result": 0.5577462853510335,
+                    "error_estimate": 2.1e-07,
+                    "samples": 65536,
+                    "execution_time_ms": 0.05000114440917969,
+                }
+            ]
+        }
+    }
+
+
+def _simpson_weights(n: int, h: float) -> tuple[np.ndarray, np.ndarray]:
+    # Weights on the fine grid and on the grid of every other point, which has the same points with twice the step
+    fine = np.tile([2.0, 4.0], n // 2 + 1)[: n + 1] * h / 3
+    fine[[0, -1]] = h / 3
+
+    coarse = np.zeros(n + 1)
+    coarse[::2] = np.tile([2.0, 4.0], n // 4 + 1)[: n // 2 + 1] * 2 * h / 3
+    coarse[[0, -1]] = 2 * h / 3
+
+    return fine, coarse
+
+
+def tensor_simpson_implementation(f, lower, upper, number_of_interval_partitions):
+    """
+    Integrate a function over a rectangular domain with the tensor product of composite Simpson's rules.
+
+    The grid is evaluated in slabs along the first axis. The error is estimated with Richardson extrapolation
+    from the Simpson's rule on every other grid point, which reuses the same function values.
+
+    :param f:                               The integrated function of one argument per dimension.
+    :param lower:                           Lower bounds of the domain.
+    :param upper:                           Upper bounds of the domain.
+    :param number_of_interval_partitions:   Number of interval partitions along every axis, a multiple of 4.
+
+    :return: The integral, the error estimate and number of function evaluations.
+    """
+    n = number_of_interval_partitions
+    dimensions = len(lower)
+
+    axes = [np.linspace(a, b, n + 1) for a, b in zip(lower, upper)]
+    weights = [_simpson_weights(n, (b - a) / n) for a, b in zip(lower, upper)]
+
+    # Grid coordinates of the later axes, broadcast against each other
+    later_axes = [
+        axis.reshape((1,) * (i + 1) + (-1,) + (1,) * (dimensions - i - 2))
+        for i, axis in enumerate(axes[1:])
+    ]
+
+    slab_size = max(1, INTEGRATION_CHUNK_SIZE // (n + 1) ** (dimensions - 1))
+    fine_sums = []
+    coarse_sums = []
+    for first in range(0, n + 1, slab_size):
+        check_deadline()
+
+        rows = slice(first, first + slab_size)
+        values = evaluate(
+            f, axes[0][rows].reshape((-1,) + (1,) * (dimensions - 1)), *later_axes
+        )
+
+        for sums, index in ((fine_sums, 0), (coarse_sums, 1)):
+            # Contract the axes one at a time, starting with the last one
+            contracted = values
+            for axis_weights in reversed(weights[1:]):
+                contracted = contracted @ axis_weights[index]
+            sums.append(contracted @ weights[0][index][rows])
+
+    fine = math.fsum(fine_sums)
+    coarse = math.fsum(coarse_sums)
+    return fine + (fine - coarse) / 15, abs(fine - coarse) / 15, (n + 1) ** dimensions
+
+
+def _sample_sum(f, points, lower, upper) -> tuple[float, float]:
+    # Sum of the values and of their squares on a chunk of points in the unit cube
+    check_deadline()
+
+    x = lower + points * (upper - lower)
+    values = evaluate(f, *x.T)
+    return float(np.sum(values)), float(np.sum(values**2))
+
+
+def monte_carlo_implementation(f, lower, upper, samples, seed):
+    """
+    Integrate a function over a rectangular domain with the Monte Carlo method.
+
+    :param f:       The integrated function of one argument per dimension.
+    :param lower:   Lower bounds of the domain.
+    :param upper:   Upper bounds of the domain.
+    :param samples: Number of random points.
+    :param seed:    Seed of the random number generator.
+
+    :return: The integral, the standard error and number of function evaluations.
+    """
+    rng = np.random.default_rng(seed)
+    volume = np.prod(upper - lower)
+
+    sums = []
+    squares = []
+    for first in range(0, samples, INTEGRATION_CHUNK_SIZE):
+        size = min(INTEGRATION_CHUNK_SIZE, samples - first)
+        chunk_sum, chunk_squares = _sample_sum(
+            f, rng.random((size, len(lower))), lower, upper
+        )
+        sums.append(chunk_sum)
+        squares.append(chunk_squares)
+
+    mean = math.fsum(sums) / samples
+    variance = max(math.fsum(squares) / samples - mean**2, 0.0)
+    return (
+        volume * mean,
+        volume * math.sqrt(variance / max(samples - 1, 1)),
+        samples,
+    )
+
+
+def _qmc_engine(method: MultidimensionalIntegrationMethod, dimensions: int, rng):
+    # Import SciPy on first use, it is slow to import
+    from scipy.stats import qmc
+
+    engine = (
+        qmc.Sobol if method == MultidimensionalIntegrationMethod.SOBOL else qmc.Halton
+    )
+
+    # SciPy 1.15 renamed the seed of the quasi-Monte Carlo engines from seed to rng
+    name = "rng" if "rng" in inspect.signature(engine).parameters else "seed"
+    return engine(dimensions, scramble=True, **{name: rng})
+
+
+def quasi_monte_carlo_implementation(f, lower, upper, samples, seed, method):
+    """
+    Integrate a function over a rectangular domain with randomized quasi-Monte Carlo method.
+
+    The points are split between independently scrambled Sobol or Halton sequences, and the error is estimated
+    from the spread of their estimates.
+
+    :param f:       The integrated function of one argument per dimension.
+    :param lower:   Lower bounds of the domain.
+    :param upper:   Upper bounds of the domain.
+    :param samples: Number of points.
+    :param seed:    Seed of the scrambling.
+    :param method:  Sobol or Halton sequence.
+
+    :return: The integral, the standard error and number of function evaluations.
+    """
+    rng = np.random.default_rng(seed)
+    volume = np.prod(upper - lower)
+
+    replicate_samples = max(samples // QUASI_MONTE_CARLO_REPLICATES, 1)
+    if method == MultidimensionalIntegrationMethod.SOBOL:
+        # Sobol sequences are balanced only for powers of 2 points
+        replicate_samples = 1 << (replicate_samples.bit_length() - 1)
+
+    estimates = []
+    for _ in range(QUASI_MONTE_CARLO_REPLICATES):
+        engine = _qmc_engine(method, len(lower), rng)
+
+        sums = []
+        for first in range(0, replicate_samples, INTEGRATION_CHUNK_SIZE):
+            size = min(INTEGRATION_CHUNK_SIZE, replicate_samples - first)
+            chunk_sum, _ = _sample_sum(f, engine.random(size), lower, upper)
+            sums.append(chunk_sum)
+
+        estimates.append(volume * math.fsum(sums) / replicate_samples)
+
+    return (
+        float(np.mean(estimates)),
+        float(np.std(estimates, ddof=1) / math.sqrt(len(estimates))),
+        replicate_samples * QUASI_MONTE_CARLO_REPLICATES,
+    )
+
+
+@with_deadline(CALCULATION_TIMEOUT)
+def multidimensional_integration(
+    f_string: str,
+    bounds: list[tuple[float, float]],
+    method: MultidimensionalIntegrationMethod = MultidimensionalIntegrationMethod.SOBOL,
+    number_of_interval_partitions: int = 40,
+    samples: int = 1 << 16,
+    seed: int | None = None,
+):
+    """
+    Find the integral of a function of two or three variables over a rectangular domain.
+
+    :param f_string:                        String expression of the function f(x, y) or f(x, y, z).
+    :param bounds:                          Lower and upper bounds of every variable.
+    :param method:                          Tensor product Simpson's rule, Monte Carlo or quasi-Monte Carlo method.
+    :param number_of_interval_partitions:   Number of interval partitions along every axis of Simpson's rule.
+    :param samples:                         Number of points of Monte Carlo and quasi-Monte Carlo methods.
+    :param seed:                            Seed of the random points.
+
+    :return: A dictionary containing the result, error estimate, number of function evaluations and execution time.
+    """
+
+    try:
+        if len(bounds) not in (2, 3):
+            raise ValueError("Bounds must be given for two or three variables.")
+
+        lower, upper = np.array(bounds, dtype=float).T
+
+        if not np.all(np.isfinite(lower) & np.isfinite(upper)):
+            raise ValueError("Bounds must be finite.")
+
+        if np.any(lower >= upper):
+            raise ValueError("Upper bounds must be greater than lower bounds.")
+
+        if method == MultidimensionalIntegrationMethod.SIMPSON:
+            if number_of_interval_partitions < 4 or number_of_interval_partitions % 4:
+                raise ValueError(
+                    "Number of interval partitions must be a positive multiple of 4 for Simpson's rule, "
+                    "so that the error can be estimated on every other grid point."
+                )
+
+            evaluations = (number_of_interval_partitions + 1) ** len(bounds)
+        else:
+            evaluations = samples
+
+            if samples < QUASI_MONTE_CARLO_REPLICATES:
+                raise ValueError(
+                    f"Number of samples must be at least {QUASI_MONTE_CARLO_REPLICATES}."
+                )
+
+        if evaluations > MULTIDIMENSIONAL_INTEGRATION_MAX_SAMPLES:
+            raise ValueError(
+                f"At most {MULTIDIMENSIONAL_INTEGRATION_MAX_SAMPLES} function evaluations are allowed."
+            )
+
+        # Parse string expression and convert it to numpy methods for numerical calculations
+        variables = VARIABLES[: len(bounds)]
+        compiled = compile_expression(f_string, variables)
+
+        unknown_symbols = {str(symbol) for symbol in compiled.f.free_symbols} - set(
+            variables
+        )
+        if unknown_symbols:
+            raise ValueError(
+                f"The function may only depend on {', '.join(variables)}, "
+                f"found {', '.join(sorted(unknown_symbols))}."
+            )
+
+        # Measure execution time
+        start_time = time.time()
+
+        # Find the result
+        if method == MultidimensionalIntegrationMethod.SIMPSON:
+            result, error_estimate, evaluations = tensor_simpson_implementation(
+                compiled.f_np, lower, upper, number_of_interval_partitions
+            )
+        elif method == MultidimensionalIntegrationMethod.MONTE_CARLO:
+            result, error_estimate, evaluations = monte_carlo_implementation(
+                compiled.f_np, lower, upper, samples, seed
+            )
+        else:
+            result, error_estimate, evaluations = quasi_monte_carlo_implementation(
+                compiled.f_np, lower, upper, samples, seed, method
+            )
+
+        if not (math.isfinite(result) and math.isfinite(error_estimate)):
+            raise ValueError("The function is not finite on the domain.")
+
+        # Calculate execution time in milliseconds
+        execution_time_ms = (time.time() - start_time) * 1000
+
+        # Return the results
+        return {
+            "result": result,
+            "error_estimate": error_estimate,
+            "samples": evaluations,
+            "execution_time_ms": execution_time_ms,
+        }
+    except TimeoutError:
+        # Handle timeout error and raise an HTTPException with a specific status code and detail message
+        raise HTTPException(status_code=408, detail=CALCULATION_TIMEOUT_ERROR_MESSAGE)
+    except Exception as e:
+        # Handle any errors and raise an HTTPException with a specific status code and detail message
+        raise HTTPException(status_code=422, detail=str(e))
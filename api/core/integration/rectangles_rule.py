@@ -1,13 +1,13 @@
 import time
 from enum import Enum
 
-import numpy as np
-import sympy as sp
 from fastapi import HTTPException
 from pydantic import BaseModel
-from timeout_decorator import timeout
 
 from api.constants import CALCULATION_TIMEOUT, CALCULATION_TIMEOUT_ERROR_MESSAGE
+from core.helpers.compile_expression import compile_expression
+from core.helpers.deadline import with_deadline
+from core.integration.grid_sum import grid_sum
 
 
 class RectangleRuleType(Enum):
@@ -32,10 +32,7 @@ class RectanglesRuleResponse(BaseModel):
     }
 
 
-@timeout(
-    CALCULATION_TIMEOUT,
-    timeout_exception=TimeoutError,
-)
+@with_deadline(CALCULATION_TIMEOUT)
 def rectangles_rule(
     f_string: str,
     a: float,
@@ -62,13 +59,8 @@ def rectangles_rule(
         if a >= b:
             raise ValueError("Upper bound must be greater than lower bound.")
 
-        x = sp.symbols("x")
-
-        # Parse LaTeX expressions to symbolic methods
-        f = sp.sympify(f_string)
-
-        # Convert to numpy methods for numerical calculations
-        f_np = sp.lambdify(x, f, "numpy")
+        # Parse string expression and convert it to numpy methods for numerical calculations
+        f_np = compile_expression(f_string).f_np
 
         # Measure execution time
         start_time = time.time()
@@ -77,15 +69,15 @@ def rectangles_rule(
         dx = (b - a) / number_of_interval_partitions
 
         if rule_type == RectangleRuleType.LEFT:
-            x_values = np.linspace(a, b - dx, number_of_interval_partitions)
+            first_point = a
         elif rule_type == RectangleRuleType.MIDDLE:
-            x_values = np.linspace(dx / 2, b - dx / 2, number_of_interval_partitions)
+            first_point = a + dx / 2
         elif rule_type == RectangleRuleType.RIGHT:
-            x_values = np.linspace(dx, b, number_of_interval_partitions)
+            first_point = a + dx
         else:
             raise ValueError("Invalid rectangle rule type.")
 
-        result = np.sum(f_np(x_values) * dx)
+        result = dx * grid_sum(f_np, first_point, dx, number_of_interval_partitions)
 
         # Calculate execution time in milliseconds
         execution_time_ms = (time.time() - start_time) * 1000
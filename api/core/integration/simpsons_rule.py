@@ -1,12 +1,12 @@
 import time
 
-import numpy as np
-import sympy as sp
 from fastapi import HTTPException
 from pydantic import BaseModel
-from timeout_decorator import timeout
 
 from api.constants import CALCULATION_TIMEOUT, CALCULATION_TIMEOUT_ERROR_MESSAGE
+from core.helpers.compile_expression import compile_expression
+from core.helpers.deadline import with_deadline
+from core.integration.grid_sum import grid_sum
 
 
 class SimpsonsRuleResponse(BaseModel):
@@ -25,10 +25,7 @@ class SimpsonsRuleResponse(BaseModel):
     }
 
 
-@timeout(
-    CALCULATION_TIMEOUT,
-    timeout_exception=TimeoutError,
-)
+@with_deadline(CALCULATION_TIMEOUT)
 def simpsons_rule(
     f_string: str, a: float, b: float, number_of_interval_partitions: int = 100
 ):
@@ -50,22 +47,18 @@ def simpsons_rule(
         if a >= b:
             raise ValueError("Upper bound must be greater than lower bound.")
 
-        x = sp.symbols("x")
-
-        # Parse LaTeX expressions to symbolic methods
-        f = sp.sympify(f_string)
-
-        # Convert to numpy methods for numerical calculations
-        f_np = sp.lambdify(x, f, "numpy")
+        # Parse string expression and convert it to numpy methods for numerical calculations
+        f_np = compile_expression(f_string).f_np
 
         # Measure execution time
         start_time = time.time()
 
         # Find the result
         h = (b - a) / number_of_interval_partitions
-        x = np.linspace(a, b, number_of_interval_partitions + 1)
-        y = f_np(x)
-        result = h / 3 * (y[0] + 4 * np.sum(y[1:-1:2]) + 2 * np.sum(y[2:-1:2]) + y[-1])
+        inner_points_sum = grid_sum(
+            f_np, a + h, h, number_of_interval_partitions - 1, weights=(4, 2)
+        )
+        result = h / 3 * (f_np(a) + inner_points_sum + f_np(b))
 
         # Calculate execution time in milliseconds
         execution_time_ms = (time.time() - start_time) * 1000
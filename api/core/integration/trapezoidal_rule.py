@@ -1,15 +1,31 @@
+import math
 import time
+from enum import Enum
 
-import sympy as sp
 from fastapi import HTTPException
 from pydantic import BaseModel
-from timeout_decorator import timeout
 
-from api.constants import CALCULATION_TIMEOUT, CALCULATION_TIMEOUT_ERROR_MESSAGE
+from api.constants import (
+    CALCULATION_TIMEOUT,
+    CALCULATION_TIMEOUT_ERROR_MESSAGE,
+    ROMBERG_MAX_INTERVAL_PARTITIONS,
+)
+from core.helpers.compile_expression import compile_expression
+from core.helpers.deadline import check_deadline, with_deadline
+from core.integration.grid_sum import grid_sum
+
+
+class TrapezoidalRuleMode(Enum):
+    FIXED = "fixed"
+    ROMBERG = "romberg"
 
 
 class TrapezoidalRuleResponse(BaseModel):
     result: float
+    error_estimate: float | None = None
+    function_evaluations: int | None = None
+    converged: bool | None = None
+    romberg_tableau: list[list[float]] | None = None
     execution_time_ms: float
 
     model_config = {
@@ -18,18 +34,77 @@ class TrapezoidalRuleResponse(BaseModel):
                 {
                     "result": 0.7390851332151607,
                     "execution_time_ms": 0.05000114440917969,
-                }
+                },
+                {
+                    "result": 0.8414705353607151,
+                    "error_estimate": 0.0003015568775566191,
+                    "function_evaluations": 5,
+                    "converged": False,
+                    "romberg_tableau": [
+                        [0.7701511529340699],
+                        [0.8238668574122213, 0.8417720922382718],
+                        [0.8370837513522271, 0.8414893826655624, 0.8414705353607151],
+                    ],
+                    "execution_time_ms": 0.05000114440917969,
+                },
             ]
         }
     }
 
 
-@timeout(
-    CALCULATION_TIMEOUT,
-    timeout_exception=TimeoutError,
-)
+def romberg_implementation(f, a, b, number_of_interval_partitions, tol, max_levels):
+    """
+    Integrate a function with Romberg's method, halving the step of the trapezoidal rule and extrapolating
+    the estimates with Richardson extrapolation.
+
+    Each halving only evaluates the function at the midpoints of the previous partitions, every previous
+    function value is reused through the previous trapezoidal estimate.
+
+    :param f:                               The integrated function.
+    :param a:                               Lower bound of the interval.
+    :param b:                               Upper bound of the interval.
+    :param number_of_interval_partitions:   Number of interval partitions of the first trapezoidal estimate.
+    :param tol:                             Tolerance of the difference between successive extrapolated estimates.
+    :param max_levels:                      Maximum number of step halvings.
+
+    :return: The Romberg tableau, the error estimate, number of function evaluations and whether the tolerance was met.
+    """
+    n = number_of_interval_partitions
+    h = (b - a) / n
+
+    tableau = [[h * ((f(a) + f(b)) / 2 + grid_sum(f, a + h, h, n - 1))]]
+    function_evaluations = n + 1
+    error_estimate = math.inf
+
+    for level in range(1, max_levels + 1):
+        check_deadline()
+
+        previous = tableau[-1]
+        row = [previous[0] / 2 + h / 2 * grid_sum(f, a + h / 2, h, n)]
+        function_evaluations += n
+        for k in range(1, level + 1):
+            row.append(row[k - 1] + (row[k - 1] - previous[k - 1]) / (4**k - 1))
+        tableau.append(row)
+
+        n *= 2
+        h /= 2
+
+        error_estimate = abs(row[-1] - previous[-1])
+        if error_estimate <= tol:
+            return tableau, error_estimate, function_evaluations, True
+
+    return tableau, error_estimate, function_evaluations, False
+
+
+@with_deadline(CALCULATION_TIMEOUT)
 def trapezoidal_rule(
-    f_string: str, a: float, b: float, number_of_interval_partitions: int = 100
+    f_string: str,
+    a: float,
+    b: float,
+    number_of_interval_partitions: int = 100,
+    mode: TrapezoidalRuleMode = TrapezoidalRuleMode.FIXED,
+    tol: float = 1e-8,
+    max_romberg_levels: int = 16,
 ):
     """
     Find the area under the curve of a function using trapezoidal rule.
@@ -37,9 +112,13 @@ def trapezoidal_rule(
     :param f_string:                        String expression of the function f(x).
     :param a:                               Lower bound of the interval.
     :param b:                               Upper bound of the interval.
-    :param number_of_interval_partitions:   Number of points to use for the Riemann sum.
+    :param number_of_interval_partitions:   Number of points to use for the Riemann sum, the first step in Romberg mode.
+    :param mode:                            Fixed number of partitions or Romberg's method.
+    :param tol:                             Tolerance of Romberg's method.
+    :param max_romberg_levels:              Maximum number of step halvings of Romberg's method.
 
-    :return: A dictionary containing the result and execution time.
+    :return: A dictionary containing the result and execution time, and the error estimate, number of function
+             evaluations, whether the tolerance was met and the Romberg tableau in Romberg mode.
     """
 
     try:
@@ -49,25 +128,64 @@ def trapezoidal_rule(
         if a >= b:
             raise ValueError("Upper bound must be greater than lower bound.")
 
-        x = sp.symbols("x")
-
-        # Parse LaTeX expressions to symbolic methods
-        f = sp.sympify(f_string)
-
-        # Convert to numpy methods for numerical calculations
-        f_np = sp.lambdify(x, f, "numpy")
+        if mode == TrapezoidalRuleMode.ROMBERG:
+            if tol <= 0:
+                raise ValueError("Tolerance must be positive.")
+
+            if max_romberg_levels < 1:
+                raise ValueError(
+                    "Maximum number of Romberg levels must be greater than 0."
+                )
+
+            # Compare the levels with log2 of the allowed growth before shifting, a huge number of levels would
+            # otherwise build an arbitrarily large integer
+            max_levels = (
+                ROMBERG_MAX_INTERVAL_PARTITIONS // number_of_interval_partitions
+            ).bit_length() - 1
+            if max_romberg_levels > max_levels:
+                raise ValueError(
+                    f"Romberg's method can use at most {ROMBERG_MAX_INTERVAL_PARTITIONS} interval partitions, "
+                    "decrease the number of interval partitions or Romberg levels."
+                )
+
+        # Parse string expression and convert it to numpy methods for numerical calculations
+        f_np = compile_expression(f_string).f_np
 
         # Measure execution time
         start_time = time.time()
 
+        if mode == TrapezoidalRuleMode.ROMBERG:
+            (
+                tableau,
+                error_estimate,
+                function_evaluations,
+                converged,
+            ) = romberg_implementation(
+                f_np, a, b, number_of_interval_partitions, tol, max_romberg_levels
+            )
+
+            if not math.isfinite(tableau[-1][-1]):
+                raise ValueError("The function is not finite on the interval.")
+
+            # Calculate execution time in milliseconds
+            execution_time_ms = (time.time() - start_time) * 1000
+
+            return {
+                "result": tableau[-1][-1],
+                # NaN and infinity can not be represented in JSON
+                "error_estimate": error_estimate
+                if math.isfinite(error_estimate)
+                else None,
+                "function_evaluations": function_evaluations,
+                "converged": converged,
+                "romberg_tableau": tableau,
+                "execution_time_ms": execution_time_ms,
+            }
+
         # Find the result
         h = (b - a) / number_of_interval_partitions
-        integration = f_np(a) + f_np(b)
-        for i in range(1, number_of_interval_partitions):
-            k = a + i * h
-            integration = integration + 2 * f_np(k)
-
-        result = integration * h / 2
+        inner_points_sum = grid_sum(f_np, a + h, h, number_of_interval_partitions - 1)
+        result = h * ((f_np(a) + f_np(b)) / 2 + inner_points_sum)
 
         # Calculate execution time in milliseconds
         execution_time_ms = (time.time() - start_time) * 1000
@@ -0,0 +1,104 @@
+import time
+from enum import Enum
+
+import numpy as np
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+from api.constants import CALCULATION_TIMEOUT, CALCULATION_TIMEOUT_ERROR_MESSAGE
+from core.helpers.deadline import with_deadline
+
+
+class ChebyshevNodesKind(Enum):
+    FIRST = "first"
+    SECOND = "second"
+
+
+class ChebyshevNodesResponse(BaseModel):
+    nodes: list[float]
+    execution_time_ms: float
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "nodes": [-1.0, -0.5, 0.5, 1.0],
+                    "execution_time_ms": 0.05000114440917969,
+                }
+            ]
+        }
+    }
+
+
+def chebyshev_nodes_implementation(
+    a: float, b: float, number_of_nodes: int, kind: ChebyshevNodesKind
+) -> np.ndarray:
+    """
+    Generate Chebyshev nodes on an interval in increasing order.
+
+    Interpolating at Chebyshev nodes instead of equidistant ones avoids the Runge phenomenon,
+    so high-degree interpolation polynomials stay accurate.
+
+    :param a:               Start of the interval.
+    :param b:               End of the interval.
+    :param number_of_nodes: Number of nodes.
+    :param kind:            Roots (first kind) or extrema including the end points (second kind) of a Chebyshev polynomial.
+
+    :return: The nodes.
+    """
+    if kind == ChebyshevNodesKind.FIRST:
+        angles = (2 * np.arange(number_of_nodes) + 1) * np.pi / (2 * number_of_nodes)
+    elif number_of_nodes == 1:
+        angles = np.array([np.pi / 2])
+    else:
+        angles = np.arange(number_of_nodes) * np.pi / (number_of_nodes - 1)
+
+    # Map from [-1, 1] to [a, b] in increasing order
+    return (a + b) / 2 - (b - a) / 2 * np.cos(angles)
+
+
+@with_deadline(CALCULATION_TIMEOUT)
+def chebyshev_nodes(
+    a: float,
+    b: float,
+    number_of_nodes: int,
+    kind: ChebyshevNodesKind = ChebyshevNodesKind.SECOND,
+):
+    """
+    Generate Chebyshev nodes on an interval.
+
+    :param a:               Start of the interval.
+    :param b:               End of the interval.
+    :param number_of_nodes: Number of nodes.
+    :param kind:            Roots (first kind) or extrema including the end points (second kind) of a Chebyshev polynomial.
+
+    :return: A dictionary containing the nodes and execution time.
+    """
+
+    try:
+        if a >= b:
+            raise ValueError('The "b" must be greater than "a".')
+
+        if number_of_nodes <= 0:
+            raise ValueError("Number of nodes must be greater than zero.")
+
+        # Measure execution time
+        start_time = time.time()
+
+        nodes = chebyshev_nodes_implementation(a, b, number_of_nodes, kind)
+
+        # Measure execution time
+        execution_time_ms = (time.time() - start_time) * 1000
+
+        # Return the results
+        return {
+            "nodes": nodes.tolist(),
+            "execution_time_ms": execution_time_ms,
+        }
+
+    except TimeoutError:
+        # Handle timeout error and raise an HTTPException with a specific status code and detail message
+        raise HTTPException(status_code=408, detail=CALCULATION_TIMEOUT_ERROR_MESSAGE)
+    except Exception as e:
+        # Handle any errors and raise an HTTPException with a specific status code and detail message
+        raise HTTPException(status_code=422, detail=str(e))
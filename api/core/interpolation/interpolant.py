@@ -0,0 +1,287 @@
+import copy
+import time
+from enum import Enum
+
+import numpy as np
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+from api.constants import (
+    CALCULATION_TIMEOUT,
+    CALCULATION_TIMEOUT_ERROR_MESSAGE,
+    INTERPOLANT_EVALUATION_MAX_OPERATIONS,
+    INTERPOLANT_EVALUATION_MAX_POINTS,
+    INTERPOLANT_UPDATE_MAX_OPERATIONS,
+)
+from core.helpers.deadline import check_deadline, with_deadline
+from core.helpers.plotting import to_json_list
+from core.interpolation.lagranges_interpolation_method import LagrangeInterpolant
+from core.interpolation.newtons_interpolation_method import NewtonInterpolant
+
+
+class InterpolationMethod(Enum):
+    NEWTON = "newton"
+    LAGRANGE = "lagrange"
+
+
+class InterpolantRequest(BaseModel):
+    x: list[float]
+    y: list[float]
+    method: InterpolationMethod = InterpolationMethod.LAGRANGE
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "x": [0.0, 1.0, 2.0, 3.0],
+                    "y": [1.0, 2.0, 5.0, 10.0],
+                    "method": "lagrange",
+                }
+            ]
+        }
+    }
+
+
+class InterpolantPointsRequest(BaseModel):
+    x: list[float]
+    y: list[float]
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "x": [4.0],
+                    "y": [17.0],
+                }
+            ]
+        }
+    }
+
+
+class InterpolantEvaluationRequest(BaseModel):
+    x: list[float]
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "x": [0.5, 1.5, 2.5],
+                }
+            ]
+        }
+    }
+
+
+class InterpolantResponse(BaseModel):
+    interpolant_id: str
+    method: InterpolationMethod
+    number_of_nodes: int
+    x_min: float
+    x_max: float
+    execution_time_ms: float
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "interpolant_id": "2c593dd6fb024e3e93fc9629053b8ca3",
+                    "method": "lagrange",
+                    "number_of_nodes": 4,
+                    "x_min": 0.0,
+                    "x_max": 3.0,
+                    "execution_time_ms": 0.05000114440917969,
+                }
+            ]
+        }
+    }
+
+
+class InterpolantEvaluationResponse(BaseModel):
+    y: list[float | None]
+    execution_time_ms: float
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "y": [1.25, 3.25, 7.25],
+                    "execution_time_ms": 0.05000114440917969,
+                }
+            ]
+        }
+    }
+
+
+def interpolant_summary(interpolant, method: InterpolationMethod) -> dict:
+    """
+    Describe an interpolant.
+
+    :param interpolant: Newton's or Lagrange's interpolant.
+    :param method:      The interpolation method of the interpolant.
+
+    :return: A dictionary containing the method, number of nodes and the range of the nodes.
+    """
+    return {
+        "method": method,
+        "number_of_nodes": len(interpolant.x_values),
+        "x_min": float(interpolant.x_values.min()),
+        "x_max": float(interpolant.x_values.max()),
+    }
+
+
+def _validate_points(x: list[float], y: list[float]):
+    # Check if the lists have the same length
+    if len(x) != len(y):
+        raise ValueError("The lists must have the same length.")
+
+    if len(x) != len(set(x)):
+        raise ValueError("The x values must be unique.")
+
+
+@with_deadline(CALCULATION_TIMEOUT)
+def build_interpolant(
+    x: list[float],
+    y: list[float],
+    method: InterpolationMethod = InterpolationMethod.LAGRANGE,
+):
+    """
+    Build an interpolation polynomial that can be stored and evaluated many times.
+
+    :param x:       List of x values.
+    :param y:       List of y values.
+    :param method:  Newton's or Lagrange's interpolation method.
+
+    :return: A dictionary containing the interpolant, its summary and execution time.
+    """
+
+    try:
+        _validate_points(x, y)
+
+        if len(x) == 0:
+            raise ValueError("At least one data point is required.")
+
+        # Measure execution time
+        start_time = time.time()
+
+        if method == InterpolationMethod.NEWTON:
+            interpolant = NewtonInterpolant(x, y)
+        else:
+            interpolant = LagrangeInterpolant(x, y)
+
+        # Measure execution time
+        execution_time_ms = (time.time() - start_time) * 1000
+
+        # Return the results
+        return {
+            "interpolant": interpolant,
+            **interpolant_summary(interpolant, method),
+            "execution_time_ms": execution_time_ms,
+        }
+
+    except TimeoutError:
+        # Handle timeout error and raise an HTTPException with a specific status code and detail message
+        raise HTTPException(status_code=408, detail=CALCULATION_TIMEOUT_ERROR_MESSAGE)
+    except Exception as e:
+        # Handle any errors and raise an HTTPException with a specific status code and detail message
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+@with_deadline(CALCULATION_TIMEOUT)
+def add_interpolant_points(
+    interpolant, method: InterpolationMethod, x: list[float], y: list[float]
+):
+    """
+    Add data points to an interpolation polynomial without rebuilding it.
+
+    The points are added to a copy, so the given interpolant can still be evaluated while it is updated
+    and stays unchanged if any of the points is invalid.
+
+    :param interpolant: Newton's or Lagrange's interpolant.
+    :param method:      The interpolation method of the interpolant.
+    :param x:           List of new x values.
+    :param y:           List of new y values.
+
+    :return: A dictionary containing the extended interpolant, its summary and execution time.
+    """
+
+    try:
+        _validate_points(x, y)
+
+        # Every added point costs O(n) for the n nodes of the interpolant
+        if len(x) * (len(interpolant.x_values) + len(x)) > (
+            INTERPOLANT_UPDATE_MAX_OPERATIONS
+        ):
+            raise ValueError(
+                f"The number of added points times the number of nodes must be at most {INTERPOLANT_UPDATE_MAX_OPERATIONS}."
+            )
+
+        # Measure execution time
+        start_time = time.time()
+
+        # Adding a point replaces the arrays of the interpolant instead of modifying them, so a shallow copy is enough
+        interpolant = copy.copy(interpolant)
+
+        for x_value, y_value in zip(x, y):
+            check_deadline()
+            interpolant.add_point(x_value, y_value)
+
+        # Measure execution time
+        execution_time_ms = (time.time() - start_time) * 1000
+
+        # Return the results
+        return {
+            "interpolant": interpolant,
+            **interpolant_summary(interpolant, method),
+            "execution_time_ms": execution_time_ms,
+        }
+
+    except TimeoutError:
+        # Handle timeout error and raise an HTTPException with a specific status code and detail message
+        raise HTTPException(status_code=408, detail=CALCULATION_TIMEOUT_ERROR_MESSAGE)
+    except Exception as e:
+        # Handle any errors and raise an HTTPException with a specific status code and detail message
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+@with_deadline(CALCULATION_TIMEOUT)
+def evaluate_interpolant(interpolant, x: list[float]):
+    """
+    Evaluate an interpolation polynomial at many points at once.
+
+    :param interpolant: Newton's or Lagrange's interpolant.
+    :param x:           List of points.
+
+    :return: A dictionary containing the values of the polynomial at the points and execution time.
+    """
+
+    try:
+        if len(x) > INTERPOLANT_EVALUATION_MAX_POINTS:
+            raise ValueError(
+                f"At most {INTERPOLANT_EVALUATION_MAX_POINTS} points can be evaluated at once."
+            )
+
+        if len(x) * len(interpolant.x_values) > INTERPOLANT_EVALUATION_MAX_OPERATIONS:
+            raise ValueError(
+                f"The number of points times the number of nodes must be at most {INTERPOLANT_EVALUATION_MAX_OPERATIONS}."
+            )
+
+        # Measure execution time
+        start_time = time.time()
+
+        y = interpolant(np.asarray(x, dtype=float))
+
+        # Measure execution time
+        execution_time_ms = (time.time() - start_time) * 1000
+
+        # Return the results
+        return {
+            "y": to_json_list(y),
+            "execution_time_ms": execution_time_ms,
+        }
+
+    except TimeoutError:
+        # Handle timeout error and raise an HTTPException with a specific status code and detail message
+        raise HTTPException(status_code=408, detail=CALCULATION_TIMEOUT_ERROR_MESSAGE)
+    except Exception as e:
+        # Handle any errors and raise an HTTPException with a specific status code and detail message
+        raise HTTPException(status_code=422, detail=str(e))
@@ -1,21 +1,31 @@
 import json
 import time
-from io import BytesIO
 
-import matplotlib.pyplot as plt
 import numpy as np
 from fastapi import HTTPException
 from pydantic import BaseModel
-from timeout_decorator import timeout
 
-from api.constants import CALCULATION_TIMEOUT, CALCULATION_TIMEOUT_ERROR_MESSAGE
+from api.constants import (
+    CALCULATION_TIMEOUT,
+    CALCULATION_TIMEOUT_ERROR_MESSAGE,
+    RESULT_CACHE_MAX_PLOT_POINTS,
+)
+from core.helpers.deadline import check_deadline, with_deadline
+from core.helpers.plotting import (
+    create_figure,
+    figure_to_svg,
+    plot_data_to_json,
+    PlotMode,
+)
 
 
 class LagrangesInterpolationMethodResponse(BaseModel):
     x_value: float
     x_value_interpolated: float
     execution_time_ms: float
-    plot_svg: str
+    plot_svg: str | None = None
+    plot_data: dict[str, list[float | None]] | None = None
+    result_id: str | None = None
 
     model_config = {
         "json_schema_extra": {
@@ -31,11 +41,144 @@ class LagrangesInterpolationMethodResponse(BaseModel):
     }
 
 
+# Evaluation works on blocks of at most this many node-point pairs, so memory does not grow with n * m
+EVALUATION_BLOCK_SIZE = 1 << 20
+
+
+def barycentric_weights(x_values) -> np.ndarray:
+    """
+    Calculate the barycentric weights w_j = 1 / prod_{k != j} (x_j - x_k) of the interpolation nodes.
+
+    The products are summed as logarithms and the weights are scaled by their largest value,
+    which cancels out in the barycentric formula, so hundreds of nodes do not overflow or underflow.
+
+    :param x_values:    Interpolation nodes.
+
+    :return: The scaled barycentric weights.
+    """
+    x_values = np.asarray(x_values, dtype=float)
+    n = len(x_values)
+
+    log_weights = np.empty(n)
+    signs = np.empty(n)
+
+    rows_per_block = max(1, EVALUATION_BLOCK_SIZE // max(n, 1))
+    for start in range(0, n, rows_per_block):
+        check_deadline()
+
+        stop = min(start + rows_per_block, n)
+        differences = x_values[start:stop, None] - x_values[None, :]
+        differences[np.arange(stop - start), np.arange(start, stop)] = 1.0
+
+        log_weights[start:stop] = -np.log(np.abs(differences)).sum(axis=1)
+        signs[start:stop] = np.prod(np.sign(differences), axis=1)
+
+    return signs * np.exp(log_weights - log_weights.max(initial=-np.inf))
+
+
+def barycentric_interpolation(x_values, y_values, weights, x) -> np.ndarray:
+    """
+    Evaluate the interpolation polynomial with the second (true) barycentric formula.
+
+    Each evaluation point costs O(n) and the points are evaluated in vectorized blocks.
+
+    :param x_values:    Interpolation nodes.
+    :param y_values:    Values at the interpolation nodes.
+    :param weights:     Barycentric weights of the nodes.
+    :param x:           Points to evaluate the polynomial at.
+
+    :return: The values of the polynomial at the points.
+    """
+    x_values = np.asarray(x_values, dtype=float)
+    y_values = np.asarray(y_values, dtype=float)
+    x = np.asarray(x, dtype=float)
+
+    points = x.ravel()
+    result = np.empty_like(points)
+
+    points_per_block = max(1, EVALUATION_BLOCK_SIZE // max(len(x_values), 1))
+    for start in range(0, len(points), points_per_block):
+        check_deadline()
+
+        block = points[start : start + points_per_block]
+        differences = block[:, None] - x_values[None, :]
+
+        # Points that coincide with a node take the node value instead of dividing by zero
+        exact_rows, exact_columns = np.nonzero(differences == 0)
+        differences[exact_rows, exact_columns] = 1.0
+
+        terms = weights / differences
+        values = (terms @ y_values) / terms.sum(axis=1)
+        values[exact_rows] = y_values[exact_columns]
+
+        result[start : start + len(block)] = values
+
+    return result.reshape(x.shape)
+
+
+class LagrangeInterpolant:
+    """
+    Lagrange's interpolation polynomial in barycentric form that can be extended with new data points.
+    """
+
+    def __init__(self, x_values, y_values):
+        """
+        :param x_values:    List of unique x values.
+        :param y_values:    List of y values.
+        """
+        self.x_values = np.array(x_values, dtype=float)
+        self.y_values = np.array(y_values, dtype=float)
+        self.weights = barycentric_weights(self.x_values)
+
+    def add_point(self, x: float, y: float):
+        """
+        Add a data point to the interpolation polynomial, updating the barycentric weights in O(n).
+
+        :param x:   The x value, different from all x values of the polynomial.
+        :param y:   The y value.
+        """
+        if np.any(self.x_values == x):
+            raise ValueError("The x values must be unique.")
+
+        differences = self.x_values - x
+
+        # The stored weights are scaled by an unknown constant C = w_0 * prod_{k != 0} (x_0 - x_k),
+        # the new weight C / prod_j (x - x_j) is calculated in logarithms to keep the same scale
+        first_differences = self.x_values[0] - self.x_values[1:]
+        log_scale = (
+            np.log(np.abs(self.weights[0])) + np.log(np.abs(first_differences)).sum()
+        )
+        scale_sign = np.sign(self.weights[0]) * np.prod(np.sign(first_differences))
+        new_weight = (
+            scale_sign
+            * np.prod(np.sign(-differences))
+            * np.exp(log_scale - np.log(np.abs(differences)).sum())
+        )
+
+        weights = np.append(self.weights / differences, new_weight)
+
+        self.x_values = np.append(self.x_values, x)
+        self.y_values = np.append(self.y_values, y)
+        self.weights = weights / np.abs(weights).max()
+
+    def __call__(self, x):
+        """
+        Evaluate the polynomial with the barycentric formula.
+
+        :param x:   Point or array of points.
+
+        :return: The values of the polynomial at the points.
+        """
+        return barycentric_interpolation(self.x_values, self.y_values, self.weights, x)
+
+
 def lagranges_interpolation_method_implementation(
     x_values, y_values, number_of_points, x_value
 ):
     """
-    Interpolate a polynomial using Lagrange's interpolation method.
+    Interpolate a polynomial using Lagrange's interpolation method in barycentric form.
+
+    The weights are calculated once in O(n^2) and every evaluation point costs O(n).
 
     :param x_values:            List of x values.
     :param y_values:            List of y values.
@@ -48,28 +191,12 @@ def lagranges_interpolation_method_implementation(
     if len(x_values) != len(set(x_values)):
         raise ValueError("The x values must be unique.")
 
-    def lagrange_polynomial(x_values, y_values):
-        n = len(x_values)
-
-        def interpolate(x):
-            result = 0
-            for i in range(n):
-                partial_product = y_values[i]
-                for j in range(n):
-                    if j != i:
-                        partial_product *= (x - x_values[j]) / (
-                            x_values[i] - x_values[j]
-                        )
-                result += partial_product
-            return result
+    polynomial = LagrangeInterpolant(x_values, y_values)
 
-        return interpolate
-
-    polynomial = lagrange_polynomial(x_values, y_values)
     x_interpolation = np.linspace(min(x_values), max(x_values), number_of_points)
     y_interpolation = polynomial(x_interpolation)
 
-    x_value_interpolated = polynomial(x_value)
+    x_value_interpolated = float(polynomial(x_value))
 
     x_interpolation_extended = np.append(x_interpolation, x_value)
     plot_extension_x = np.linspace(
@@ -86,28 +213,121 @@ def lagranges_interpolation_method_implementation(
     )
 
 
-@timeout(
-    CALCULATION_TIMEOUT,
-    timeout_exception=TimeoutError,
-)
+def lagranges_interpolation_method_plot_data(
+    x: list[float], y: list[float], number_of_points: int, x_value: float
+):
+    """
+    Calculate the data for the plot of Lagrange's interpolation method.
+
+    :param x:                   List of x values.
+    :param y:                   List of y values.
+    :param number_of_points:    Number of points to plot.
+    :param x_value:             The interpolated x value.
+
+    :return: A dictionary containing the arrays to plot.
+    """
+    (
+        x_interpolation,
+        y_interpolation,
+        _,
+        plot_extension_x,
+        plot_extension_y,
+    ) = lagranges_interpolation_method_implementation(x, y, number_of_points, x_value)
+
+    return {
+        "x_interpolation": x_interpolation,
+        "y_interpolation": y_interpolation,
+        "plot_extension_x": plot_extension_x,
+        "plot_extension_y": plot_extension_y,
+    }
+
+
+def render_lagranges_interpolation_method_plot(
+    x: list[float],
+    y: list[float],
+    number_of_points: int,
+    x_value: float,
+    x_value_interpolated: float,
+    plot_data: dict | None = None,
+) -> str:
+    """
+    Create an SVG plot of Lagrange's interpolation method.
+
+    :param x:                   List of x values.
+    :param y:                   List of y values.
+    :param number_of_points:    Number of points to plot.
+    :param x_value:             The interpolated x value.
+    :param x_value_interpolated: The interpolated y value at x_value.
+    :param plot_data:           Already calculated plot data. Calculated from the other arguments if not provided.
+
+    :return: The SVG plot.
+    """
+    if plot_data is None:
+        plot_data = lagranges_interpolation_method_plot_data(
+            x, y, number_of_points, x_value
+        )
+
+    x_interpolation = plot_data["x_interpolation"]
+    y_interpolation = plot_data["y_interpolation"]
+    plot_extension_x = plot_data["plot_extension_x"]
+    plot_extension_y = plot_data["plot_extension_y"]
+
+    # Create the plot
+    with create_figure() as (figure, ax):
+        # Plot the data and the regression line
+        ax.plot(x_interpolation, y_interpolation, zorder=3)
+        ax.plot(x, y, "bo", zorder=4)
+
+        ax.axvline(0, color="black", linewidth=0.5)
+        ax.axhline(0, color="black", linewidth=0.5)
+
+        ax.grid(True, linestyle="--", alpha=0.7)
+        ax.set_xlabel("x")
+        ax.set_ylabel("y")
+
+        if not x_value < max(x_interpolation) or not x_value > min(x_interpolation):
+            ax.plot(plot_extension_x, plot_extension_y, "r--", zorder=2)
+
+        ax.scatter(
+            x_value,
+            x_value_interpolated,
+            color="green",
+            zorder=5,
+            label="Interpolated point",
+        )
+
+        ax.legend()
+
+        # Save the plot to an SVG file with a transparent background
+        return figure_to_svg(figure)
+
+
+@with_deadline(CALCULATION_TIMEOUT)
 def lagranges_interpolation_method(
-    x: str, y: str, number_of_points: int = 100, x_value: float = 0.0
+    x: str | list[float],
+    y: str | list[float],
+    number_of_points: int = 100,
+    x_value: float = 0.0,
+    plot: PlotMode = PlotMode.SVG,
 ):
     """
     Interpolate a polynomial using Lagrange's interpolation method.
 
-    :param x:                   List of x values as JSON string.
-    :param y:                   List of y values as JSON string.
+    :param x:                   List of x values as JSON string or array.
+    :param y:                   List of y values as JSON string or array.
     :param number_of_points:    Number of points to plot.
     :param x_value:             The x value to interpolate.
+    :param plot:                Whether to create an SVG plot, return the plot data or skip plotting.
 
     :return: A dictionary containing the interpolated x value, the execution time and the plot as an SVG string
     """
 
     try:
-        # Parse JSON to array
-        x = json.loads(x)
-        y = json.loads(y)
+        # Parse JSON to array, binary requests already provide arrays
+        if isinstance(x, str):
+            x = json.loads(x)
+        if isinstance(y, str):
+            y = json.loads(y)
 
         # Check if the lists have the same length
         if len(x) != len(y):
@@ -130,54 +350,35 @@ def lagranges_interpolation_method(
         # Measure execution time
         execution_time_ms = (time.time() - start_time) * 1000
 
-        # Create the plot
-        plt.figure(figsize=(12, 12))
-
-        # Plot the data and the regression line
-        plt.plot(x_interpolation, y_interpolation, zorder=3)
-        plt.plot(x, y, "bo", zorder=4)
-
-        plt.axvline(0, color="black", linewidth=0.5)
-        plt.axhline(0, color="black", linewidth=0.5)
-
-        plt.grid(True, linestyle="--", alpha=0.7)
-        plt.xlabel("x")
-        plt.ylabel("y")
-
-        if not x_value < max(x_interpolation) or not x_value > min(x_interpolation):
-            plt.plot(plot_extension_x, plot_extension_y, "r--", zorder=2)
-
-        plt.scatter(
-            x_value,
-            x_value_interpolated,
-            color="green",
-            zorder=5,
-            label="Interpolated point",
-        )
-
-        plt.legend()
-
-        # Save the plot to an SVG file with a transparent background
-        svg_buffer = BytesIO()
-        plt.savefig(
-            svg_buffer,
-            format="svg",
-            transparent=True,
-            bbox_inches="tight",
-            pad_inches=0,
-        )
-        svg_buffer.seek(0)
-        svg_plot = svg_buffer.read().decode("utf-8")
-
-        # Close the plot
-        plt.close()
+        # Arrays are pickled as raw buffers when the arguments are sent back from the worker
+        plot_args = {
+            "x": np.asarray(x, dtype=float),
+            "y": np.asarray(y, dtype=float),
+            "number_of_points": number_of_points,
+            "x_value": x_value,
+            "x_value_interpolated": x_value_interpolated,
+        }
+        plot_data = {
+            "x_interpolation": x_interpolation,
+            "y_interpolation": y_interpolation,
+            "plot_extension_x": plot_extension_x,
+            "plot_extension_y": plot_extension_y,
+        }
 
         # Return the results
         return {
             "x_value": x_value,
             "x_value_interpolated": x_value_interpolated,
             "execution_time_ms": execution_time_ms,
-            "plot_svg": svg_plot,
+            "plot_svg": render_lagranges_interpolation_method_plot(
+                **plot_args, plot_data=plot_data
+            )
+            if plot == PlotMode.SVG
+            else None,
+            "plot_data": plot_data_to_json(plot_data)
+            if plot == PlotMode.DATA
+            else None,
+            "plot_args": plot_args if len(x) <= RESULT_CACHE_MAX_PLOT_POINTS else None,
         }
 
     except TimeoutError:
@@ -1,21 +1,31 @@
 import json
 import time
-from io import BytesIO
 
-import matplotlib.pyplot as plt
 import numpy as np
 from fastapi import HTTPException
 from pydantic import BaseModel
-from timeout_decorator import timeout
 
-from api.constants import CALCULATION_TIMEOUT, CALCULATION_TIMEOUT_ERROR_MESSAGE
+from api.constants import (
+    CALCULATION_TIMEOUT,
+    CALCULATION_TIMEOUT_ERROR_MESSAGE,
+    RESULT_CACHE_MAX_PLOT_POINTS,
+)
+from core.helpers.deadline import check_deadline, with_deadline
+from core.helpers.plotting import (
+    create_figure,
+    figure_to_svg,
+    plot_data_to_json,
+    PlotMode,
+)
 
 
 class NewtonsInterpolationMethodResponse(BaseModel):
     x_value: float
     x_value_interpolated: float
     execution_time_ms: float
-    plot_svg: str
+    plot_svg: str | None = None
+    plot_data: dict[str, list[float | None]] | None = None
+    result_id: str | None = None
 
     model_config = {
         "json_schema_extra": {
@@ -31,6 +41,94 @@ class NewtonsInterpolationMethodResponse(BaseModel):
     }
 
 
+def divided_differences(x_values, y_values):
+    """
+    Calculate the coefficients of Newton's interpolation polynomial, the divided differences f[x_0, ..., x_k].
+
+    Only the top row of the divided differences table is needed, so the table is computed in place one column
+    at a time with vectorized operations, using O(n) memory instead of an n x n table.
+
+    :param x_values:    List of x values.
+    :param y_values:    List of y values.
+
+    :return: The coefficients and the last diagonal of the table, f[x_{n-1-k}, ..., x_{n-1}] for k = 0, ..., n-1.
+    """
+    x_values = np.asarray(x_values, dtype=float)
+    coefficients = np.array(y_values, dtype=float)
+    n = len(coefficients)
+
+    last_differences = np.empty(n)
+    last_differences[0] = coefficients[-1]
+
+    for j in range(1, n):
+        check_deadline()
+
+        coefficients[j:] = (coefficients[j:] - coefficients[j - 1 : -1]) / (
+            x_values[j:] - x_values[:-j]
+        )
+        last_differences[j] = coefficients[-1]
+
+    return coefficients, last_differences
+
+
+class NewtonInterpolant:
+    """
+    Newton's interpolation polynomial that can be extended with new data points.
+
+    Appending a point only adds one coefficient, so it costs O(n) instead of recomputing all divided differences.
+    """
+
+    def __init__(self, x_values, y_values):
+        """
+        :param x_values:    List of unique x values.
+        :param y_values:    List of y values.
+        """
+        self.x_values = np.array(x_values, dtype=float)
+        self.coefficients, self._last_differences = divided_differences(
+            self.x_values, y_values
+        )
+
+    def add_point(self, x: float, y: float):
+        """
+        Add a data point to the interpolation polynomial.
+
+        :param x:   The x value, different from all x values of the polynomial.
+        :param y:   The y value.
+        """
+        if np.any(self.x_values == x):
+            raise ValueError("The x values must be unique.")
+
+        # New last diagonal: f[x_n], f[x_{n-1}, x_n], ..., f[x_0, ..., x_n]
+        n = len(self.x_values)
+        last_differences = np.empty(n + 1)
+        last_differences[0] = y
+        for k in range(1, n + 1):
+            last_differences[k] = (
+                last_differences[k - 1] - self._last_differences[k - 1]
+            ) / (x - self.x_values[n - k])
+
+        self.x_values = np.append(self.x_values, x)
+        self.coefficients = np.append(self.coefficients, last_differences[-1])
+        self._last_differences = last_differences
+
+    def __call__(self, x):
+        """
+        Evaluate the polynomial with Horner's scheme.
+
+        :param x:   Point or array of points.
+
+        :return: The values of the polynomial at the points.
+        """
+        x = np.asarray(x, dtype=float)
+        n = len(self.coefficients) - 1
+
+        p = np.full_like(x, self.coefficients[n])
+        for k in range(1, n + 1):
+            check_deadline()
+            p = self.coefficients[n - k] + (x - self.x_values[n - k]) * p
+        return p
+
+
 def newtons_interpolation_method_implementation(
     x_values, y_values, number_of_points, x_value
 ):
@@ -48,42 +146,18 @@ def newtons_interpolation_method_implementation(
     if len(x_values) != len(set(x_values)):
         raise ValueError("The x values must be unique.")
 
-    def divided_differences(x, y):
-        n = len(y)
-        coefficients = np.zeros([n, n])
-        coefficients[:, 0] = y
-
-        for j in range(1, n):
-            for i in range(n - j):
-                coefficients[i][j] = (
-                    coefficients[i + 1][j - 1] - coefficients[i][j - 1]
-                ) / (x[i + j] - x[i])
-
-        return coefficients
-
-    def newton_interpolation(coefficients, x_data, x):
-        n = len(x_data) - 1
-        p = coefficients[n]
-        for k in range(1, n + 1):
-            p = coefficients[n - k] + (x - x_data[n - k]) * p
-        return p
-
-    coefficients = divided_differences(x_values, y_values)
+    polynomial = NewtonInterpolant(x_values, y_values)
 
     x_interpolation = np.linspace(min(x_values), max(x_values), number_of_points)
-    y_interpolation = newton_interpolation(
-        coefficients[0, :], x_values, x_interpolation
-    )
+    y_interpolation = polynomial(x_interpolation)
 
-    x_value_interpolated = newton_interpolation(coefficients[0, :], x_values, x_value)
+    x_value_interpolated = float(polynomial(x_value))
 
     x_interpolation_extended = np.append(x_interpolation, x_value)
     plot_extension_x = np.linspace(
         min(x_interpolation_extended), max(x_interpolation_extended), number_of_points
     )
-    plot_extension_y = newton_interpolation(
-        coefficients[0, :], x_values, plot_extension_x
-    )
+    plot_extension_y = polynomial(plot_extension_x)
 
     return (
         x_interpolation,
@@ -94,28 +168,121 @@ def newtons_interpolation_method_implementation(
     )
 
 
-@timeout(
-    CALCULATION_TIMEOUT,
-    timeout_exception=TimeoutError,
-)
+def newtons_interpolation_method_plot_data(
+    x: list[float], y: list[float], number_of_points: int, x_value: float
+):
+    """
+    Calculate the data for the plot of Newton's interpolation method.
+
+    :param x:                   List of x values.
+    :param y:                   List of y values.
+    :param number_of_points:    Number of points to plot.
+    :param x_value:             The interpolated x value.
+
+    :return: A dictionary containing the arrays to plot.
+    """
+    (
+        x_interpolation,
+        y_interpolation,
+        _,
+        plot_extension_x,
+        plot_extension_y,
+    ) = newtons_interpolation_method_implementation(x, y, number_of_points, x_value)
+
+    return {
+        "x_interpolation": x_interpolation,
+        "y_interpolation": y_interpolation,
+        "plot_extension_x": plot_extension_x,
+        "plot_extension_y": plot_extension_y,
+    }
+
+
+def render_newtons_interpolation_method_plot(
+    x: list[float],
+    y: list[float],
+    number_of_points: int,
+    x_value: float,
+    x_value_interpolated: float,
+    plot_data: dict | None = None,
+) -> str:
+    """
+    Create an SVG plot of Newton's interpolation method.
+
+    :param x:                   List of x values.
+    :param y:                   List of y values.
+    :param number_of_points:    Number of points to plot.
+    :param x_value:             The interpolated x value.
+    :param x_value_interpolated: The interpolated y value at x_value.
+    :param plot_data:           Already calculated plot data. Calculated from the other arguments if not provided.
+
+    :return: The SVG plot.
+    """
+    if plot_data is None:
+        plot_data = newtons_interpolation_method_plot_data(
+            x, y, number_of_points, x_value
+        )
+
+    x_interpolation = plot_data["x_interpolation"]
+    y_interpolation = plot_data["y_interpolation"]
+    plot_extension_x = plot_data["plot_extension_x"]
+    plot_extension_y = plot_data["plot_extension_y"]
+
+    # Create the plot
+    with create_figure() as (figure, ax):
+        # Plot the data and the regression line
+        ax.plot(x_interpolation, y_interpolation, zorder=3)
+        ax.plot(x, y, "bo", zorder=4)
+
+        ax.axvline(0, color="black", linewidth=0.5)
+        ax.axhline(0, color="black", linewidth=0.5)
+
+        ax.grid(True, linestyle="--", alpha=0.7)
+        ax.set_xlabel("x")
+        ax.set_ylabel("y")
+
+        if not x_value < max(x_interpolation) or not x_value > min(x_interpolation):
+            ax.plot(plot_extension_x, plot_extension_y, "r--", zorder=2)
+
+        ax.scatter(
+            x_value,
+            x_value_interpolated,
+            color="green",
+            zorder=5,
+            label="Interpolated point",
+        )
+
+        ax.legend()
+
+        # Save the plot to an SVG file with a transparent background
+        return figure_to_svg(figure)
+
+
+@with_deadline(CALCULATION_TIMEOUT)
 def newtons_interpolation_method(
-    x: str, y: str, number_of_points: int = 100, x_value: float = 0.0
+    x: str | list[float],
+    y: str | list[float],
+    number_of_points: int = 100,
+    x_value: float = 0.0,
+    plot: PlotMode = PlotMode.SVG,
 ):
     """
     Interpolate a polynomial using Newton's interpolation method.
 
-    :param x:                   List of x values as JSON string.
-    :param y:                   List of y values as JSON string.
+    :param x:                   List of x values as JSON string or array.
+    :param y:                   List of y values as JSON string or array.
     :param number_of_points:    Number of points to plot.
     :param x_value:             The x value to interpolate.
+    :param plot:                Whether to create an SVG plot, return the plot data or skip plotting.
 
     :return: A dictionary containing x_value, x_value_interpolated, execution_time_ms and plot_svg.
     """
 
     try:
-        # Parse JSON to array
-        x = json.loads(x)
-        y = json.loads(y)
+        # Parse JSON to array, binary requests already provide arrays
+        if isinstance(x, str):
+            x = json.loads(x)
+        if isinstance(y, str):
+            y = json.loads(y)
 
         # Check if the lists have the same length
         if len(x) != len(y):
@@ -136,54 +303,35 @@ def newtons_interpolation_method(
         # Measure execution time
         execution_time_ms = (time.time() - start_time) * 1000
 
-        # Create the plot
-        plt.figure(figsize=(12, 12))
-
-        # Plot the data and the regression line
-        plt.plot(x_interpolation, y_interpolation, zorder=3)
-        plt.plot(x, y, "bo", zorder=4)
-
-        plt.axvline(0, color="black", linewidth=0.5)
-        plt.axhline(0, color="black", linewidth=0.5)
-
-        plt.grid(True, linestyle="--", alpha=0.7)
-        plt.xlabel("x")
-        plt.ylabel("y")
-
-        if not x_value < max(x_interpolation) or not x_value > min(x_interpolation):
-            plt.plot(plot_extension_x, plot_extension_y, "r--", zorder=2)
-
-        plt.scatter(
-            x_value,
-            x_value_interpolated,
-            color="green",
-            zorder=5,
-            label="Interpolated point",
-        )
-
-        plt.legend()
-
-        # Save the plot to an SVG file with a transparent background
-        svg_buffer = BytesIO()
-        plt.savefig(
-            svg_buffer,
-            format="svg",
-            transparent=True,
-            bbox_inches="tight",
-            pad_inches=0,
-        )
-        svg_buffer.seek(0)
-        svg_plot = svg_buffer.read().decode("utf-8")
-
-        # Close the plot
-        plt.close()
+        # Arrays are pickled as raw buffers when the arguments are sent back from the worker
+        plot_args = {
+            "x": np.asarray(x, dtype=float),
+            "y": np.asarray(y, dtype=float),
+            "number_of_points": number_of_points,
+            "x_value": x_value,
+            "x_value_interpolated": x_value_interpolated,
+        }
+        plot_data = {
+            "x_interpolation": x_interpolation,
+            "y_interpolation": y_interpolation,
+            "plot_extension_x": plot_extension_x,
+            "plot_extension_y": plot_extension_y,
+        }
 
         # Return the results
         return {
             "x_value": x_value,
             "x_value_interpolated": x_value_interpolated,
             "execution_time_ms": execution_time_ms,
-            "plot_svg": svg_plot,
+            "plot_svg": render_newtons_interpolation_method_plot(
+                **plot_args, plot_data=plot_data
+            )
+            if plot == PlotMode.SVG
+            else None,
+            "plot_data": plot_data_to_json(plot_data)
+            if plot == PlotMode.DATA
+            else None,
+            "plot_args": plot_args if len(x) <= RESULT_CACHE_MAX_PLOT_POINTS else None,
         }
 
     except TimeoutError:
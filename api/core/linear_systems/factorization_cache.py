@@ -0,0 +1,95 @@
+import hashlib
+
+import numpy as np
+
+from api.constants import (
+    FACTORIZATION_CACHE_MAX_MEMORY_BYTES,
+    FACTORIZATION_CACHE_MAX_SIZE,
+)
+from core.helpers.lru_cache import LRUCache, LRUCacheStats
+
+
+def _nbytes(value) -> int:
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+
+    # Sparse matrices store their nonzeros in data, indices and indptr arrays
+    if hasattr(value, "indices"):
+        return sum(
+            _nbytes(getattr(value, name)) for name in ("data", "indices", "indptr")
+        )
+
+    # Sparse LU factorizations (SuperLU) store their factors as sparse matrices
+    if hasattr(value, "perm_r"):
+        return (
+            _nbytes(value.L)
+            + _nbytes(value.U)
+            + _nbytes(value.perm_r)
+            + _nbytes(value.perm_c)
+        )
+
+    return 64
+
+
+def _sizeof_factorization(factorization) -> int:
+    # Factorizations are tuples of arrays and scalar diagnostics, the arrays dominate the memory usage
+    return sum(_nbytes(value) for value in factorization)
+
+
+_cache = LRUCache(
+    max_size=FACTORIZATION_CACHE_MAX_SIZE,
+    max_memory_bytes=FACTORIZATION_CACHE_MAX_MEMORY_BYTES,
+    sizeof=_sizeof_factorization,
+)
+
+
+def matrix_key(kind: str, matrix) -> tuple:
+    """
+    Create a cache key identifying a factorization of a matrix by its contents.
+
+    :param kind:    Kind of the factorization, for example "lu" or "qr".
+    :param matrix:  The factorized matrix as a NumPy array or a SciPy sparse matrix in canonical CSR format.
+
+    :return: A hashable key containing the kind, shape, data type and a hash of the matrix bytes.
+    """
+    if hasattr(matrix, "indptr"):
+        arrays = [matrix.indptr, matrix.indices, matrix.data]
+        kind = f"sparse_{kind}"
+    else:
+        arrays = [matrix]
+
+    digest = hashlib.sha256()
+    for array in arrays:
+        digest.update(np.ascontiguousarray(array).data)
+
+    return kind, matrix.shape, matrix.dtype.str, digest.hexdigest()
+
+
+def get_factorization(kind: str, matrix, factorize):
+    """
+    Get a cached factorization of a matrix or factorize the matrix and cache the result.
+
+    :param kind:        Kind of the factorization, for example "lu" or "qr".
+    :param matrix:      The matrix to factorize as a NumPy array or a SciPy sparse matrix in canonical CSR format.
+    :param factorize:   Function factorizing the matrix, returning a tuple of arrays and diagnostics.
+
+    :return: A tuple of the factorization and whether it was taken from the cache.
+    """
+    key = matrix_key(kind, matrix)
+
+    factorization = _cache.get(key)
+    if factorization is not None:
+        return factorization, True
+
+    factorization = factorize(matrix)
+    _cache.put(key, factorization)
+    return factorization, False
+
+
+def get_factorization_cache_stats() -> LRUCacheStats:
+    """
+    Get hit, miss and eviction counters of the matrix factorization cache of the current process.
+
+    :return: The cache statistics.
+    """
+    return _cache.stats()
@@ -1,17 +1,64 @@
-import json
+import inspect
 import time
+from enum import Enum
 
 import numpy as np
 from fastapi import HTTPException
 from pydantic import BaseModel
-from timeout_decorator import timeout
 
 from api.constants import CALCULATION_TIMEOUT, CALCULATION_TIMEOUT_ERROR_MESSAGE
+from core.helpers.deadline import check_deadline, with_deadline
+from core.linear_systems.matrix_input import (
+    is_sparse,
+    LinearSystemRequest,
+    load_linear_system,
+    SparseMatrix,
+)
+
+
+class FixedPointIterationSystemMethod(Enum):
+    JACOBI = "jacobi"
+    GAUSS_SEIDEL = "gauss_seidel"
+    SOR = "sor"
+    CG = "cg"
+    GMRES = "gmres"
+    BICGSTAB = "bicgstab"
+
+
+class Preconditioner(Enum):
+    NONE = "none"
+    JACOBI = "jacobi"
+    ILU = "ilu"
+
+
+SPLITTING_METHODS = (
+    FixedPointIterationSystemMethod.JACOBI,
+    FixedPointIterationSystemMethod.GAUSS_SEIDEL,
+    FixedPointIterationSystemMethod.SOR,
+)
+
+# Limits of the Arnoldi iteration computing the spectral radius of the iteration matrix, the spectral radius
+# is reported as unknown when it has not converged within them
+SPECTRAL_RADIUS_MAX_RESTARTS = 10
+SPECTRAL_RADIUS_KRYLOV_DIMENSION = 20
+SPECTRAL_RADIUS_TOLERANCE = 1e-6
+
+
+class FixedPointIterationSystemMethodRequest(LinearSystemRequest):
+    constants: list[float]
+    tol: float = 1e-6
+    max_iter: int = 100
+    method: FixedPointIterationSystemMethod = FixedPointIterationSystemMethod.JACOBI
+    omega: float = 1.0
+    preconditioner: Preconditioner = Preconditioner.NONE
 
 
 class FixedPointIterationSystemMethodResponse(BaseModel):
     roots: list[float]
     iterations: int
+    diagonally_dominant: bool
+    spectral_radius: float | None
+    convergence_history: list[float]
     execution_time_ms: float
 
     model_config = {
@@ -20,6 +67,9 @@ class FixedPointIterationSystemMethodResponse(BaseModel):
                 {
                     "roots": [1.0, 2.0, 3.0],
                     "iterations": 4,
+                    "diagonally_dominant": True,
+                    "spectral_radius": 0.25,
+                    "convergence_history": [3.5, 0.8, 0.01, 1e-7],
                     "execution_time_ms": 0.05000114440917969,
                 }
             ]
@@ -27,71 +77,395 @@ class FixedPointIterationSystemMethodResponse(BaseModel):
     }
 
 
+def split_matrix(A):
+    """
+    Split a matrix into its diagonal, strictly lower and strictly upper triangular parts.
+
+    :param A:   Square matrix as a dense array or a SciPy sparse matrix.
+
+    :return: The diagonal as a vector and the strictly lower and upper triangular matrices.
+    """
+    if is_sparse(A):
+        # Import SciPy on first use, it is slow to import
+        from scipy.sparse import tril, triu
+
+        return A.diagonal(), tril(A, -1, format="csr"), triu(A, 1, format="csr")
+
+    return np.diag(A).copy(), np.tril(A, -1), np.triu(A, 1)
+
+
+def is_diagonally_dominant(A) -> bool:
+    """
+    Check if a matrix is strictly diagonally dominant by rows.
+
+    :param A:   Square matrix as a dense array or a SciPy sparse matrix.
+
+    :return: True if every diagonal entry is larger in absolute value than the sum of the rest of its row.
+    """
+    diagonal = np.abs(A.diagonal())
+    off_diagonal_sums = np.asarray(abs(A).sum(axis=1)).ravel() - diagonal
+    return bool(np.all(diagonal > off_diagonal_sums))
+
+
+def is_symmetric(A) -> bool:
+    """
+    Check if a matrix is symmetric up to rounding errors.
+
+    :param A:   Square matrix as a dense array or a SciPy sparse matrix.
+
+    :return: True if the matrix is symmetric.
+    """
+    if A.shape[0] == 0:
+        return True
+
+    largest_entry = abs(A).max()
+    return bool(abs(A - A.T).max() <= largest_entry * 100 * np.finfo(float).eps)
+
+
+def splitting_step(A, b: np.ndarray, method: FixedPointIterationSystemMethod, omega):
+    """
+    Create the function computing one iteration of a splitting method.
+
+    :param A:       Square matrix with a non-zero diagonal as a dense array or a SciPy sparse matrix.
+    :param b:       Constant vector.
+    :param method:  The splitting method.
+    :param omega:   Relaxation factor of the SOR method.
+
+    :return: A function mapping the current approximation to the next one.
+    """
+    # Import SciPy on first use, it is slow to import
+    from scipy.linalg import solve_triangular
+    from scipy.sparse import diags
+    from scipy.sparse.linalg import spsolve_triangular
+
+    D, L, U = split_matrix(A)
+
+    if method == FixedPointIterationSystemMethod.JACOBI:
+        R = L + U
+
+        def step(x):
+            return (b - R @ x) / D
+
+        return step
+
+    if method == FixedPointIterationSystemMethod.GAUSS_SEIDEL:
+        omega = 1.0
+
+    # (D + omega L) x_{k+1} = omega b - (omega U + (omega - 1) D) x_k
+    if is_sparse(A):
+        lower = (diags(D) + omega * L).tocsr()
+        upper = (omega * U + diags((omega - 1) * D)).tocsr()
+
+        def step(x):
+            return spsolve_triangular(lower, omega * b - upper @ x, lower=True)
+
+    else:
+        lower = np.diag(D) + omega * L
+        upper = omega * U + np.diag((omega - 1) * D)
+
+        def step(x):
+            return solve_triangular(
+                lower, omega * b - upper @ x, lower=True, check_finite=False
+            )
+
+    return step
+
+
+def estimate_spectral_radius(
+    A, method: FixedPointIterationSystemMethod, omega
+) -> float | None:
+    """
+    Compute the spectral radius of the iteration matrix M of a splitting method with the Arnoldi iteration of ARPACK.
+
+    M is never formed, one iteration of the method with a zero constant vector maps the error e_k to M e_k,
+    so each Arnoldi step is O(nnz) instead of the O(n^3) eigenvalue decomposition of a dense matrix.
+
+    :param A:       Square matrix with a non-zero diagonal as a dense array or a SciPy sparse matrix.
+    :param method:  The splitting method.
+    :param omega:   Relaxation factor of the SOR method.
+
+    :return: The spectral radius or None if it did not converge, for example for strongly non-normal matrices.
+    """
+    # Import SciPy on first use, it is slow to import
+    from scipy.sparse.linalg import ArpackNoConvergence, eigs, LinearOperator
+
+    n = A.shape[0]
+    step = splitting_step(A, np.zeros(n), method, omega)
+
+    if n < 3:
+        # ARPACK needs at least three dimensions, the iteration matrix of a tiny system is formed directly
+        iteration_matrix = np.column_stack([step(column) for column in np.eye(n)])
+        return float(np.abs(np.linalg.eigvals(iteration_matrix)).max())
+
+    def matvec(x):
+        check_deadline()
+        return step(np.ravel(x))
+
+    try:
+        eigenvalues = eigs(
+            LinearOperator((n, n), matvec=matvec, dtype=float),
+            k=1,
+            which="LM",
+            ncv=min(n - 1, SPECTRAL_RADIUS_KRYLOV_DIMENSION),
+            maxiter=SPECTRAL_RADIUS_MAX_RESTARTS,
+            tol=SPECTRAL_RADIUS_TOLERANCE,
+            v0=np.ones(n),
+            return_eigenvectors=False,
+        )
+    except ArpackNoConvergence:
+        return None
+
+    return float(np.abs(eigenvalues).max())
+
+
+def splitting_iteration(
+    A, b: np.ndarray, tol, max_iter, method: FixedPointIterationSystemMethod, omega
+):
+    """
+    Iterate a splitting method until the update is smaller than the tolerance.
+
+    Each iteration costs one matrix-vector product (Jacobi) or one triangular solve (Gauss-Seidel, SOR),
+    so it is O(nnz) instead of solving the system directly.
+
+    :param A:           Square matrix with a non-zero diagonal as a dense array or a SciPy sparse matrix.
+    :param b:           Constant vector.
+    :param tol:         Tolerance for the norm of the update.
+    :param max_iter:    Maximum number of iterations.
+    :param method:      The splitting method.
+    :param omega:       Relaxation factor of the SOR method.
+
+    :return: The roots, iteration count and the norms of the updates.
+    """
+    step = splitting_step(A, b, method, omega)
+    convergence_history = []
+
+    x = np.zeros_like(b)
+
+    for iteration in range(max_iter):
+        check_deadline()
+
+        x_new = step(x)
+
+        difference = float(np.linalg.norm(x_new - x))
+        convergence_history.append(difference)
+
+        if not np.isfinite(difference):
+            raise ValueError(
+                f"The method diverged after {iteration + 1} iterations. Check that the coefficient matrix is diagonally dominant."
+            )
+
+        if difference < tol:
+            return x_new, iteration + 1, convergence_history
+
+        x = x_new
+
+    return x, max_iter, convergence_history
+
+
+def _relative_tolerance(solver, tol) -> dict:
+    # SciPy 1.12 renamed the relative tolerance of the Krylov solvers from tol to rtol
+    name = "rtol" if "rtol" in inspect.signature(solver).parameters else "tol"
+    return {name: tol}
+
+
+def krylov_iteration(
+    A,
+    b: np.ndarray,
+    tol,
+    max_iter,
+    method: FixedPointIterationSystemMethod,
+    preconditioner: Preconditioner,
+):
+    """
+    Solve a system of linear equations with a preconditioned Krylov subspace method.
+
+    :param A:               Square matrix as a dense array or a SciPy sparse matrix.
+    :param b:               Constant vector.
+    :param tol:             Tolerance for the relative residual norm.
+    :param max_iter:        Maximum number of iterations (restart cycles for GMRES).
+    :param method:          The Krylov method.
+    :param preconditioner:  The preconditioner.
+
+    :return: The roots, iteration count and the relative residual norms.
+    """
+    # Import SciPy on first use, it is slow to import
+    from scipy.sparse import csc_array
+    from scipy.sparse.linalg import bicgstab, cg, gmres, LinearOperator, spilu
+
+    if method == FixedPointIterationSystemMethod.CG and not is_symmetric(A):
+        raise ValueError(
+            "The conjugate gradient method requires a symmetric positive definite coefficient matrix."
+        )
+
+    M = None
+    if preconditioner == Preconditioner.JACOBI:
+        D = A.diagonal()
+        M = LinearOperator(A.shape, matvec=lambda x: x / D, dtype=float)
+    elif preconditioner == Preconditioner.ILU:
+        ilu = spilu(csc_array(A))
+        M = LinearOperator(A.shape, matvec=ilu.solve, dtype=float)
+
+    b_norm = np.linalg.norm(b) or 1.0
+    convergence_history = []
+
+    def callback(value):
+        check_deadline()
+
+        # GMRES reports the residual norm itself, the other methods report the current approximation
+        if method == FixedPointIterationSystemMethod.GMRES:
+            convergence_history.append(float(value))
+        else:
+            convergence_history.append(float(np.linalg.norm(b - A @ value) / b_norm))
+
+    solver = {
+        FixedPointIterationSystemMethod.CG: cg,
+        FixedPointIterationSystemMethod.GMRES: gmres,
+        FixedPointIterationSystemMethod.BICGSTAB: bicgstab,
+    }[method]
+
+    options = {}
+    if method == FixedPointIterationSystemMethod.GMRES:
+        options["callback_type"] = "pr_norm"
+
+    x, info = solver(
+        A,
+        b,
+        M=M,
+        maxiter=max_iter,
+        callback=callback,
+        **_relative_tolerance(solver, tol),
+        **options,
+    )
+
+    if info < 0:
+        raise ValueError(
+            f"The {method.value} method broke down. Try another method or preconditioner."
+        )
+
+    return x, len(convergence_history), convergence_history
+
+
 def fixed_point_iteration_system_method_implementation(
-    coefficient_matrix, constants, tol, max_iter
+    coefficient_matrix,
+    constants,
+    tol,
+    max_iter,
+    method: FixedPointIterationSystemMethod = FixedPointIterationSystemMethod.JACOBI,
+    omega: float = 1.0,
+    preconditioner: Preconditioner = Preconditioner.NONE,
 ):
     """
-    Find the roots of a system of linear equations using fixed-point iteration method.
+    Find the roots of a system of linear equations using a splitting or Krylov subspace iteration method.
 
-    :param coefficient_matrix:   Coefficient matrix.
+    Sparse matrices are never densified, so memory stays proportional to the number of nonzeros.
+
+    :param coefficient_matrix:   Coefficient matrix as a dense array or a SciPy sparse matrix.
     :param constants:           Constant vector.
     :param tol:                 Tolerance for convergence.
     :param max_iter:            Maximum number of iterations.
+    :param method:              The iteration method.
+    :param omega:               Relaxation factor of the SOR method.
+    :param preconditioner:      Preconditioner of the Krylov methods.
 
-    :return: A list of roots and iteration count.
+    :return: A list of roots, iteration count and a dictionary with the convergence diagnostics.
     """
+    A = coefficient_matrix
+    if not is_sparse(A):
+        A = np.asarray(A, dtype=float)
+    b = np.asarray(constants, dtype=float)
 
-    A = np.array(coefficient_matrix, dtype=float)
-    b = np.array(constants, dtype=float)
-
-    x = np.zeros_like(b)
+    if (
+        method in SPLITTING_METHODS or preconditioner == Preconditioner.JACOBI
+    ) and np.any(A.diagonal() == 0):
+        raise ValueError(
+            "Diagonal of the coefficient matrix must not contain zeros. Reorder the equations."
+        )
 
-    for iteration in range(max_iter):
-        x_new = np.linalg.inv(A) @ (b - (A @ x))
+    # Strict diagonal dominance guarantees convergence of the Jacobi, Gauss-Seidel and under-relaxed SOR methods
+    diagonally_dominant = is_diagonally_dominant(A)
+    guaranteed_convergence = diagonally_dominant and (
+        method != FixedPointIterationSystemMethod.SOR or 0 < omega <= 1
+    )
 
-        if np.linalg.norm(x_new - x) < tol:
-            return x_new, iteration + 1
+    # The spectral radius is only a diagnostic, divergence is detected by the iteration itself
+    spectral_radius = None
+    if method in SPLITTING_METHODS and not guaranteed_convergence:
+        spectral_radius = estimate_spectral_radius(A, method, omega)
 
-        x = x_new
+    if method in SPLITTING_METHODS:
+        x, iterations, convergence_history = splitting_iteration(
+            A, b, tol, max_iter, method, omega
+        )
+    else:
+        x, iterations, convergence_history = krylov_iteration(
+            A, b, tol, max_iter, method, preconditioner
+        )
 
-    return x, max_iter
+    return (
+        x,
+        iterations,
+        {
+            "diagonally_dominant": diagonally_dominant,
+            "spectral_radius": spectral_radius,
+            "convergence_history": convergence_history,
+        },
+    )
 
 
-@timeout(
-    CALCULATION_TIMEOUT,
-    timeout_exception=TimeoutError,
-)
+@with_deadline(CALCULATION_TIMEOUT)
 def fixed_point_iteration_system_method(
-    coefficient_matrix: str, constants: str, tol: float = 1e-6, max_iter: int = 100
+    coefficient_matrix: str | list[list[float]] | SparseMatrix,
+    constants: str | list[float],
+    tol: float = 1e-6,
+    max_iter: int = 100,
+    method: FixedPointIterationSystemMethod = FixedPointIterationSystemMethod.JACOBI,
+    omega: float = 1.0,
+    preconditioner: Preconditioner = Preconditioner.NONE,
 ):
     """
     Find the roots of a system of linear equations using fixed-point iteration method.
 
-    :param coefficient_matrix:   Coefficient matrix as a JSON array of arrays.
+    :param coefficient_matrix:   Coefficient matrix as a JSON array of arrays or sparse matrix triplets in COO or CSR format.
     :param constants:           Constant vector as a JSON array.
     :param tol:                 Tolerance for convergence.
     :param max_iter:            Maximum number of iterations.
+    :param method:              The iteration method.
+    :param omega:               Relaxation factor of the SOR method.
+    :param preconditioner:      Preconditioner of the Krylov methods.
 
-    :return: A list of roots and execution time.
+    :return: A list of roots, iteration count, convergence diagnostics and execution time.
     """
 
     try:
-        # Parse JSON to array
-        coefficient_matrix = json.loads(coefficient_matrix)
-        constants = json.loads(constants)
+        # Parse JSON and sparse matrix triplets to arrays
+        A, b = load_linear_system(coefficient_matrix, constants)
 
-        # Check if the coefficient matrix and constant vector have the same number of rows
-        if len(coefficient_matrix) != len(constants):
-            raise ValueError(
-                "Coefficient matrix and constant vector must have the same number of rows."
-            )
+        # Check if the coefficient matrix is square
+        if A.shape[0] != A.shape[1]:
+            raise ValueError("Coefficient matrix must be square.")
+
+        if b.ndim != 1:
+            raise ValueError("Constants must be a vector.")
+
+        if tol <= 0:
+            raise ValueError("Tolerance must be positive.")
+
+        if max_iter <= 0:
+            raise ValueError("Maximum number of iterations must be greater than zero.")
+
+        if not 0 < omega < 2:
+            raise ValueError("Relaxation factor must be between 0 and 2.")
 
         # Measure execution time
         start_time = time.time()
 
         # Fixed-point iteration method implementation
-        roots, iterations = fixed_point_iteration_system_method_implementation(
-            coefficient_matrix, constants, tol, max_iter
+        (
+            roots,
+            iterations,
+            diagnostics,
+        ) = fixed_point_iteration_system_method_implementation(
+            A, b, tol, max_iter, method, omega, preconditioner
         )
 
         # Measure execution time
@@ -101,6 +475,7 @@ def fixed_point_iteration_system_method(
         return {
             "roots": roots.tolist(),
             "iterations": iterations,
+            **diagnostics,
             "execution_time_ms": execution_time_ms,
         }
 
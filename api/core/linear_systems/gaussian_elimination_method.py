@@ -1,17 +1,27 @@
-import json
 import time
+import warnings
 
 import numpy as np
 from fastapi import HTTPException
 from pydantic import BaseModel
-from timeout_decorator import timeout
 
 from api.constants import CALCULATION_TIMEOUT, CALCULATION_TIMEOUT_ERROR_MESSAGE
+from core.helpers.deadline import with_deadline
+from core.linear_systems.factorization_cache import get_factorization
+from core.linear_systems.matrix_input import (
+    is_sparse,
+    load_linear_system,
+    SparseMatrix,
+)
 
 
 class GaussianEliminationMethodResponse(BaseModel):
-    roots: list[float]
-    iterations: int
+    roots: list[float] | list[list[float]]
+    condition_number: float
+    row_swaps: int
+    smallest_pivot: float
+    largest_pivot: float
+    factorization_cached: bool
     execution_time_ms: float
 
     model_config = {
@@ -19,7 +29,11 @@ class GaussianEliminationMethodResponse(BaseModel):
             "examples": [
                 {
                     "roots": [1.0, 2.0, 3.0],
-                    "iterations": 4,
+                    "condition_number": 12.5,
+                    "row_swaps": 1,
+                    "smallest_pivot": 0.6666666666666667,
+                    "largest_pivot": 3.0,
+                    "factorization_cached": False,
                     "execution_time_ms": 0.05000114440917969,
                 }
             ]
@@ -27,112 +41,180 @@ class GaussianEliminationMethodResponse(BaseModel):
     }
 
 
-def gaussian_elimination_method_implementation(coefficient_matrix, constants):
+def lu_factorization(A: np.ndarray):
     """
-    Find the roots of a system of linear equations using Gaussian elimination method.
+    Factorize a coefficient matrix with partial pivoting and compute the pivot and condition diagnostics.
 
-    :param coefficient_matrix:   Coefficient matrix.
-    :param constants:   Constant vector.
+    The elimination is done by the LAPACK LU factorization (getrf), so each pivot step is a vectorized row operation
+    on the whole remaining submatrix and the roots keep full float64 precision.
 
-    :return: A list of roots and iteration count.
+    :param A:   Coefficient matrix.
+
+    :return: The LU factors, the pivot indices and a dictionary with the pivot and condition diagnostics.
     """
+    # Import SciPy on first use, it is slow to import
+    from scipy.linalg import LinAlgWarning, lapack, lu_factor
+
+    # Singular matrices are reported below with a clearer message than the LAPACK warning
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", LinAlgWarning)
+        lu, pivots = lu_factor(A, check_finite=True)
 
-    A = coefficient_matrix
-    b = constants
-
-    A_temp = np.array(A, dtype=int)
-    det = np.linalg.det(A_temp)
-
-    iterations = 0
-
-    n = len(A)
-    for i in range(n):
-        max_row = i
-        for k in range(i + 1, n):
-            if abs(A[k][i]) > abs(A[max_row][i]):
-                max_row = k
-            iterations += 1
-        A[i], A[max_row] = A[max_row], A[i]
-        b[i], b[max_row] = b[max_row], b[i]
-
-        pivot = A[i][i]
-        if pivot == 0:
-            raise ValueError(
-                "The system has no unique solution. Division by zero occurred in runtime."
-            )
-
-        for k in range(i, n):
-            A[i][k] /= pivot
-            iterations += 1
-        b[i] /= pivot
-
-        for k in range(n):
-            if k != i:
-                factor = A[k][i]
-                for j in range(i, n):
-                    A[k][j] -= factor * A[i][j]
-                    iterations += 1
-                b[k] -= factor * b[i]
-
-        for i in range(n):
-            for j in range(n):
-                A[i][j] = round(A[i][j], 3)
-                iterations += 1
-            b[i] = round(b[i], 3)
-
-    if np.abs(det) <= 1e-6:
+    pivot_values = np.abs(np.diag(lu))
+    largest_pivot = pivot_values.max()
+    smallest_pivot = pivot_values.min()
+
+    if smallest_pivot <= largest_pivot * len(A) * np.finfo(float).eps:
         raise ValueError(
-            f"Determinant is zero. The system of linear equations has infinite number of solutions. One of the solutions is {b}"
+            "Determinant is zero. The system of linear equations has no unique solution."
         )
 
-    return b, iterations
+    # Estimate the condition number from the LU factors in O(n^2) instead of computing the inverse
+    reciprocal_condition_number, _ = lapack.dgecon(lu, np.linalg.norm(A, 1), norm="1")
 
+    return (
+        lu,
+        pivots,
+        {
+            "condition_number": 1 / reciprocal_condition_number
+            if reciprocal_condition_number > 0
+            else float("inf"),
+            "row_swaps": int(np.count_nonzero(pivots != np.arange(len(pivots)))),
+            "smallest_pivot": float(smallest_pivot),
+            "largest_pivot": float(largest_pivot),
+        },
+    )
 
-@timeout(
-    CALCULATION_TIMEOUT,
-    timeout_exception=TimeoutError,
-)
-def gaussian_elimination_method(coefficient_matrix: str, constants: str):
+
+def sparse_lu_factorization(A):
+    """
+    Factorize a sparse coefficient matrix with the SuperLU sparse direct solver and compute the diagnostics.
+
+    The column ordering of SuperLU keeps the fill-in low, so memory stays proportional to the nonzeros of the factors.
+
+    :param A:   Sparse coefficient matrix.
+
+    :return: The SuperLU factorization and a dictionary with the pivot and condition diagnostics.
+    """
+    # Import SciPy on first use, it is slow to import
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import connected_components
+    from scipy.sparse.linalg import LinearOperator, onenormest, splu
+
+    try:
+        lu = splu(A.tocsc())
+    except RuntimeError:
+        # SuperLU reports exactly singular matrices with a RuntimeError
+        raise ValueError(
+            "Determinant is zero. The system of linear equations has no unique solution."
+        )
+
+    pivot_values = np.abs(lu.U.diagonal())
+    largest_pivot = pivot_values.max()
+    smallest_pivot = pivot_values.min()
+
+    if smallest_pivot <= largest_pivot * A.shape[0] * np.finfo(float).eps:
+        raise ValueError(
+            "Determinant is zero. The system of linear equations has no unique solution."
+        )
+
+    # Estimate the condition number with a few solves instead of forming the dense inverse
+    inverse = LinearOperator(
+        A.shape,
+        matvec=lu.solve,
+        rmatvec=lambda x: lu.solve(x, trans="T"),
+        dtype=float,
+    )
+
+    # A permutation with c cycles is a product of n - c row swaps, the cycles are the components of its graph
+    n = len(lu.perm_r)
+    permutation_graph = csr_matrix(
+        (np.ones(n), (np.arange(n), lu.perm_r)), shape=(n, n)
+    )
+    cycles, _ = connected_components(permutation_graph, directed=False)
+
+    return (
+        lu,
+        {
+            "condition_number": float(onenormest(A) * onenormest(inverse)),
+            "row_swaps": int(n - cycles),
+            "smallest_pivot": float(smallest_pivot),
+            "largest_pivot": float(largest_pivot),
+        },
+    )
+
+
+def gaussian_elimination_method_implementation(coefficient_matrix, constants):
+    """
+    Find the roots of a system of linear equations using Gaussian elimination with partial pivoting.
+
+    The LU factorization of the coefficient matrix is cached, so repeated solves with the same matrix
+    only need the O(n^2) forward and back substitution.
+
+    :param coefficient_matrix:   Coefficient matrix as a dense array or a SciPy sparse matrix.
+    :param constants:   Constant vector or matrix with one right-hand side per column.
+
+    :return: The roots and a dictionary with the pivot and condition diagnostics.
+    """
+    # Import SciPy on first use, it is slow to import
+    from scipy.linalg import lu_solve
+
+    b = np.asarray(constants, dtype=float)
+
+    if is_sparse(coefficient_matrix):
+        (lu, diagnostics), factorization_cached = get_factorization(
+            "lu", coefficient_matrix, sparse_lu_factorization
+        )
+        roots = lu.solve(b)
+    else:
+        A = np.asarray(coefficient_matrix, dtype=float)
+
+        (lu, pivots, diagnostics), factorization_cached = get_factorization(
+            "lu", A, lu_factorization
+        )
+        roots = lu_solve((lu, pivots), b, check_finite=False)
+
+    return roots, {**diagnostics, "factorization_cached": factorization_cached}
+
+
+@with_deadline(CALCULATION_TIMEOUT)
+def gaussian_elimination_method(
+    coefficient_matrix: str | list[list[float]] | SparseMatrix,
+    constants: str | list[float] | list[list[float]],
+):
     """
     Find the roots of a system of linear equations using Gaussian elimination method.
 
-    :param coefficient_matrix:   Coefficient matrix as a JSON array of arrays.
-    :param constants:   Constant vector as a JSON array.
+    :param coefficient_matrix:   Coefficient matrix as a JSON array of arrays or sparse matrix triplets in COO or CSR format.
+    :param constants:   Constant vector as a JSON array or a matrix with one right-hand side per column as a JSON array of arrays.
 
-    :return: A list of roots and execution time.
+    :return: The roots, pivot and condition diagnostics and execution time.
     """
 
     try:
-        # Parse JSON to array
-        coefficient_matrix = json.loads(coefficient_matrix)
-        constants = json.loads(constants)
+        # Parse JSON and sparse matrix triplets to arrays
+        A, b = load_linear_system(coefficient_matrix, constants)
 
         # Check if the coefficient matrix is square
-        for row in coefficient_matrix:
-            if len(row) != len(coefficient_matrix):
-                raise ValueError("Coefficient matrix must be square.")
+        if A.shape[0] != A.shape[1]:
+            raise ValueError("Coefficient matrix must be square.")
 
-        # Check if the coefficient matrix and constant vector have the same number of rows
-        if len(coefficient_matrix) != len(constants):
-            raise ValueError(
-                "Coefficient matrix and constant vector must have the same number of rows."
-            )
+        # Import SciPy before measuring execution time, it is slow to import
+        import scipy.linalg  # noqa: F401
 
         # Measure execution time
         start_time = time.time()
 
         # Gaussian elimination method implementation
-        roots, iterations = gaussian_elimination_method_implementation(
-            coefficient_matrix, constants
-        )
+        roots, diagnostics = gaussian_elimination_method_implementation(A, b)
 
         # Measure execution time
         execution_time_ms = (time.time() - start_time) * 1000
 
         # Return the results
         return {
-            "roots": roots,
-            "iterations": iterations,
+            "roots": roots.tolist(),
+            **diagnostics,
             "execution_time_ms": execution_time_ms,
         }
 
@@ -1,16 +1,46 @@
-import json
 import time
+from enum import Enum
 
 import numpy as np
 from fastapi import HTTPException
 from pydantic import BaseModel
-from timeout_decorator import timeout
 
 from api.constants import CALCULATION_TIMEOUT, CALCULATION_TIMEOUT_ERROR_MESSAGE
+from core.helpers.deadline import check_deadline, with_deadline
+from core.linear_systems.factorization_cache import get_factorization
+from core.linear_systems.matrix_input import (
+    is_sparse,
+    LinearSystemRequest,
+    load_linear_system,
+    SparseMatrix,
+)
+
+
+class LeastSquaresSolver(Enum):
+    AUTO = "auto"
+    QR = "qr"
+    SVD = "svd"
+    CHOLESKY = "cholesky"
+    LSMR = "lsmr"
+
+
+# Normal equations square the condition number, so they are only used for well-conditioned matrices
+NORMAL_EQUATIONS_MAX_CONDITION_NUMBER = 1e6
+
+# Stopping tolerance of the iterative LSMR solver used for sparse matrices
+LSMR_TOLERANCE = 1e-10
+
+
+class LeastSquaresMethodRequest(LinearSystemRequest):
+    solver: LeastSquaresSolver = LeastSquaresSolver.AUTO
 
 
 class LeastSquaresMethodResponse(BaseModel):
-    roots: list[float]
+    roots: list[float] | list[list[float]]
+    residual_norm: float | list[float]
+    rank: int | None
+    solver: LeastSquaresSolver
+    factorization_cached: bool
     execution_time_ms: float
 
     model_config = {
@@ -18,6 +48,10 @@ class LeastSquaresMethodResponse(BaseModel):
             "examples": [
                 {
                     "roots": [1.0, 2.0, 3.0],
+                    "residual_norm": 1.1102230246251565e-15,
+                    "rank": 3,
+                    "solver": "cholesky",
+                    "factorization_cached": False,
                     "execution_time_ms": 0.05000114440917969,
                 }
             ]
@@ -25,57 +59,244 @@ class LeastSquaresMethodResponse(BaseModel):
     }
 
 
-def least_squares_method_implementation(coefficient_matrix, constants):
+def cholesky_factorization(A: np.ndarray):
     """
-    Find the roots of a system of linear equations using least squares method.
+    Factorize the matrix of the normal equations AtA with the Cholesky decomposition.
 
-    :param coefficient_matrix:   Coefficient matrix.
-    :param constants:   Constant vector.
+    :param A:   Coefficient matrix with at least as many rows as columns.
 
-    :return: A list of roots.
+    :return: The upper triangular Cholesky factor and the estimated condition number of AtA.
     """
+    # Import SciPy on first use, it is slow to import
+    from scipy.linalg import LinAlgError, cho_factor, lapack
 
-    A = np.array(coefficient_matrix, dtype=float)
-    b = np.array(constants, dtype=float)
+    AtA = A.T @ A
 
-    AT = A.transpose()
-    AtA = AT @ A
-    AtB = AT @ b
-    AtA_inv = np.linalg.inv(AtA)
+    try:
+        c, _ = cho_factor(AtA, lower=False, check_finite=True)
+    except LinAlgError:
+        raise ValueError(
+            "Columns of the coefficient matrix are linearly dependent. The least squares solution is not unique."
+        )
 
-    return AtA_inv @ AtB
+    # Estimate the condition number from the Cholesky factor in O(n^2)
+    reciprocal_condition_number, _ = lapack.dpocon(c, np.linalg.norm(AtA, 1))
+    condition_number = (
+        1 / reciprocal_condition_number
+        if reciprocal_condition_number > 0
+        else float("inf")
+    )
 
+    return c, condition_number
 
-@timeout(
-    CALCULATION_TIMEOUT,
-    timeout_exception=TimeoutError,
-)
-def least_squares_method(coefficient_matrix: str, constants: str):
+
+def qr_factorization(A: np.ndarray):
+    """
+    Factorize a coefficient matrix into an orthogonal and an upper triangular matrix.
+
+    :param A:   Coefficient matrix with at least as many rows as columns.
+
+    :return: The economic Q and R factors.
+    """
+    # Import SciPy on first use, it is slow to import
+    from scipy.linalg import qr
+
+    Q, R = qr(A, mode="economic", check_finite=True)
+
+    diagonal = np.abs(np.diag(R))
+    if diagonal.min() <= diagonal.max() * max(A.shape) * np.finfo(float).eps:
+        raise ValueError(
+            "Columns of the coefficient matrix are linearly dependent. The least squares solution is not unique."
+        )
+
+    return Q, R
+
+
+def svd_factorization(A: np.ndarray):
+    """
+    Factorize a coefficient matrix with the singular value decomposition.
+
+    :param A:   Coefficient matrix of any shape.
+
+    :return: The economic U, singular values and Vt factors and the numerical rank of the matrix.
+    """
+    # Import SciPy on first use, it is slow to import
+    from scipy.linalg import svd
+
+    U, s, Vt = svd(A, full_matrices=False, check_finite=True)
+
+    rank = int(
+        np.count_nonzero(s > s.max(initial=0) * max(A.shape) * np.finfo(float).eps)
+    )
+
+    return U, s, Vt, rank
+
+
+def auto_factorization(A: np.ndarray):
+    """
+    Choose the fastest accurate solver for a coefficient matrix and factorize the matrix with it.
+
+    Overdetermined well-conditioned systems use the normal equations, which only need one pass over the rows of A.
+    Ill-conditioned systems fall back to QR and rank-deficient or underdetermined systems to SVD.
+
+    :param A:   Coefficient matrix.
+
+    :return: The chosen solver followed by its factors.
+    """
+    if A.shape[0] >= A.shape[1]:
+        try:
+            c, condition_number = cholesky_factorization(A)
+            if condition_number <= NORMAL_EQUATIONS_MAX_CONDITION_NUMBER:
+                return LeastSquaresSolver.CHOLESKY, c, condition_number
+
+            return LeastSquaresSolver.QR, *qr_factorization(A)
+        except ValueError:
+            pass
+
+    return LeastSquaresSolver.SVD, *svd_factorization(A)
+
+
+def lsmr_solve(A, b: np.ndarray) -> np.ndarray:
+    """
+    Find the least squares solution with the iterative LSMR solver, which only needs products with A and At.
+
+    :param A:   Coefficient matrix as a dense array or a SciPy sparse matrix.
+    :param b:   Constant vector or matrix with one right-hand side per column.
+
+    :return: The roots.
+    """
+    # Import SciPy on first use, it is slow to import
+    from scipy.sparse.linalg import lsmr
+
+    roots = []
+    for column in b.reshape(len(b), -1).T:
+        check_deadline()
+        x, istop, iterations = lsmr(
+            A, column, atol=LSMR_TOLERANCE, btol=LSMR_TOLERANCE
+        )[:3]
+
+        # LSMR stops with istop 7 when it reaches the iteration limit before meeting the tolerance
+        if istop == 7:
+            raise ValueError(
+                f"The LSMR solver did not converge in {iterations} iterations. Try the QR or SVD solver."
+            )
+
+        roots.append(x)
+
+    return np.column_stack(roots).reshape((A.shape[1],) + b.shape[1:])
+
+
+def least_squares_method_implementation(
+    coefficient_matrix, constants, solver: LeastSquaresSolver = LeastSquaresSolver.AUTO
+):
     """
     Find the roots of a system of linear equations using least squares method.
 
-    :param coefficient_matrix:   Coefficient matrix as a JSON array of arrays.
-    :param constants:   Constant vector as a JSON array.
+    The factorization of the coefficient matrix is cached, so repeated solves with the same matrix
+    only need matrix products and triangular solves.
+
+    :param coefficient_matrix:   Coefficient matrix as a dense array or a SciPy sparse matrix.
+    :param constants:   Constant vector or matrix with one right-hand side per column.
+    :param solver:  Solver to use. The automatic choice depends on the shape and conditioning of the matrix.
 
-    :return: A list of roots and execution time.
+    :return: The roots, the residual norm, the rank of the matrix (None for LSMR), the used solver and whether the factorization was taken from the cache.
     """
+    # Import SciPy on first use, it is slow to import
+    from scipy.linalg import cho_solve, solve_triangular
 
-    try:
-        # Parse JSON to array
-        coefficient_matrix = json.loads(coefficient_matrix)
-        constants = json.loads(constants)
+    b = np.asarray(constants, dtype=float)
 
-        # Check if the coefficient matrix and constant vector have the same number of rows
-        if len(coefficient_matrix) != len(constants):
+    # Sparse matrices are never densified, so they are solved iteratively
+    if is_sparse(coefficient_matrix) or solver == LeastSquaresSolver.LSMR:
+        if solver not in (LeastSquaresSolver.AUTO, LeastSquaresSolver.LSMR):
             raise ValueError(
-                "Coefficient matrix and constant vector must have the same number of rows."
+                f'The "{solver.value}" solver is only available for dense coefficient matrices. Use the LSMR solver instead.'
             )
 
+        A = coefficient_matrix
+        if not is_sparse(A):
+            A = np.asarray(A, dtype=float)
+
+        roots = lsmr_solve(A, b)
+        residual_norm = np.linalg.norm(A @ roots - b, axis=0)
+
+        return roots, residual_norm, None, LeastSquaresSolver.LSMR, False
+
+    A = np.asarray(coefficient_matrix, dtype=float)
+
+    if solver in (LeastSquaresSolver.QR, LeastSquaresSolver.CHOLESKY) and (
+        A.shape[0] < A.shape[1]
+    ):
+        raise ValueError(
+            "Coefficient matrix must have at least as many rows as columns. Use the SVD solver instead."
+        )
+
+    factorize = {
+        LeastSquaresSolver.AUTO: auto_factorization,
+        LeastSquaresSolver.QR: lambda A: (LeastSquaresSolver.QR, *qr_factorization(A)),
+        LeastSquaresSolver.SVD: lambda A: (
+            LeastSquaresSolver.SVD,
+            *svd_factorization(A),
+        ),
+        LeastSquaresSolver.CHOLESKY: lambda A: (
+            LeastSquaresSolver.CHOLESKY,
+            *cholesky_factorization(A),
+        ),
+    }[solver]
+
+    (used_solver, *factors), factorization_cached = get_factorization(
+        f"least_squares_{solver.value}", A, factorize
+    )
+
+    if used_solver == LeastSquaresSolver.CHOLESKY:
+        c, _ = factors
+        roots = cho_solve((c, False), A.T @ b, check_finite=False)
+        rank = A.shape[1]
+    elif used_solver == LeastSquaresSolver.QR:
+        Q, R = factors
+        roots = solve_triangular(R, Q.T @ b, check_finite=False)
+        rank = A.shape[1]
+    else:
+        # Minimum norm solution ignoring the singular values below the rank tolerance
+        U, s, Vt, rank = factors
+        roots = Vt[:rank].T @ ((U[:, :rank].T @ b).T / s[:rank]).T
+
+    residual_norm = np.linalg.norm(A @ roots - b, axis=0)
+
+    return roots, residual_norm, rank, used_solver, factorization_cached
+
+
+@with_deadline(CALCULATION_TIMEOUT)
+def least_squares_method(
+    coefficient_matrix: str | list[list[float]] | SparseMatrix,
+    constants: str | list[float] | list[list[float]],
+    solver: LeastSquaresSolver = LeastSquaresSolver.AUTO,
+):
+    """
+    Find the roots of a system of linear equations using least squares method.
+
+    :param coefficient_matrix:   Coefficient matrix as a JSON array of arrays or sparse matrix triplets in COO or CSR format.
+    :param constants:   Constant vector as a JSON array or a matrix with one right-hand side per column as a JSON array of arrays.
+    :param solver:  Solver to use. The automatic choice depends on the shape and conditioning of the matrix.
+
+    :return: The roots, the residual norm, the rank of the matrix, the used solver, whether the factorization was cached and execution time.
+    """
+
+    try:
+        # Parse JSON and sparse matrix triplets to arrays
+        A, b = load_linear_system(coefficient_matrix, constants)
+
         # Measure execution time
         start_time = time.time()
 
         # Least squares method implementation
-        roots = least_squares_method_implementation(coefficient_matrix, constants)
+        (
+            roots,
+            residual_norm,
+            rank,
+            used_solver,
+            factorization_cached,
+        ) = least_squares_method_implementation(A, b, solver)
 
         # Measure execution time
         execution_time_ms = (time.time() - start_time) * 1000
@@ -83,6 +304,10 @@ def least_squares_method(coefficient_matrix: str, constants: str):
         # Return the results
         return {
             "roots": roots.tolist(),
+            "residual_norm": residual_norm.tolist(),
+            "rank": rank,
+            "solver": used_solver,
+            "factorization_cached": factorization_cached,
             "execution_time_ms": execution_time_ms,
         }
 
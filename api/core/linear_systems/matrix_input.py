@@ -0,0 +1,201 @@
+import json
+from enum import Enum
+
+import numpy as np
+from pydantic import BaseModel
+
+
+class SparseMatrixFormat(Enum):
+    COO = "coo"
+    CSR = "csr"
+
+
+class SparseMatrix(BaseModel):
+    format: SparseMatrixFormat
+    shape: tuple[int, int]
+    data: list[float]
+    row: list[int] | None = None
+    col: list[int] | None = None
+    indptr: list[int] | None = None
+    indices: list[int] | None = None
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "format": "coo",
+                    "shape": [3, 3],
+                    "data": [4.0, -1.0, -1.0, 4.0, -1.0, -1.0, 4.0],
+                    "row": [0, 0, 1, 1, 1, 2, 2],
+                    "col": [0, 1, 0, 1, 2, 1, 2],
+                },
+                {
+                    "format": "csr",
+                    "shape": [3, 3],
+                    "data": [4.0, -1.0, -1.0, 4.0, -1.0, -1.0, 4.0],
+                    "indptr": [0, 2, 5, 7],
+                    "indices": [0, 1, 0, 1, 2, 1, 2],
+                },
+            ]
+        }
+    }
+
+
+class LinearSystemRequest(BaseModel):
+    coefficient_matrix: list[list[float]] | SparseMatrix
+    constants: list[float] | list[list[float]]
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "coefficient_matrix": [[2, 1, -1], [-3, -1, 2], [-2, 1, 2]],
+                    "constants": [8, -11, -3],
+                },
+                {
+                    "coefficient_matrix": {
+                        "format": "coo",
+                        "shape": [3, 3],
+                        "data": [4.0, -1.0, -1.0, 4.0, -1.0, -1.0, 4.0],
+                        "row": [0, 0, 1, 1, 1, 2, 2],
+                        "col": [0, 1, 0, 1, 2, 1, 2],
+                    },
+                    "constants": [3, 2, 3],
+                },
+            ]
+        }
+    }
+
+
+def is_sparse(matrix) -> bool:
+    """
+    Check if a coefficient matrix is a SciPy sparse matrix without importing SciPy.
+
+    :param matrix:  Coefficient matrix.
+
+    :return: True if the matrix is sparse.
+    """
+    return hasattr(matrix, "tocsr")
+
+
+def sparse_matrix_to_csr(matrix: SparseMatrix):
+    """
+    Convert sparse matrix triplets to a SciPy CSR matrix in canonical format.
+
+    :param matrix:  Sparse matrix in COO or CSR format.
+
+    :return: The CSR matrix with sorted indices and without duplicate entries.
+    """
+    # Import SciPy on first use, it is slow to import
+    from scipy.sparse import coo_array, csr_array
+
+    data = np.array(matrix.data, dtype=float)
+
+    if matrix.format == SparseMatrixFormat.COO:
+        if matrix.row is None or matrix.col is None:
+            raise ValueError(
+                'Sparse matrix in COO format must contain "row" and "col".'
+            )
+
+        if not len(matrix.row) == len(matrix.col) == len(data):
+            raise ValueError(
+                'Sparse matrix "row", "col" and "data" must have the same length.'
+            )
+
+        csr = coo_array(
+            (data, (np.array(matrix.row), np.array(matrix.col))), shape=matrix.shape
+        ).tocsr()
+    else:
+        if matrix.indptr is None or matrix.indices is None:
+            raise ValueError(
+                'Sparse matrix in CSR format must contain "indptr" and "indices".'
+            )
+
+        csr = csr_array(
+            (data, np.array(matrix.indices), np.array(matrix.indptr)),
+            shape=matrix.shape,
+        )
+        csr.check_format()
+
+    # Equal matrices must have equal arrays, so that they share cached factorizations
+    csr.sum_duplicates()
+    csr.sort_indices()
+    return csr
+
+
+def load_coefficient_matrix(coefficient_matrix):
+    """
+    Load a coefficient matrix given as a JSON string, a dense array of arrays or sparse matrix triplets.
+
+    :param coefficient_matrix:  Coefficient matrix as a JSON string, a list of lists, a dictionary or model of sparse
+                                matrix triplets, a NumPy array or a SciPy sparse matrix.
+
+    :return: A dense NumPy array or a SciPy CSR matrix.
+    """
+    if isinstance(coefficient_matrix, str):
+        coefficient_matrix = json.loads(coefficient_matrix)
+
+    if isinstance(coefficient_matrix, dict):
+        coefficient_matrix = SparseMatrix.model_validate(coefficient_matrix)
+
+    if isinstance(coefficient_matrix, SparseMatrix):
+        coefficient_matrix = sparse_matrix_to_csr(coefficient_matrix)
+
+    if is_sparse(coefficient_matrix):
+        return coefficient_matrix.tocsr().astype(float)
+
+    # Check if the coefficient matrix rows have the same length
+    if isinstance(coefficient_matrix, list) and any(
+        not isinstance(row, list) or len(row) != len(coefficient_matrix[0])
+        for row in coefficient_matrix
+    ):
+        raise ValueError(
+            "Coefficient matrix must be an array of rows of the same length."
+        )
+
+    A = np.asarray(coefficient_matrix, dtype=float)
+
+    if A.ndim != 2 or A.size == 0:
+        raise ValueError("Coefficient matrix must be a non-empty matrix.")
+
+    return A
+
+
+def load_constants(constants) -> np.ndarray:
+    """
+    Load a constant vector or a matrix with one right-hand side per column.
+
+    :param constants:   Constants as a JSON string, a list, a list of lists or a NumPy array.
+
+    :return: The constants as a NumPy array.
+    """
+    if isinstance(constants, str):
+        constants = json.loads(constants)
+
+    b = np.asarray(constants, dtype=float)
+
+    if b.ndim not in (1, 2):
+        raise ValueError("Constants must be a vector or a matrix.")
+
+    return b
+
+
+def load_linear_system(coefficient_matrix, constants):
+    """
+    Load the coefficient matrix and constants of a system of linear equations and check that their shapes match.
+
+    :param coefficient_matrix:  Coefficient matrix in any format accepted by load_coefficient_matrix.
+    :param constants:           Constants in any format accepted by load_constants.
+
+    :return: The coefficient matrix and the constants.
+    """
+    A = load_coefficient_matrix(coefficient_matrix)
+    b = load_constants(constants)
+
+    # Check if the coefficient matrix and constant vector have the same number of rows
+    if A.shape[0] != b.shape[0]:
+        raise ValueError(
+            "Coefficient matrix and constant vector must have the same number of rows."
+        )
+
+    return A, b
@@ -0,0 +1,281 @@
+import time
+from enum import Enum
+
+import numpy as np
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+from api.constants import CALCULATION_TIMEOUT, CALCULATION_TIMEOUT_ERROR_MESSAGE
+from core.helpers.compile_expression import compile_expression, evaluate
+from core.helpers.deadline import check_deadline, with_deadline
+from core.non_linear.newtons_method import compile_newtons_method_derivatives
+
+
+class BatchRootFindingMethod(Enum):
+    NEWTON = "newton"
+    SECANT = "secant"
+
+
+class BatchRootFindingRequest(BaseModel):
+    f_strings: list[str]
+    df_strings: list[str] | None = None
+    x0: list[float]
+    x1: list[float] | None = None
+    method: BatchRootFindingMethod = BatchRootFindingMethod.NEWTON
+    tol: float = 1e-6
+    max_iter: int = 100
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "f_strings": ["x**3 - 2*x + 2"],
+                    "df_strings": ["3*x**2 - 2"],
+                    "x0": [-2.0, 0.0, 1.0],
+                    "method": "newton",
+                    "tol": 1e-6,
+                    "max_iter": 100,
+                }
+            ]
+        }
+    }
+
+
+class BatchRootFindingResult(BaseModel):
+    f_string: str
+    roots: list[float | None]
+    iterations: list[int]
+    converged: list[bool]
+
+
+class BatchRootFindingResponse(BaseModel):
+    results: list[BatchRootFindingResult]
+    execution_time_ms: float
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "results": [
+                        {
+                            "f_string": "x**3 - 2*x + 2",
+                            "roots": [-1.7692923542386314, None, 1.0],
+                            "iterations": [4, 100, 100],
+                            "converged": [True, False, False],
+                        }
+                    ],
+                    "execution_time_ms": 0.05000114440917969,
+                }
+            ]
+        }
+    }
+
+
+def batch_newtons_method_implementation(values, x0, tol, max_iter):
+    """
+    Find the roots of a function from many initial guesses at once using Newton's method.
+
+    All guesses are iterated together as one NumPy array; a guess stops iterating once it converges or diverges.
+    The values of f(x) and its derivative at the new guesses are computed by one call and reused by the
+    convergence test and the next step.
+
+    :param values:      Function of x returning the values of the target function and its derivative.
+    :param x0:          Array of initial guesses for the root.
+    :param tol:         Tolerance for convergence.
+    :param max_iter:    Maximum number of iterations.
+
+    :return: Arrays of the approximate roots, the numbers of iterations and the convergence flags.
+    """
+    x = np.array(x0, dtype=float)
+    iterations = np.zeros(x.shape, dtype=int)
+    converged = np.zeros(x.shape, dtype=bool)
+    active = np.ones(x.shape, dtype=bool)
+
+    def evaluate_values(points):
+        # Constant expressions are lambdified to scalars, broadcast them to the points
+        return [
+            np.broadcast_to(np.asarray(value, dtype=float), points.shape)
+            for value in values(points)
+        ]
+
+    with np.errstate(all="ignore"):
+        f_x, f_prime_x = (np.array(value) for value in evaluate_values(x))
+
+        for _ in range(max_iter):
+            check_deadline()
+
+            indices = np.flatnonzero(active)
+            if indices.size == 0:
+                break
+
+            x_next = x[indices] - f_x[indices] / f_prime_x[indices]
+            x[indices] = x_next
+            iterations[indices] += 1
+
+            f_x[indices], f_prime_x[indices] = evaluate_values(x_next)
+
+            finite = np.isfinite(x_next)
+            done = finite & (np.abs(f_x[indices]) < tol)
+            converged[indices[done]] = True
+            active[indices[done | ~finite]] = False
+
+    return x, iterations, converged
+
+
+def batch_secant_method_implementation(f, x0, x1, tol, max_iter):
+    """
+    Find the roots of a function from many pairs of initial guesses at once using the Secant method.
+
+    All pairs are iterated together as NumPy arrays; a pair stops iterating once it converges or fails.
+
+    :param f:           The target function for which you want to find the roots.
+    :param x0:          Array of first initial guesses for the root.
+    :param x1:          Array of second initial guesses for the root.
+    :param tol:         Tolerance for convergence.
+    :param max_iter:    Maximum number of iterations.
+
+    :return: Arrays of the approximate roots, the numbers of iterations and the convergence flags.
+    """
+    x_prev = np.array(x0, dtype=float)
+    x = np.array(x1, dtype=float)
+    iterations = np.zeros(x.shape, dtype=int)
+    converged = np.zeros(x.shape, dtype=bool)
+    active = np.ones(x.shape, dtype=bool)
+
+    with np.errstate(all="ignore"):
+        for _ in range(max_iter):
+            check_deadline()
+
+            indices = np.flatnonzero(active)
+            if indices.size == 0:
+                break
+
+            f_prev = evaluate(f, x_prev[indices])
+            f_x = evaluate(f, x[indices])
+
+            root_found = np.abs(f_x) < tol
+            converged[indices[root_found]] = True
+
+            # Avoid division by zero
+            stalled = ~root_found & (f_x - f_prev == 0)
+
+            step = ~(root_found | stalled)
+            stepping = indices[step]
+            x_next = x[stepping] - f_x[step] * (x[stepping] - x_prev[stepping]) / (
+                f_x[step] - f_prev[step]
+            )
+            step_converged = np.abs(x_next - x[stepping]) < tol
+            diverged = ~np.isfinite(x_next)
+
+            x_prev[stepping] = x[stepping]
+            x[stepping] = x_next
+            iterations[stepping] += 1
+            converged[stepping[step_converged]] = True
+
+            active[indices[root_found | stalled]] = False
+            active[stepping[step_converged | diverged]] = False
+
+    return x, iterations, converged
+
+
+@with_deadline(CALCULATION_TIMEOUT)
+def batch_root_finding(
+    f_strings: list[str],
+    x0: list[float],
+    method: BatchRootFindingMethod = BatchRootFindingMethod.NEWTON,
+    df_strings: list[str] | None = None,
+    x1: list[float] | None = None,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+):
+    """
+    Find the roots of one or more functions from many initial guesses without creating plots.
+
+    :param f_strings:   String expressions of the functions f(x).
+    :param x0:          Initial guesses for the root.
+    :param method:      Root finding method.
+    :param df_strings:  String expressions of the derivatives of f(x) for Newton's method, derived from f(x) if not provided.
+    :param x1:          Second initial guesses for the root. Required for the secant method.
+    :param tol:         Tolerance for convergence.
+    :param max_iter:    Maximum number of iterations.
+
+    :return: A dictionary containing the roots, numbers of iterations and convergence flags for every function and the execution time.
+    """
+
+    try:
+        if not f_strings:
+            raise ValueError("At least one function must be provided.")
+
+        if not x0:
+            raise ValueError("At least one initial guess must be provided.")
+
+        if tol <= 0:
+            raise ValueError("Tolerance must be positive.")
+
+        if max_iter <= 0:
+            raise ValueError("Maximum number of iterations must be greater than zero.")
+
+        if method == BatchRootFindingMethod.NEWTON:
+            if df_strings is not None and len(df_strings) != len(f_strings):
+                raise ValueError(
+                    "A derivative must be provided for every function when using Newton's method."
+                )
+        elif method == BatchRootFindingMethod.SECANT:
+            if x1 is None or len(x1) != len(x0):
+                raise ValueError(
+                    "The lists of initial guesses must have the same length when using the secant method."
+                )
+        else:
+            raise ValueError("Invalid root finding method.")
+
+        # Parse string expressions and convert them to numpy methods for numerical calculations
+        if method == BatchRootFindingMethod.NEWTON:
+            compiled = [
+                compile_newtons_method_derivatives(
+                    f_string, df_strings[i] if df_strings is not None else None, 1
+                )[0]
+                for i, f_string in enumerate(f_strings)
+            ]
+        else:
+            compiled = [compile_expression(f_string).f_np for f_string in f_strings]
+
+        # Measure execution time
+        start_time = time.time()
+
+        results = []
+        for f_string, f in zip(f_strings, compiled):
+            if method == BatchRootFindingMethod.NEWTON:
+                roots, iterations, converged = batch_newtons_method_implementation(
+                    f, x0, tol, max_iter
+                )
+            else:
+                roots, iterations, converged = batch_secant_method_implementation(
+                    f, x0, x1, tol, max_iter
+                )
+
+            results.append(
+                {
+                    "f_string": f_string,
+                    # NaN and infinity can not be represented in JSON
+                    "roots": [
+                        float(root) if np.isfinite(root) else None for root in roots
+                    ],
+                    "iterations": iterations.tolist(),
+                    "converged": converged.tolist(),
+                }
+            )
+
+        # Calculate execution time in milliseconds
+        execution_time_ms = (time.time() - start_time) * 1000
+
+        # Return the results
+        return {
+            "results": results,
+            "execution_time_ms": execution_time_ms,
+        }
+    except TimeoutError:
+        # Handle timeout error and raise an HTTPException with a specific status code and detail message
+        raise HTTPException(status_code=408, detail=CALCULATION_TIMEOUT_ERROR_MESSAGE)
+    except Exception as e:
+        # Handle any errors and raise an HTTPException with a specific status code and detail message
+        raise HTTPException(status_code=422, detail=str(e))
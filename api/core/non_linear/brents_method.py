@@ -0,0 +1,316 @@
+import math
+import sys
+import time
+
+import numpy as np
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+from api.constants import CALCULATION_TIMEOUT, CALCULATION_TIMEOUT_ERROR_MESSAGE
+from core.helpers.compile_expression import compile_expression
+from core.helpers.deadline import check_deadline, with_deadline
+from core.helpers.plotting import (
+    create_figure,
+    figure_to_svg,
+    plot_data_to_json,
+    PlotMode,
+)
+
+
+class BrentsMethodResponse(BaseModel):
+    root: float
+    iterations: int
+    function_evaluations: int
+    execution_time_ms: float
+    plot_svg: str | None = None
+    plot_data: dict[str, list[float | None]] | None = None
+    result_id: str | None = None
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "root": 0.7390851332151607,
+                    "iterations": 5,
+                    "function_evaluations": 7,
+                    "execution_time_ms": 0.05000114440917969,
+                    "plot_svg": "<svg>...</svg>",
+                }
+            ]
+        }
+    }
+
+
+def brents_method_implementation(f, a, b, tol, max_iter):
+    """
+    Find the root of a function in a bracketing interval using Brent's method.
+
+    Every step tries inverse quadratic interpolation or the secant method and falls back to bisection when the
+    interpolated point is outside of the bracket or does not shrink it fast enough, so the method always converges
+    when the function has different signs at the ends of the interval.
+
+    :param f:           The target function for which you want to find the root.
+    :param a:           Lower bound of the interval.
+    :param b:           Upper bound of the interval.
+    :param tol:         Tolerance of the root.
+    :param max_iter:    Maximum number of iterations.
+
+    :return: the approximate root of the function, the number of iterations and function evaluations, and the intermediate steps.
+    """
+    f_a = float(f(a))
+    f_b = float(f(b))
+    function_evaluations = 2
+
+    if f_a == 0:
+        return a, 0, function_evaluations, []
+    if f_b == 0:
+        return b, 0, function_evaluations, []
+
+    if math.copysign(1, f_a) == math.copysign(1, f_b):
+        raise ValueError(
+            "The function must have different signs at the ends of the interval."
+        )
+
+    # b is the best approximation, a the previous one and c the other end of the bracket [b, c]
+    c, f_c = a, f_a
+    step = previous_step = b - a
+
+    steps = []
+    for i in range(max_iter):
+        check_deadline()
+
+        if (f_b > 0) == (f_c > 0):
+            c, f_c = a, f_a
+            step = previous_step = b - a
+
+        if abs(f_c) < abs(f_b):
+            a, b, c = b, c, b
+            f_a, f_b, f_c = f_b, f_c, f_b
+
+        step_tol = 2 * sys.float_info.epsilon * abs(b) + tol / 2
+        half_bracket = (c - b) / 2
+
+        if abs(half_bracket) <= step_tol or f_b == 0:
+            return b, i, function_evaluations, steps
+
+        if abs(previous_step) >= step_tol and abs(f_a) > abs(f_b):
+            s = f_b / f_a
+            if a == c:
+                # Secant method
+                p = 2 * half_bracket * s
+                q = 1 - s
+            else:
+                # Inverse quadratic interpolation
+                q = f_a / f_c
+                r = f_b / f_c
+                p = s * (2 * half_bracket * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+
+            if p > 0:
+                q = -q
+            p = abs(p)
+
+            # Accept the interpolation only if it stays inside the bracket and converges faster than bisection
+            if 2 * p < min(
+                3 * half_bracket * q - abs(step_tol * q), abs(previous_step * q)
+            ):
+                previous_step, step = step, p / q
+            else:
+                step = previous_step = half_bracket
+        else:
+            step = previous_step = half_bracket
+
+        a, f_a = b, f_b
+        b += step if abs(step) > step_tol else math.copysign(step_tol, half_bracket)
+        f_b = float(f(b))
+        function_evaluations += 1
+        steps.append(b)
+
+    raise ValueError(
+        f"Maximum number of iterations ({max_iter}) was reached without convergence. Latest value: {b}"
+    )
+
+
+def brents_method_plot_data(
+    f_string: str, a: float, b: float, root: float, steps: list[float]
+):
+    """
+    Calculate the data for the plot of Brent's method.
+
+    :param f_string:    String expression of the function f(x).
+    :param a:           Lower bound of the interval.
+    :param b:           Upper bound of the interval.
+    :param root:        The found root.
+    :param steps:       Intermediate approximations of the root.
+
+    :return: A dictionary containing the arrays to plot.
+    """
+    f_np = compile_expression(f_string).f_np
+
+    # Generate x values for plotting around the interval
+    margin = (b - a) / 2
+    x_values = np.linspace(a - margin, b + margin, 10000)
+    y_values = np.broadcast_to(f_np(x_values), x_values.shape)
+
+    return {
+        "x_values": x_values,
+        "y_values": y_values,
+        "steps": steps,
+    }
+
+
+def render_brents_method_plot(
+    f_string: str, a: float, b: float, root: float, steps: list[float]
+) -> str:
+    """
+    Create an SVG plot of Brent's method.
+
+    :param f_string:    String expression of the function f(x).
+    :param a:           Lower bound of the interval.
+    :param b:           Upper bound of the interval.
+    :param root:        The found root.
+    :param steps:       Intermediate approximations of the root.
+
+    :return: The SVG plot.
+    """
+    plot_data = brents_method_plot_data(f_string, a, b, root, steps)
+    x_values = plot_data["x_values"]
+    y_values = plot_data["y_values"]
+
+    # Create the plot
+    with create_figure() as (figure, ax):
+        ax.margins(0)
+
+        ax.plot(x_values, y_values, label="f(x)")
+        ax.axvline(0, color="black", linewidth=0.5)
+        ax.axhline(0, color="black", linewidth=0.5)
+
+        ax.scatter(
+            steps,
+            np.zeros(len(steps)),
+            color="green",
+            marker="o",
+            alpha=0.5,
+            zorder=3,
+            label="Steps",
+        )
+
+        for number, step in enumerate(steps, start=1):
+            ax.annotate(
+                str(number),
+                (step, 0),
+                textcoords="offset points",
+                xytext=(0, 8),
+                ha="center",
+            )
+
+        ax.scatter(
+            root,
+            0,
+            color="red",
+            marker="o",
+            label=f"Root ({str(round(root, 2)).rstrip('0').rstrip('.')})",
+            zorder=4,
+        )
+
+        ax.axvline(
+            a,
+            color="blue",
+            linestyle="--",
+            linewidth=1,
+            alpha=0.5,
+            label=f"a ({str(round(a, 2)).rstrip('0').rstrip('.')})",
+        )
+        ax.axvline(
+            b,
+            color="blue",
+            linestyle="--",
+            linewidth=1,
+            alpha=0.5,
+            label=f"b ({str(round(b, 2)).rstrip('0').rstrip('.')})",
+        )
+
+        ax.grid(True, linestyle="--", alpha=0.7)
+        ax.set_xlabel("x")
+        ax.set_ylabel("y")
+        ax.legend()
+
+        # Save the plot to an SVG file with a transparent background
+        return figure_to_svg(figure)
+
+
+@with_deadline(CALCULATION_TIMEOUT)
+def brents_method(
+    f_string: str,
+    a: float,
+    b: float,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+    plot: PlotMode = PlotMode.SVG,
+):
+    """
+    Find the root of a function using Brent's method and create an SVG plot with details.
+
+    :param f_string:    String expression of the function f(x).
+    :param a:           Lower bound of the interval.
+    :param b:           Upper bound of the interval.
+    :param tol:         Tolerance of the root.
+    :param max_iter:    Maximum number of iterations.
+    :param plot:        Whether to create an SVG plot, return the plot data or skip plotting.
+
+    :return: A dictionary containing the root, number of iterations and function evaluations, execution time, the plot and the arguments needed to create the plot later.
+    """
+
+    try:
+        if a >= b:
+            raise ValueError('The "b" must be greater than "a".')
+
+        if tol <= 0:
+            raise ValueError("Tolerance must be positive.")
+
+        if max_iter <= 0:
+            raise ValueError("Maximum number of iterations must be greater than zero.")
+
+        # Parse string expression and convert it to numpy methods for numerical calculations
+        f_np = compile_expression(f_string).f_np
+
+        # Measure execution time
+        start_time = time.time()
+
+        # Brent's method implementation
+        root, iterations, function_evaluations, steps = brents_method_implementation(
+            f_np, a, b, tol, max_iter
+        )
+
+        # Measure execution time
+        execution_time_ms = (time.time() - start_time) * 1000
+
+        plot_args = {
+            "f_string": f_string,
+            "a": a,
+            "b": b,
+            "root": root,
+            "steps": steps,
+        }
+
+        # Return the results
+        return {
+            "root": root,
+            "iterations": iterations,
+            "function_evaluations": function_evaluations,
+            "execution_time_ms": execution_time_ms,
+            "plot_svg": render_brents_method_plot(**plot_args)
+            if plot == PlotMode.SVG
+            else None,
+            "plot_data": plot_data_to_json(brents_method_plot_data(**plot_args))
+            if plot == PlotMode.DATA
+            else None,
+            "plot_args": plot_args,
+        }
+
+    except TimeoutError:
+        # Handle timeout error and raise an HTTPException with a specific status code and detail message
+        raise HTTPException(status_code=408, detail=CALCULATION_TIMEOUT_ERROR_MESSAGE)
+    except Exception as e:
+        # Handle any errors and raise an HTTPException with a specific status code and detail message
+        raise HTTPException(status_code=422, detail=str(e))
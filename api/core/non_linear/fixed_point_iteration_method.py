@@ -1,22 +1,28 @@
 import time
-from io import BytesIO
 
-import matplotlib.pyplot as plt
 import numpy as np
-import sympy as sp
 from fastapi import HTTPException
 from pydantic import BaseModel
-from timeout_decorator import timeout
 
 from api.constants import CALCULATION_TIMEOUT, CALCULATION_TIMEOUT_ERROR_MESSAGE
+from core.helpers.compile_expression import compile_expression
+from core.helpers.deadline import check_deadline, with_deadline
 from core.helpers.get_plot_limits import set_plot_limits_by_points
+from core.helpers.plotting import (
+    create_figure,
+    figure_to_svg,
+    plot_data_to_json,
+    PlotMode,
+)
 
 
 class FixedPointIterationMethodResponse(BaseModel):
     root: float
     iterations: int
     execution_time_ms: float
-    plot_svg: str
+    plot_svg: str | None = None
+    plot_data: dict[str, list[float | None]] | None = None
+    result_id: str | None = None
 
     model_config = {
         "json_schema_extra": {
@@ -50,6 +56,8 @@ def fixed_point_iteration_implementation(f, x0, tol, max_iter):
 
     try:
         for i in range(max_iter):
+            check_deadline()
+
             x_next = x - f(x)  # Modify the iteration formula.
             if abs(x_next - x) < tol:
                 return (
@@ -71,83 +79,78 @@ def fixed_point_iteration_implementation(f, x0, tol, max_iter):
     )  # Return the root and the number of iterations if the maximum number of iterations is reached.
 
 
-@timeout(
-    CALCULATION_TIMEOUT,
-    timeout_exception=TimeoutError,
-)
-def fixed_point_iteration(
-    f_string: str, x0: float, tol: float = 1e-6, max_iter: int = 100
+def fixed_point_iteration_plot_data(
+    f_string: str, x0: float, root: float, steps: list[float]
 ):
     """
-    Find the root of a function using fixed-point iteration method and create an SVG plot with details.
+    Calculate the data for the plot of the fixed-point iteration method.
 
     :param f_string:    String expression of the function f(x).
     :param x0:          Initial guess for the root.
-    :param tol:         Tolerance for convergence.
-    :param max_iter:    Maximum number of iterations.
+    :param root:        The found root.
+    :param steps:       Intermediate approximations of the root.
 
-    :return: A dictionary containing the root, number of iterations, number of function calls, execution time and SVG plot.
+    :return: A dictionary containing the arrays to plot.
     """
+    f_np = compile_expression(f_string).f_np
+
+    # Generate x values for plotting
+    root_to_x0_distance = abs(root - x0)
+    x_values = np.linspace(
+        root - (root_to_x0_distance * 2),
+        root + (root_to_x0_distance * 2),
+        10000,
+    )
+    if root_to_x0_distance == 0:
+        x_values = np.linspace(
+            root - 10,
+            root + 10,
+            10000,
+        )
 
-    try:
-        if tol <= 0:
-            raise ValueError("Tolerance must be positive.")
-
-        if max_iter <= 0:
-            raise ValueError("Maximum number of iterations must be greater than zero.")
-
-        x = sp.symbols("x")
-
-        # Parse string expression to symbolic methods
-        f = sp.sympify(f_string)
-
-        # Convert to numpy methods for numerical calculations
-        f_np = sp.lambdify(x, f, "numpy")
+    # Add a zero to the x_values
+    for i in range(len(x_values) - 1):
+        if x_values[i] < 0 < x_values[i + 1] or x_values[i] > 0 > x_values[i + 1]:
+            x_values = np.insert(x_values, i + 1, 0)
+            break
 
-        # Measure execution time
-        start_time = time.time()
+    y_values = f_np(x_values)
 
-        # Simple iteration method implementation
-        root, iterations, steps = fixed_point_iteration_implementation(
-            f_np, x0, tol, max_iter
-        )
+    return {
+        "x_values": x_values,
+        "y_values": y_values,
+        "steps": steps,
+    }
 
-        # Measure execution time
-        execution_time_ms = (time.time() - start_time) * 1000
 
-        # Generate x values for plotting
-        root_to_x0_distance = abs(root - x0)
-        x_values = np.linspace(
-            root - (root_to_x0_distance * 2),
-            root + (root_to_x0_distance * 2),
-            10000,
-        )
-        if root_to_x0_distance == 0:
-            x_values = np.linspace(
-                root - 10,
-                root + 10,
-                10000,
-            )
+def render_fixed_point_iteration_plot(
+    f_string: str, x0: float, root: float, steps: list[float]
+) -> str:
+    """
+    Create an SVG plot of the fixed-point iteration method.
 
-        # Add a zero to the x_values
-        for i in range(len(x_values) - 1):
-            if x_values[i] < 0 < x_values[i + 1] or x_values[i] > 0 > x_values[i + 1]:
-                x_values = np.insert(x_values, i + 1, 0)
-                break
+    :param f_string:    String expression of the function f(x).
+    :param x0:          Initial guess for the root.
+    :param root:        The found root.
+    :param steps:       Intermediate approximations of the root.
 
-        y_values = f_np(x_values)
+    :return: The SVG plot.
+    """
+    plot_data = fixed_point_iteration_plot_data(f_string, x0, root, steps)
+    x_values = plot_data["x_values"]
+    y_values = plot_data["y_values"]
 
-        # Create the plot
-        plt.figure(figsize=(12, 12))
-        plt.margins(0)
-        set_plot_limits_by_points(plt, [(root, root), (x0, x0)])
+    # Create the plot
+    with create_figure() as (figure, ax):
+        ax.margins(0)
+        set_plot_limits_by_points(ax, [(root, root), (x0, x0)])
 
-        plt.plot(x_values, y_values, label="f(x)")
-        plt.axvline(0, color="black", linewidth=0.5)
-        plt.axhline(0, color="black", linewidth=0.5)
+        ax.plot(x_values, y_values, label="f(x)")
+        ax.axvline(0, color="black", linewidth=0.5)
+        ax.axhline(0, color="black", linewidth=0.5)
 
         for step in steps:
-            plt.scatter(
+            ax.scatter(
                 step,
                 0,
                 color="green",
@@ -156,7 +159,7 @@ def fixed_point_iteration(
                 alpha=0.5,
             )
 
-        plt.scatter(
+        ax.scatter(
             root,
             0,
             color="red",
@@ -164,7 +167,7 @@ def fixed_point_iteration(
             label=f"Root ({str(round(root, 2)).rstrip('0').rstrip('.')})",
             zorder=3,
         )
-        plt.scatter(
+        ax.scatter(
             x0,
             0,
             color="green",
@@ -172,35 +175,73 @@ def fixed_point_iteration(
             label=f"Initial guess for the root ({str(round(x0, 2)).rstrip('0').rstrip('.')})",
             zorder=3,
         )
-        plt.grid(True, linestyle="--", alpha=0.7)
-        plt.xlabel("x")
-        plt.ylabel("y")
-        plt.legend()
+        ax.grid(True, linestyle="--", alpha=0.7)
+        ax.set_xlabel("x")
+        ax.set_ylabel("y")
+        ax.legend()
 
         # Set the plot limits
-        set_plot_limits_by_points(plt, [(root, 0), (x0, 0)])
+        set_plot_limits_by_points(ax, [(root, 0), (x0, 0)])
 
         # Save the plot to an SVG file with a transparent background
-        svg_buffer = BytesIO()
-        plt.savefig(
-            svg_buffer,
-            format="svg",
-            transparent=True,
-            bbox_inches="tight",
-            pad_inches=0,
+        return figure_to_svg(figure)
+
+
+@with_deadline(CALCULATION_TIMEOUT)
+def fixed_point_iteration(
+    f_string: str,
+    x0: float,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+    plot: PlotMode = PlotMode.SVG,
+):
+    """
+    Find the root of a function using fixed-point iteration method and create an SVG plot with details.
+
+    :param f_string:    String expression of the function f(x).
+    :param x0:          Initial guess for the root.
+    :param tol:         Tolerance for convergence.
+    :param max_iter:    Maximum number of iterations.
+    :param plot:        Whether to create an SVG plot, return the plot data or skip plotting.
+
+    :return: A dictionary containing the root, number of iterations, number of function calls, execution time, the plot and the arguments needed to create the plot later.
+    """
+
+    try:
+        if tol <= 0:
+            raise ValueError("Tolerance must be positive.")
+
+        if max_iter <= 0:
+            raise ValueError("Maximum number of iterations must be greater than zero.")
+
+        # Parse string expression and convert it to numpy methods for numerical calculations
+        f_np = compile_expression(f_string).f_np
+
+        # Measure execution time
+        start_time = time.time()
+
+        # Simple iteration method implementation
+        root, iterations, steps = fixed_point_iteration_implementation(
+            f_np, x0, tol, max_iter
         )
-        svg_buffer.seek(0)
-        svg_plot = svg_buffer.read().decode("utf-8")
 
-        # Close the plot
-        plt.close()
+        # Measure execution time
+        execution_time_ms = (time.time() - start_time) * 1000
+
+        plot_args = {"f_string": f_string, "x0": x0, "root": root, "steps": steps}
 
         # Return the results
         return {
             "root": root,
             "iterations": iterations,
             "execution_time_ms": execution_time_ms,
-            "plot_svg": svg_plot,
+            "plot_svg": render_fixed_point_iteration_plot(**plot_args)
+            if plot == PlotMode.SVG
+            else None,
+            "plot_data": plot_data_to_json(fixed_point_iteration_plot_data(**plot_args))
+            if plot == PlotMode.DATA
+            else None,
+            "plot_args": plot_args,
         }
 
     except TimeoutError:
@@ -1,24 +1,36 @@
 import time
-from io import BytesIO
+from enum import Enum
 
-import matplotlib.pyplot as plt
 import numpy as np
-import sympy as sp
 from fastapi import HTTPException
 from pydantic import BaseModel
-from scipy import optimize
-from timeout_decorator import timeout
 
 from api.constants import CALCULATION_TIMEOUT, CALCULATION_TIMEOUT_ERROR_MESSAGE
+from core.helpers.compile_expression import compile_derivatives, compile_expression
+from core.helpers.deadline import check_deadline, with_deadline
 from core.helpers.get_plot_limits import set_plot_limits_by_points
+from core.helpers.plotting import (
+    create_figure,
+    figure_to_svg,
+    plot_data_to_json,
+    PlotMode,
+)
+
+
+class NewtonsMethodVariant(Enum):
+    NEWTON = "newton"
+    HALLEY = "halley"
 
 
 class NewtonsMethodResponse(BaseModel):
     root: float
     iterations: int
     function_calls: int
+    df_string: str
     execution_time_ms: float
-    plot_svg: str
+    plot_svg: str | None = None
+    plot_data: dict[str, list[float | None]] | None = None
+    result_id: str | None = None
 
     model_config = {
         "json_schema_extra": {
@@ -26,7 +38,8 @@ class NewtonsMethodResponse(BaseModel):
                 {
                     "root": 0.7390851332151607,
                     "iterations": 4,
-                    "function_calls": 5,
+                    "function_calls": 10,
+                    "df_string": "-sin(x) - 1",
                     "execution_time_ms": 0.05000114440917969,
                     "plot_svg": "<svg>...</svg>",
                 }
@@ -35,87 +48,70 @@ class NewtonsMethodResponse(BaseModel):
     }
 
 
-@timeout(
-    CALCULATION_TIMEOUT,
-    timeout_exception=TimeoutError,
-)
-def newtons_method(
-    f_string: str, df_string: str, x0: float, tol: float = 1e-6, max_iter: int = 100
-):
+def newtons_method_plot_data(f_string: str, df_string: str, x0: float, root: float):
     """
-    Find the root of a function using Newton's method and create an SVG plot with details.
+    Calculate the data for the plot of Newton's method.
 
     :param f_string:    String expression of the function f(x).
     :param df_string:   String expression of the derivative of f(x).
     :param x0:          Initial guess for the root.
-    :param tol:         Tolerance for convergence.
-    :param max_iter:    Maximum number of iterations.
+    :param root:        The found root.
 
-    :return: A dictionary containing the root, number of iterations, number of function calls, execution time and SVG plot.
+    :return: A dictionary containing the x values, the function values and the tangent values at the root.
     """
+    f_np = compile_expression(f_string).f_np
+    f_prime_np = compile_expression(df_string).f_np
 
-    try:
-        x = sp.symbols("x")
-
-        # Parse LaTeX expressions to symbolic methods
-        f = sp.sympify(f_string)
-        f_prime = sp.sympify(df_string)
-
-        # Convert to numpy methods for numerical calculations
-        f_np = sp.lambdify(x, f, "numpy")
-        f_prime_np = sp.lambdify(x, f_prime, "numpy")
-
-        # Measure execution time
-        start_time = time.time()
+    # Generate x values for plotting
+    root_to_x0_distance = abs(root - x0)
+    x_values = np.linspace(
+        root - (root_to_x0_distance * 2),
+        root + (root_to_x0_distance * 2),
+        400,
+    )
+    if root_to_x0_distance == 0:
+        x_values = np.linspace(
+            root - 10,
+            root + 10,
+            10000,
+        )
+    y_values = f_np(x_values)
+    tangent = f_prime_np(root) * (x_values - root) + f_np(root)
 
-        # Find the root
-        root = x0
-        iterations = 0
-        function_calls = 0
+    return {
+        "x_values": x_values,
+        "y_values": y_values,
+        "tangent": tangent,
+    }
 
-        try:
-            for _ in range(max_iter):
-                root = root - f_np(root) / f_prime_np(root)
-                iterations += 1
-                function_calls += 3
 
-                if abs(f_np(root)) < tol:
-                    break
-        except Exception as e:
-            root, iterations, function_calls = optimize.newton(
-                f_np, x0, fprime=f_prime_np, tol=tol, maxiter=max_iter, full_output=True
-            )
+def render_newtons_method_plot(
+    f_string: str, df_string: str, x0: float, root: float
+) -> str:
+    """
+    Create an SVG plot of Newton's method.
 
-        # Calculate execution time in milliseconds
-        execution_time_ms = (time.time() - start_time) * 1000
+    :param f_string:    String expression of the function f(x).
+    :param df_string:   String expression of the derivative of f(x).
+    :param x0:          Initial guess for the root.
+    :param root:        The found root.
 
-        # Generate x values for plotting
-        root_to_x0_distance = abs(root - x0)
-        x_values = np.linspace(
-            root - (root_to_x0_distance * 2),
-            root + (root_to_x0_distance * 2),
-            400,
-        )
-        if root_to_x0_distance == 0:
-            x_values = np.linspace(
-                root - 10,
-                root + 10,
-                10000,
-            )
-        y_values = f_np(x_values)
-        tangent = f_prime_np(root) * (x_values - root) + f_np(root)
+    :return: The SVG plot.
+    """
+    plot_data = newtons_method_plot_data(f_string, df_string, x0, root)
+    x_values = plot_data["x_values"]
 
-        # Create the plot
-        plt.figure(figsize=(12, 12))
-        plt.margins(0)
-        set_plot_limits_by_points(plt, [(root, 0), (x0, 0)])
+    # Create the plot
+    with create_figure() as (figure, ax):
+        ax.margins(0)
+        set_plot_limits_by_points(ax, [(root, 0), (x0, 0)])
 
-        plt.plot(x_values, y_values, label="f(x)")
-        plt.plot(x_values, tangent, label="Tangent to f(x)", linestyle="--")
-        plt.axvline(0, color="black", linewidth=0.5)
-        plt.axhline(0, color="black", linewidth=0.5)
+        ax.plot(x_values, plot_data["y_values"], label="f(x)")
+        ax.plot(x_values, plot_data["tangent"], label="Tangent to f(x)", linestyle="--")
+        ax.axvline(0, color="black", linewidth=0.5)
+        ax.axhline(0, color="black", linewidth=0.5)
 
-        plt.scatter(
+        ax.scatter(
             root,
             0,
             color="red",
@@ -123,7 +119,7 @@ def newtons_method(
             label=f"Root ({str(round(root, 2)).rstrip('0').rstrip('.')})",
             zorder=3,
         )
-        plt.scatter(
+        ax.scatter(
             x0,
             0,
             color="green",
@@ -131,33 +127,152 @@ def newtons_method(
             label=f"Initial guess for the root ({str(round(x0, 2)).rstrip('0').rstrip('.')})",
             zorder=3,
         )
-        plt.grid(True, linestyle="--", alpha=0.7)
-        plt.xlabel("x")
-        plt.ylabel("y")
-        plt.legend()
+        ax.grid(True, linestyle="--", alpha=0.7)
+        ax.set_xlabel("x")
+        ax.set_ylabel("y")
+        ax.legend()
 
         # Save the plot to an SVG file with a transparent background
-        svg_buffer = BytesIO()
-        plt.savefig(
-            svg_buffer,
-            format="svg",
-            transparent=True,
-            bbox_inches="tight",
-            pad_inches=0,
+        return figure_to_svg(figure)
+
+
+def compile_newtons_method_derivatives(
+    f_string: str, df_string: str | None, order: int
+):
+    """
+    Compile a function of x returning the values of f(x) and its derivatives up to the given order.
+
+    Derivatives that are not provided are derived symbolically, and all values are computed by one NumPy
+    function sharing their common subexpressions.
+
+    :param f_string:    String expression of the function f(x).
+    :param df_string:   String expression of the derivative of f(x), derived from f(x) if not provided.
+    :param order:       Highest order of the derivatives, 1 for Newton's method and 2 for Halley's method.
+
+    :return: The function returning the list of values and the string expression of the first derivative.
+    """
+    if df_string is None:
+        compiled = compile_derivatives(f_string, order)
+        return compiled.f_np, str(compiled.f[1])
+
+    f_np = compile_expression(f_string).f_np
+    derivatives_np = compile_derivatives(df_string, order - 1).f_np
+
+    def values(x):
+        return [f_np(x), *derivatives_np(x)]
+
+    return values, df_string
+
+
+def newtons_method_step(values: list, method: NewtonsMethodVariant):
+    """
+    Calculate the step of Newton's or Halley's method from the values of f(x) and its derivatives.
+
+    :param values:  Values of f(x), f'(x) and, for Halley's method, f''(x).
+    :param method:  Newton's or Halley's method.
+
+    :return: The step to subtract from x.
+    """
+    if method == NewtonsMethodVariant.HALLEY:
+        f, f_prime, f_second = values
+        return 2 * f * f_prime / (2 * f_prime**2 - f * f_second)
+
+    f, f_prime = values
+    return f / f_prime
+
+
+@with_deadline(CALCULATION_TIMEOUT)
+def newtons_method(
+    f_string: str,
+    df_string: str | None,
+    x0: float,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+    plot: PlotMode = PlotMode.SVG,
+    method: NewtonsMethodVariant = NewtonsMethodVariant.NEWTON,
+):
+    """
+    Find the root of a function using Newton's method and create an SVG plot with details.
+
+    :param f_string:    String expression of the function f(x).
+    :param df_string:   String expression of the derivative of f(x), derived from f(x) if not provided.
+    :param x0:          Initial guess for the root.
+    :param tol:         Tolerance for convergence.
+    :param max_iter:    Maximum number of iterations.
+    :param plot:        Whether to create an SVG plot, return the plot data or skip plotting.
+    :param method:      Newton's method or Halley's method using the second derivative.
+
+    :return: A dictionary containing the root, number of iterations, number of function calls, the used derivative, execution time, the plot and the arguments needed to create the plot later.
+    """
+
+    try:
+        # Parse string expressions and convert them to numpy methods for numerical calculations
+        order = 2 if method == NewtonsMethodVariant.HALLEY else 1
+        derivatives_np, df_string = compile_newtons_method_derivatives(
+            f_string, df_string, order
         )
-        svg_buffer.seek(0)
-        svg_plot = svg_buffer.read().decode("utf-8")
 
-        # Close the plot
-        plt.close()
+        # Measure execution time
+        start_time = time.time()
+
+        # Find the root
+        root = x0
+        iterations = 0
+        function_calls = 0
+
+        try:
+            for _ in range(max_iter):
+                check_deadline()
+
+                values = derivatives_np(root)
+                function_calls += len(values)
+
+                if abs(values[0]) < tol:
+                    break
+
+                root = root - newtons_method_step(values, method)
+                iterations += 1
+        except TimeoutError:
+            raise
+        except Exception as e:
+            # Import SciPy only when the fallback is needed, it is slow to import
+            from scipy import optimize
+
+            # SciPy uses Halley's method when the second derivative is given
+            root, iterations, function_calls = optimize.newton(
+                lambda x: derivatives_np(x)[0],
+                x0,
+                fprime=lambda x: derivatives_np(x)[1],
+                fprime2=(lambda x: derivatives_np(x)[2]) if order == 2 else None,
+                tol=tol,
+                maxiter=max_iter,
+                full_output=True,
+            )
+
+        # Calculate execution time in milliseconds
+        execution_time_ms = (time.time() - start_time) * 1000
+
+        plot_args = {
+            "f_string": f_string,
+            "df_string": df_string,
+            "x0": x0,
+            "root": root,
+        }
 
         # Return the results
         return {
             "root": root,
             "iterations": iterations,
             "function_calls": function_calls,
+            "df_string": df_string,
             "execution_time_ms": execution_time_ms,
-            "plot_svg": svg_plot,
+            "plot_svg": render_newtons_method_plot(**plot_args)
+            if plot == PlotMode.SVG
+            else None,
+            "plot_data": plot_data_to_json(newtons_method_plot_data(**plot_args))
+            if plot == PlotMode.DATA
+            else None,
+            "plot_args": plot_args,
         }
     except TimeoutError:
         # Handle timeout error and raise an HTTPException with a specific status code and detail message
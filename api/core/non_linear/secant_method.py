@@ -1,22 +1,28 @@
 import time
-from io import BytesIO
 
 import numpy as np
-import sympy as sp
 from fastapi import HTTPException
-from matplotlib import pyplot as plt
 from pydantic import BaseModel
-from timeout_decorator import timeout
 
 from api.constants import CALCULATION_TIMEOUT, CALCULATION_TIMEOUT_ERROR_MESSAGE
+from core.helpers.compile_expression import compile_expression
+from core.helpers.deadline import check_deadline, with_deadline
 from core.helpers.get_plot_limits import set_plot_limits_by_points
+from core.helpers.plotting import (
+    create_figure,
+    figure_to_svg,
+    plot_data_to_json,
+    PlotMode,
+)
 
 
 class SecantMethodResponse(BaseModel):
     root: float
     iterations: int
     execution_time_ms: float
-    plot_svg: str
+    plot_svg: str | None = None
+    plot_data: dict[str, list[float | None]] | None = None
+    result_id: str | None = None
 
     model_config = {
         "json_schema_extra": {
@@ -47,6 +53,8 @@ def secant_method_implementation(f, x0, x1, tol, max_iter):
 
     steps = []
     for i in range(max_iter):
+        check_deadline()
+
         f_x0 = f(x0)
         f_x1 = f(x1)
 
@@ -72,89 +80,80 @@ def secant_method_implementation(f, x0, x1, tol, max_iter):
     )
 
 
-@timeout(
-    CALCULATION_TIMEOUT,
-    timeout_exception=TimeoutError,
-)
-def secant_method(
-    f_string: str, x0: float, x1: float, tol: float = 1e-6, max_iter: int = 100
+def secant_method_plot_data(
+    f_string: str, x0: float, x1: float, root: float, steps: list[float]
 ):
     """
-    Find the root of a function using simple iteration method and create an SVG plot with details.
+    Calculate the data for the plot of the secant method.
 
     :param f_string:    String expression of the function f(x).
     :param x0:          Initial guess for the root.
     :param x1:          Initial guess for the root.
-    :param tol:         Tolerance for convergence.
-    :param max_iter:    Maximum number of iterations.
+    :param root:        The found root.
+    :param steps:       Intermediate approximations of the root.
 
-    :return: A dictionary containing the root, number of iterations, execution time and SVG plot.
+    :return: A dictionary containing the arrays to plot.
     """
+    f_np = compile_expression(f_string).f_np
+
+    # Generate x values for plotting
+    root_to_x0_distance = abs(root - x0)
+    x_values = np.linspace(
+        root - (root_to_x0_distance * 2),
+        root + (root_to_x0_distance * 2),
+        10000,
+    )
+    if root_to_x0_distance == 0:
+        x_values = np.linspace(
+            root - 10,
+            root + 10,
+            10000,
+        )
 
-    try:
-        if x0 >= x1:
-            raise ValueError('The "b" must be greater than "a".')
-
-        if tol <= 0:
-            raise ValueError("Tolerance must be positive.")
-
-        if max_iter <= 0:
-            raise ValueError("Maximum number of iterations must be greater than zero.")
-
-        x = sp.symbols("x")
-
-        # Parse string expression to symbolic methods
-        f = sp.sympify(f_string)
-
-        # Convert to numpy methods for numerical calculations
-        f_np = sp.lambdify(x, f, "numpy")
-
-        # Measure execution time
-        start_time = time.time()
+    # Add a zero to the x_values
+    for i in range(len(x_values) - 1):
+        if x_values[i] < 0 < x_values[i + 1] or x_values[i] > 0 > x_values[i + 1]:
+            x_values = np.insert(x_values, i + 1, 0)
+            break
 
-        # Simple iteration method implementation
-        root, iterations, steps = secant_method_implementation(
-            f_np, x0, x1, tol, max_iter
-        )
+    y_values = f_np(x_values)
 
-        if not (x0 < root < x1 or x1 < root < x0):
-            raise ValueError("The root is not in provided range.")
+    return {
+        "x_values": x_values,
+        "y_values": y_values,
+        "steps": steps,
+    }
 
-        # Measure execution time
-        execution_time_ms = (time.time() - start_time) * 1000
 
-        # Generate x values for plotting
-        root_to_x0_distance = abs(root - x0)
-        x_values = np.linspace(
-            root - (root_to_x0_distance * 2),
-            root + (root_to_x0_distance * 2),
-            10000,
-        )
-        if root_to_x0_distance == 0:
-            x_values = np.linspace(
-                root - 10,
-                root + 10,
-                10000,
-            )
+def render_secant_method_plot(
+    f_string: str, x0: float, x1: float, root: float, steps: list[float]
+) -> str:
+    """
+    Create an SVG plot of the secant method.
 
-        # Add a zero to the x_values
-        for i in range(len(x_values) - 1):
-            if x_values[i] < 0 < x_values[i + 1] or x_values[i] > 0 > x_values[i + 1]:
-                x_values = np.insert(x_values, i + 1, 0)
-                break
+    :param f_string:    String expression of the function f(x).
+    :param x0:          Initial guess for the root.
+    :param x1:          Initial guess for the root.
+    :param root:        The found root.
+    :param steps:       Intermediate approximations of the root.
 
-        y_values = f_np(x_values)
+    :return: The SVG plot.
+    """
+    plot_data = secant_method_plot_data(f_string, x0, x1, root, steps)
+    x_values = plot_data["x_values"]
+    y_values = plot_data["y_values"]
+    f_np = compile_expression(f_string).f_np
 
-        # Create the plot
-        plt.figure(figsize=(12, 12))
-        plt.margins(0)
-        set_plot_limits_by_points(plt, [(x0, 0), (x1, 0)])
+    # Create the plot
+    with create_figure() as (figure, ax):
+        ax.margins(0)
+        set_plot_limits_by_points(ax, [(x0, 0), (x1, 0)])
 
-        plt.plot(x_values, y_values, label="f(x)")
-        plt.axvline(0, color="black", linewidth=0.5)
-        plt.axhline(0, color="black", linewidth=0.5)
+        ax.plot(x_values, y_values, label="f(x)")
+        ax.axvline(0, color="black", linewidth=0.5)
+        ax.axhline(0, color="black", linewidth=0.5)
 
-        plt.scatter(
+        ax.scatter(
             root,
             0,
             color="red",
@@ -177,7 +176,7 @@ def secant_method(
         prev_step = None
 
         for step in steps:
-            plt.scatter(
+            ax.scatter(
                 step,
                 0,
                 color="green",
@@ -186,7 +185,7 @@ def secant_method(
                 alpha=0.5,
             )
 
-            plt.plot(
+            ax.plot(
                 [step, end_point],
                 [f_np(step), f_np(end_point)],
                 color="red",
@@ -196,7 +195,7 @@ def secant_method(
             )
 
             if prev_step:
-                plt.plot(
+                ax.plot(
                     [prev_step, prev_step],
                     [f_np(prev_step), 0],
                     color="green",
@@ -207,7 +206,7 @@ def secant_method(
 
             prev_step = step
 
-        plt.axvline(
+        ax.axvline(
             x0,
             color="blue",
             linestyle="--",
@@ -215,7 +214,7 @@ def secant_method(
             alpha=0.5,
             label=f"a ({str(round(x0, 2)).rstrip('0').rstrip('.')})",
         )
-        plt.axvline(
+        ax.axvline(
             x1,
             color="blue",
             linestyle="--",
@@ -224,32 +223,84 @@ def secant_method(
             label=f"b ({str(round(x1, 2)).rstrip('0').rstrip('.')})",
         )
 
-        plt.grid(True, linestyle="--", alpha=0.7)
-        plt.xlabel("x")
-        plt.ylabel("y")
-        plt.legend()
+        ax.grid(True, linestyle="--", alpha=0.7)
+        ax.set_xlabel("x")
+        ax.set_ylabel("y")
+        ax.legend()
 
         # Save the plot to an SVG file with a transparent background
-        svg_buffer = BytesIO()
-        plt.savefig(
-            svg_buffer,
-            format="svg",
-            transparent=True,
-            bbox_inches="tight",
-            pad_inches=0,
+        return figure_to_svg(figure)
+
+
+@with_deadline(CALCULATION_TIMEOUT)
+def secant_method(
+    f_string: str,
+    x0: float,
+    x1: float,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+    plot: PlotMode = PlotMode.SVG,
+):
+    """
+    Find the root of a function using simple iteration method and create an SVG plot with details.
+
+    :param f_string:    String expression of the function f(x).
+    :param x0:          Initial guess for the root.
+    :param x1:          Initial guess for the root.
+    :param tol:         Tolerance for convergence.
+    :param max_iter:    Maximum number of iterations.
+    :param plot:        Whether to create an SVG plot, return the plot data or skip plotting.
+
+    :return: A dictionary containing the root, number of iterations, execution time, the plot and the arguments needed to create the plot later.
+    """
+
+    try:
+        if x0 >= x1:
+            raise ValueError('The "b" must be greater than "a".')
+
+        if tol <= 0:
+            raise ValueError("Tolerance must be positive.")
+
+        if max_iter <= 0:
+            raise ValueError("Maximum number of iterations must be greater than zero.")
+
+        # Parse string expression and convert it to numpy methods for numerical calculations
+        f_np = compile_expression(f_string).f_np
+
+        # Measure execution time
+        start_time = time.time()
+
+        # Simple iteration method implementation
+        root, iterations, steps = secant_method_implementation(
+            f_np, x0, x1, tol, max_iter
         )
-        svg_buffer.seek(0)
-        svg_plot = svg_buffer.read().decode("utf-8")
 
-        # Close the plot
-        plt.close()
+        if not (x0 < root < x1 or x1 < root < x0):
+            raise ValueError("The root is not in provided range.")
+
+        # Measure execution time
+        execution_time_ms = (time.time() - start_time) * 1000
+
+        plot_args = {
+            "f_string": f_string,
+            "x0": x0,
+            "x1": x1,
+            "root": root,
+            "steps": steps,
+        }
 
         # Return the results
         return {
             "root": root,
             "iterations": iterations,
             "execution_time_ms": execution_time_ms,
-            "plot_svg": svg_plot,
+            "plot_svg": render_secant_method_plot(**plot_args)
+            if plot == PlotMode.SVG
+            else None,
+            "plot_data": plot_data_to_json(secant_method_plot_data(**plot_args))
+            if plot == PlotMode.DATA
+            else None,
+            "plot_args": plot_args,
         }
 
     except TimeoutError:
@@ -0,0 +1,166 @@
+from io import BytesIO
+
+import numpy as np
+from fastapi import HTTPException
+from fastapi.responses import Response
+
+RAW_MEDIA_TYPE = "application/octet-stream"
+NPY_MEDIA_TYPE = "application/x-npy"
+NPY_MAGIC = b"\x93NUMPY"
+
+# OpenAPI description of the binary request bodies, FastAPI can not infer it from a raw Request parameter
+BINARY_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            RAW_MEDIA_TYPE: {"schema": {"type": "string", "format": "binary"}},
+            NPY_MEDIA_TYPE: {"schema": {"type": "string", "format": "binary"}},
+        },
+    }
+}
+
+
+def read_array(body: bytes, rows: int | None = None) -> np.ndarray:
+    """
+    Decode a matrix of float64 values from a raw little-endian buffer or a .npy file without copying the data.
+
+    :param body:    Raw little-endian float64 values in row-major order or the contents of a .npy file.
+    :param rows:    Number of rows of a raw buffer. Not needed for .npy files, which contain their shape.
+
+    :return: A read-only two-dimensional array backed by the body.
+    """
+    if body.startswith(NPY_MAGIC):
+        stream = BytesIO(body)
+        version = np.lib.format.read_magic(stream)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(stream)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(stream)
+
+        if dtype.kind not in "fiu":
+            raise ValueError("The .npy array must contain numbers.")
+
+        array = np.frombuffer(
+            body, dtype=dtype, count=int(np.prod(shape)), offset=stream.tell()
+        ).reshape(shape, order="F" if fortran_order else "C")
+
+        if array.ndim == 1:
+            array = array.reshape(1, -1) if rows is None else array.reshape(rows, -1)
+
+        # Only arrays of another data type are copied
+        return array.astype("<f8", copy=False)
+
+    if rows is None:
+        raise ValueError('The number of "rows" is required for raw float64 buffers.')
+
+    if rows <= 0 or len(body) % (rows * 8) != 0:
+        raise ValueError(
+            f"The buffer of {len(body)} bytes can not be split into {rows} rows of float64 values."
+        )
+
+    return np.frombuffer(body, dtype="<f8").reshape(rows, -1)
+
+
+def solve_linear_system_binary(
+    solve, body: bytes, rows: int | None, constants_columns: int, *args
+):
+    """
+    Decode an augmented matrix [A|b] and solve the system of linear equations with it.
+
+    Runs in a worker process, so the body is decoded where it is used and only the result is sent back.
+
+    :param solve:               Module-level function solving the system, called as solve(A, b, *args).
+    :param body:                The augmented matrix as a raw float64 buffer or a .npy file.
+    :param rows:                Number of rows of a raw buffer.
+    :param constants_columns:   Number of trailing columns holding the constants, one per right-hand side.
+    :param args:                Further arguments of the solve function.
+
+    :return: The result of the solve function.
+    """
+    try:
+        augmented = read_array(body, rows)
+
+        if augmented.ndim != 2 or not 0 < constants_columns < augmented.shape[1]:
+            raise ValueError(
+                f"The augmented matrix must have more than {constants_columns} columns."
+            )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    A = augmented[:, :-constants_columns]
+    b = augmented[:, -constants_columns:]
+    if constants_columns == 1:
+        b = b[:, 0]
+
+    return solve(A, b, *args)
+
+
+def interpolate_binary(interpolate, body: bytes, *args):
+    """
+    Decode the data points as a matrix with the x values in the first row and the y values in the second row
+    and interpolate them.
+
+    :param interpolate: Module-level function interpolating the points, called as interpolate(x, y, *args).
+    :param body:        The data points as a raw float64 buffer or a .npy file.
+    :param args:        Further arguments of the interpolate function.
+
+    :return: The result of the interpolate function.
+    """
+    try:
+        points = read_array(body, rows=2)
+
+        if points.ndim != 2 or points.shape[0] != 2:
+            raise ValueError(
+                "The data points must be a matrix with the x values in the first row and the y values in the second row."
+            )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    return interpolate(points[0], points[1], *args)
+
+
+def array_response(values, media_type: str, execution_time_ms: float) -> Response:
+    """
+    Encode an array of results as a raw little-endian float64 buffer or a .npy file.
+
+    :param values:              The values to encode.
+    :param media_type:          Either the raw or the .npy media type.
+    :param execution_time_ms:   Execution time of the calculation, sent in a header.
+
+    :return: The binary response with the shape and execution time in the headers.
+    """
+    array = np.asarray(values, dtype="<f8")
+
+    if media_type == NPY_MEDIA_TYPE:
+        buffer = BytesIO()
+        np.save(buffer, array)
+        content = buffer.getvalue()
+    else:
+        content = array.tobytes()
+
+    return Response(
+        content=content,
+        media_type=media_type,
+        headers={
+            "X-Shape": ",".join(str(size) for size in array.shape),
+            "X-Execution-Time-Ms": str(execution_time_ms),
+        },
+    )
+
+
+def wants_binary_response(accept: str | None) -> str | None:
+    """
+    Choose the binary media type of the response from the Accept header.
+
+    :param accept:  Value of the Accept header.
+
+    :return: The raw or .npy media type, or None if JSON is accepted.
+    """
+    if accept is None:
+        return None
+
+    for media_type in (NPY_MEDIA_TYPE, RAW_MEDIA_TYPE):
+        if media_type in accept:
+            return media_type
+
+    return None
@@ -0,0 +1,22 @@
+from core.helpers.lru_cache import LRUCacheStats
+from helpers.process_pool import process_pool
+
+
+async def collect_cache_stats(get_stats) -> dict:
+    """
+    Collect the statistics of a per-process cache from every worker process.
+
+    :param get_stats:   Module-level function returning the LRUCacheStats of the cache in the current process.
+
+    :return: A dictionary with the statistics summed over all workers under "total" and the statistics of every
+             worker with its process ID under "workers".
+    """
+    stats_by_pid = await process_pool.run_on_every_worker(get_stats)
+
+    return {
+        "total": LRUCacheStats.total(list(stats_by_pid.values())).to_dict(),
+        "workers": [
+            {"pid": pid, **stats.to_dict()}
+            for pid, stats in sorted(stats_by_pid.items())
+        ],
+    }
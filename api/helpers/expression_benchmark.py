@@ -0,0 +1,83 @@
+"""
+Benchmark the compiled expressions against plain SymPy lambdify.
+
+Usage:
+    python -m helpers.expression_benchmark [--expression "sin(x)**2 + sin(x)*exp(-x**2)"] [--size 10000] [--repeat 50]
+
+Compares the evaluation time of the default NumPy code generated by lambdify with the functions created by
+compile_expression, which eliminate common subexpressions and use numexpr for large arrays if it is installed.
+"""
+
+import argparse
+import timeit
+
+import numpy as np
+
+DEFAULT_EXPRESSIONS = [
+    "x**3 - 2*x + 2",
+    "sin(x)**2 + sin(x)*exp(-x**2)",
+    "exp(-x**2/2)*cos(5*x) + exp(-x**2/2)*sin(5*x)",
+    "log(1 + x**2)/(1 + x**2) + sqrt(1 + x**2)",
+]
+
+
+def benchmark_expression(
+    expression: str, size: int, repeat: int
+) -> tuple[float, float]:
+    """
+    Measure the evaluation time of an expression on an evenly spaced grid.
+
+    :param expression:  String expression of the function f(x).
+    :param size:        Number of grid points.
+    :param repeat:      Number of evaluations to average.
+
+    :return: Average time in milliseconds of plain lambdify and of the compiled expression.
+    """
+    # Import SymPy on first use, it is slow to import
+    import sympy as sp
+
+    from core.helpers.compile_expression import compile_expression
+
+    x = np.linspace(0.1, 10, size)
+
+    plain = sp.lambdify(sp.symbols("x"), sp.sympify(expression), "numpy")
+    compiled = compile_expression(expression).f_np
+
+    if not np.allclose(plain(x), compiled(x), equal_nan=True):
+        raise ValueError(
+            f"The compiled expression {expression} returns different values."
+        )
+
+    plain_ms = timeit.timeit(lambda: plain(x), number=repeat) / repeat * 1000
+    compiled_ms = timeit.timeit(lambda: compiled(x), number=repeat) / repeat * 1000
+    return plain_ms, compiled_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark compiled expressions against plain lambdify."
+    )
+    parser.add_argument(
+        "--expression",
+        action="append",
+        help="Expression to benchmark, can be repeated. Defaults to a set of typical expressions.",
+    )
+    parser.add_argument(
+        "--size", type=int, default=10000, help="Number of grid points."
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=50, help="Number of evaluations to average."
+    )
+    args = parser.parse_args()
+
+    print(f"Evaluation time on {args.size} points")
+    print(f"{'lambdify [ms]':>14} {'compiled [ms]':>14} {'speedup':>8}  expression")
+    for expression in args.expression or DEFAULT_EXPRESSIONS:
+        plain_ms, compiled_ms = benchmark_expression(expression, args.size, args.repeat)
+        print(
+            f"{plain_ms:>14.3f} {compiled_ms:>14.3f} {plain_ms / compiled_ms:>7.2f}x  {expression}"
+        )
+
+
+if __name__ == "__main__":
+    main()
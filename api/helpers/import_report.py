@@ -0,0 +1,99 @@
+"""
+Report the import cost of the API modules at startup.
+
+Usage:
+    python -m helpers.import_report [--module api.main] [--top 20] [--max-total-ms 1000]
+
+Exits with status 1 if the total import time exceeds --max-total-ms, so it can be used to catch startup regressions.
+"""
+
+import argparse
+import subprocess
+import sys
+from dataclasses import dataclass
+
+
+@dataclass
+class ImportTime:
+    module: str
+    self_ms: float
+    cumulative_ms: float
+    depth: int
+
+
+def measure_import_times(module: str) -> list[ImportTime]:
+    """
+    Import a module in a fresh interpreter and collect the import time of every module it loads.
+
+    :param module:  Name of the module to import.
+
+    :return: A list of import times in the order reported by the interpreter.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    import_times = []
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        import_times.append(
+            ImportTime(
+                module=name.strip(),
+                self_ms=int(self_us) / 1000,
+                cumulative_ms=int(cumulative_us) / 1000,
+                depth=(len(name) - len(name.lstrip()) - 1) // 2,
+            )
+        )
+
+    return import_times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report import cost per module.")
+    parser.add_argument("--module", default="api.main", help="Module to import.")
+    parser.add_argument(
+        "--top", type=int, default=20, help="Number of slowest modules to show."
+    )
+    parser.add_argument(
+        "--max-total-ms",
+        type=float,
+        default=None,
+        help="Fail if the total import time exceeds this value.",
+    )
+    args = parser.parse_args()
+
+    import_times = measure_import_times(args.module)
+    total_ms = sum(import_time.self_ms for import_time in import_times)
+
+    # Direct imports of the measured module show which of its dependencies are expensive
+    root_depth = min(import_time.depth for import_time in import_times)
+    direct_imports = [
+        import_time
+        for import_time in import_times
+        if import_time.depth in (root_depth, root_depth + 1)
+        and import_time.module != args.module
+    ]
+    direct_imports.sort(key=lambda import_time: import_time.cumulative_ms, reverse=True)
+
+    print(f"Total import time of {args.module}: {total_ms:.1f} ms")
+    print(f"{'cumulative [ms]':>16} {'self [ms]':>10}  module")
+    for import_time in direct_imports[: args.top]:
+        print(
+            f"{import_time.cumulative_ms:>16.1f} {import_time.self_ms:>10.1f}  {import_time.module}"
+        )
+
+    if args.max_total_ms is not None and total_ms > args.max_total_ms:
+        print(
+            f"Total import time {total_ms:.1f} ms exceeds the limit of {args.max_total_ms:.1f} ms"
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import asyncio
+import pickle
+import uuid
+import weakref
+
+from api.constants import (
+    INTERPOLANT_STORE_MAX_MEMORY_BYTES,
+    INTERPOLANT_STORE_MAX_SIZE,
+    INTERPOLANT_STORE_TTL_SECONDS,
+)
+from core.helpers.lru_cache import LRUCache
+
+_store = LRUCache(
+    max_size=INTERPOLANT_STORE_MAX_SIZE,
+    max_memory_bytes=INTERPOLANT_STORE_MAX_MEMORY_BYTES,
+    sizeof=lambda value: len(pickle.dumps(value)),
+    ttl_seconds=INTERPOLANT_STORE_TTL_SECONDS,
+)
+
+# Locks are dropped as soon as no request holds or waits for them
+_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
+
+
+def store_interpolant(interpolant, method, interpolant_id: str | None = None) -> str:
+    """
+    Store an interpolant, so that it can be evaluated later by its ID.
+
+    :param interpolant:     Newton's or Lagrange's interpolant.
+    :param method:          The interpolation method of the interpolant.
+    :param interpolant_id:  ID of an existing interpolant to replace, or None to store a new one.
+
+    :return: The interpolant ID.
+    """
+    if interpolant_id is None:
+        interpolant_id = uuid.uuid4().hex
+
+    _store.put(interpolant_id, (interpolant, method))
+    return interpolant_id
+
+
+def get_interpolant(interpolant_id: str):
+    """
+    Get a stored interpolant.
+
+    :param interpolant_id:  ID of the interpolant.
+
+    :return: A tuple of the interpolant and its interpolation method or None if it has expired or was evicted.
+    """
+    return _store.get(interpolant_id)
+
+
+def interpolant_lock(interpolant_id: str) -> asyncio.Lock:
+    """
+    Get the lock serializing the updates of a stored interpolant, so that concurrent updates are not lost.
+
+    :param interpolant_id:  ID of the interpolant.
+
+    :return: The lock of the interpolant.
+    """
+    lock = _locks.get(interpolant_id)
+    if lock is None:
+        lock = _locks[interpolant_id] = asyncio.Lock()
+
+    return lock
@@ -0,0 +1,243 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+
+from fastapi import HTTPException
+
+from api.constants import (
+    CALCULATION_TIMEOUT_ERROR_MESSAGE,
+    PROCESS_POOL_INTERRUPTED_ERROR_MESSAGE,
+    PROCESS_POOL_MAX_QUEUE_DEPTH,
+    PROCESS_POOL_QUEUE_FULL_ERROR_MESSAGE,
+    PROCESS_POOL_SIZE,
+    PROCESS_POOL_TASK_DEADLINE,
+)
+
+
+@dataclass
+class _TaskError:
+    status_code: int
+    detail: str
+
+
+def _run_task(func, args, kwargs):
+    # HTTPException can not be unpickled, so it is sent back to the event loop as plain data
+    try:
+        return func(*args, **kwargs)
+    except HTTPException as e:
+        return _TaskError(status_code=e.status_code, detail=e.detail)
+
+
+def _run_with_pid(func):
+    return os.getpid(), func()
+
+
+class ProcessPool:
+    """
+    Runs CPU-bound calculations in worker processes so that they do not block the asyncio event loop.
+
+    Every worker process has its own single-process executor, so a task is only submitted once a worker is free,
+    its deadline starts when it actually starts running, and a task overrunning its deadline can be stopped by
+    terminating only its own worker.
+    """
+
+    def __init__(self, max_workers: int, max_queue_depth: int, task_deadline: float):
+        """
+        :param max_workers:         Number of worker processes.
+        :param max_queue_depth:     Maximum number of tasks waiting for a free worker.
+        :param task_deadline:       Maximum time in seconds to wait for the result of a running task.
+        """
+        self.max_workers = max_workers
+        self.max_queue_depth = max_queue_depth
+        self.task_deadline = task_deadline
+        self._lock = threading.Lock()
+        self._workers: list[ProcessPoolExecutor | None] = [None] * max_workers
+        self._free_workers = list(range(max_workers))
+        self._waiters: deque[asyncio.Future] = deque()
+
+    async def _get_worker(self, index: int) -> ProcessPoolExecutor:
+        with self._lock:
+            worker = self._workers[index]
+
+            # A worker that died on its own leaves its executor unusable, so replace it
+            if worker is not None and worker._broken:
+                worker.shutdown(wait=False, cancel_futures=True)
+                worker = None
+
+            started = worker is None
+            if started:
+                worker = ProcessPoolExecutor(
+                    max_workers=1, mp_context=multiprocessing.get_context("spawn")
+                )
+                self._workers[index] = worker
+
+        if started:
+            # Wait until the new process has started and imported this module, so that its startup does not count
+            # against the task deadline
+            await asyncio.wrap_future(worker.submit(_run_task, os.getpid, (), {}))
+
+        return worker
+
+    async def _acquire_worker(self) -> int:
+        with self._lock:
+            if self._free_workers:
+                return self._free_workers.pop()
+
+            if len(self._waiters) >= self.max_queue_depth:
+                raise HTTPException(
+                    status_code=503, detail=PROCESS_POOL_QUEUE_FULL_ERROR_MESSAGE
+                )
+
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+
+        try:
+            return await waiter
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    return_worker = None
+                elif waiter.done() and not waiter.cancelled():
+                    # The worker was handed over just before the request was cancelled
+                    return_worker = waiter.result()
+                else:
+                    return_worker = None
+
+            if return_worker is not None:
+                self._release_worker(return_worker)
+            raise
+
+    def _release_worker(self, index: int):
+        # Called from the executor threads when a task is done, so waiters are woken up on their own event loops
+        with self._lock:
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                try:
+                    waiter.get_loop().call_soon_threadsafe(
+                        self._hand_over_worker, waiter, index
+                    )
+                    return
+                except RuntimeError:
+                    # The event loop of the waiter is closed
+                    continue
+
+            self._free_workers.append(index)
+
+    def _hand_over_worker(self, waiter: asyncio.Future, index: int):
+        if waiter.cancelled():
+            self._release_worker(index)
+        else:
+            waiter.set_result(index)
+
+    async def run(self, func, *args, **kwargs):
+        """
+        Run a function in a worker process and wait for its result.
+
+        :param func:    Module-level function to run.
+        :param args:    Positional arguments of the function.
+        :param kwargs:  Keyword arguments of the function.
+
+        :return: The result of the function.
+        """
+        index = await self._acquire_worker()
+
+        try:
+            worker = await self._get_worker(index)
+            future = worker.submit(_run_task, func, args, kwargs)
+        except BaseException:
+            self._release_worker(index)
+            raise
+
+        # Free the worker only when it is done, even if the request has already timed out
+        future.add_done_callback(lambda _: self._release_worker(index))
+
+        result_future = asyncio.wrap_future(future)
+        try:
+            result = await asyncio.wait_for(
+                asyncio.shield(result_future), timeout=self.task_deadline
+            )
+        except asyncio.TimeoutError:
+            # Nobody waits for the result anymore, retrieve it so that its exception is not reported as unhandled
+            result_future.add_done_callback(
+                lambda done: done.cancelled() or done.exception()
+            )
+
+            # The calculation ignored its cooperative deadline (e.g. a runaway sympify call), so kill its worker
+            if not future.cancel():
+                self._terminate_worker(index, worker, future)
+            raise HTTPException(
+                status_code=408, detail=CALCULATION_TIMEOUT_ERROR_MESSAGE
+            )
+        except BrokenProcessPool:
+            raise HTTPException(
+                status_code=503, detail=PROCESS_POOL_INTERRUPTED_ERROR_MESSAGE
+            )
+
+        if isinstance(result, _TaskError):
+            raise HTTPException(status_code=result.status_code, detail=result.detail)
+
+        return result
+
+    async def run_on_every_worker(self, func) -> dict[int, object]:
+        """
+        Run a function without arguments in every started worker process, for example to collect per-process
+        statistics. The function runs after the task a worker is currently running.
+
+        :param func:    Module-level function to run.
+
+        :return: A dictionary of the results by the process ID of the worker.
+        """
+        with self._lock:
+            workers = [worker for worker in self._workers if worker is not None]
+
+        futures = []
+        for worker in workers:
+            try:
+                futures.append(asyncio.wrap_future(worker.submit(_run_with_pid, func)))
+            except (BrokenProcessPool, RuntimeError):
+                # The worker was terminated or shut down
+                continue
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*futures, return_exceptions=True),
+            timeout=self.task_deadline,
+        )
+        return dict(
+            result for result in results if not isinstance(result, BaseException)
+        )
+
+    def _terminate_worker(self, index: int, worker: ProcessPoolExecutor, future):
+        with self._lock:
+            # A task finishing just now may already have released its worker to another request, which must not be
+            # killed. The worker is only released by the done callback, which waits for this lock.
+            if future.done() or self._workers[index] is not worker:
+                return
+
+            self._workers[index] = None
+
+        # ProcessPoolExecutor can not cancel running tasks, so the worker process is terminated directly.
+        # Only the task running in this worker fails, the other workers keep running their tasks.
+        for process in list(worker._processes.values()):
+            process.terminate()
+        worker.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self):
+        with self._lock:
+            workers, self._workers = self._workers, [None] * self.max_workers
+
+        for worker in workers:
+            if worker is not None:
+                worker.shutdown(wait=False, cancel_futures=True)
+
+
+process_pool = ProcessPool(
+    max_workers=PROCESS_POOL_SIZE,
+    max_queue_depth=PROCESS_POOL_MAX_QUEUE_DEPTH,
+    task_deadline=PROCESS_POOL_TASK_DEADLINE,
+)
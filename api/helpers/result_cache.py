@@ -0,0 +1,61 @@
+import sys
+import uuid
+
+import numpy as np
+
+from api.constants import RESULT_CACHE_MAX_MEMORY_BYTES, RESULT_CACHE_MAX_SIZE
+from core.helpers.lru_cache import LRUCache
+
+
+def _sizeof_plot_args(value) -> int:
+    # The plot arguments are a dictionary of arrays, lists of floats and scalars, the data points dominate
+    _, plot_args = value
+    size = sys.getsizeof(plot_args)
+    for argument in plot_args.values():
+        if isinstance(argument, np.ndarray):
+            size += argument.nbytes
+        elif isinstance(argument, (list, tuple)):
+            size += sys.getsizeof(argument) + len(argument) * sys.getsizeof(0.0)
+        else:
+            size += sys.getsizeof(argument)
+
+    return size
+
+
+_cache = LRUCache(
+    max_size=RESULT_CACHE_MAX_SIZE,
+    max_memory_bytes=RESULT_CACHE_MAX_MEMORY_BYTES,
+    sizeof=_sizeof_plot_args,
+)
+
+
+def cache_result(result: dict, render_plot) -> dict:
+    """
+    Remember how to plot a calculation result, so that the plot can be created later by its result ID.
+
+    :param result:      Result of a calculation containing the arguments of its plot function under "plot_args",
+                        or None if the result is too large to be plotted later.
+    :param render_plot: Module-level function creating the SVG plot from the plot arguments.
+
+    :return: The result without the plot arguments and with the result ID, which is None if the result is not cached.
+    """
+    plot_args = result.pop("plot_args")
+    if plot_args is None:
+        result["result_id"] = None
+        return result
+
+    result_id = uuid.uuid4().hex
+    _cache.put(result_id, (render_plot, plot_args))
+    result["result_id"] = result_id
+    return result
+
+
+def get_cached_result(result_id: str):
+    """
+    Get the plot function and its arguments of a cached calculation result.
+
+    :param result_id:   ID of the calculation result.
+
+    :return: A tuple of the plot function and its arguments or None if the result is not cached anymore.
+    """
+    return _cache.get(result_id)
@@ -0,0 +1,34 @@
+import math
+
+import pytest
+
+from core.integration.adaptive_quadrature import (
+    AdaptiveQuadratureMethod,
+    adaptive_quadrature,
+)
+
+
+@pytest.mark.parametrize("method", list(AdaptiveQuadratureMethod))
+@pytest.mark.parametrize(
+    "f_string, a, b, expected",
+    [
+        ("sin(x)", 0, math.pi, 2.0),
+        ("exp(x)", 0, 1, math.e - 1),
+        ("sqrt(x)", 0, 1, 2 / 3),
+        ("1/(1 + 25*x**2)", -1, 1, 2 / 5 * math.atan(5)),
+    ],
+)
+def test_adaptive_quadrature_meets_tolerance(method, f_string, a, b, expected):
+    result = adaptive_quadrature(f_string, a, b, tol=1e-10, method=method)
+
+    assert result["converged"]
+    assert abs(result["result"] - expected) <= 1e-9
+
+
+def test_adaptive_quadrature_refines_only_difficult_intervals():
+    smooth = adaptive_quadrature("exp(x)", 0, 1, tol=1e-10)
+    peaked = adaptive_quadrature("1/(1e-4 + x**2)", -1, 1, tol=1e-10)
+
+    assert smooth["intervals"] == 1
+    assert peaked["intervals"] > 1
+    assert math.isclose(peaked["result"], 2 / 1e-2 * math.atan(1e2), rel_tol=1e-9)
@@ -0,0 +1,22 @@
+import math
+
+import pytest
+from fastapi import HTTPException
+
+from core.helpers.plotting import PlotMode
+from core.non_linear.brents_method import brents_method
+
+
+def test_finds_root_in_bracket():
+    result = brents_method("x**3 - 2*x - 5", 2, 3, tol=1e-12, plot=PlotMode.NONE)
+
+    assert math.isclose(result["root"], 2.0945514815423265, abs_tol=1e-10)
+
+
+@pytest.mark.parametrize("a, b", [(-1, 1), (2, 3)])
+def test_same_sign_bracket_is_rejected(a, b):
+    with pytest.raises(HTTPException) as error:
+        brents_method("x**2 + 1", a, b, plot=PlotMode.NONE)
+
+    assert error.value.status_code == 422
+    assert "different signs" in error.value.detail
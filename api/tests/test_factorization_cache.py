@@ -0,0 +1,43 @@
+import numpy as np
+
+from core.linear_systems.factorization_cache import get_factorization_cache_stats
+from core.linear_systems.gaussian_elimination_method import gaussian_elimination_method
+from core.linear_systems.matrix_input import SparseMatrix
+
+
+def test_repeated_matrix_reuses_factorization():
+    coefficient_matrix = [[4.0, 1.0, 2.0], [1.0, 5.0, 1.0], [2.0, 1.0, 6.0]]
+    hits = get_factorization_cache_stats().hits
+
+    first = gaussian_elimination_method(coefficient_matrix, [1.0, 2.0, 3.0])
+    second = gaussian_elimination_method(coefficient_matrix, [3.0, 2.0, 1.0])
+
+    assert not first["factorization_cached"]
+    assert second["factorization_cached"]
+    assert get_factorization_cache_stats().hits == hits + 1
+    assert np.allclose(np.array(coefficient_matrix) @ second["roots"], [3.0, 2.0, 1.0])
+
+
+def test_different_matrix_is_factorized():
+    gaussian_elimination_method([[2.0, 1.0], [1.0, 3.0]], [1.0, 2.0])
+
+    result = gaussian_elimination_method([[2.0, 1.0], [1.0, 4.0]], [1.0, 2.0])
+
+    assert not result["factorization_cached"]
+
+
+def test_sparse_matrix_reuses_factorization():
+    coefficient_matrix = SparseMatrix(
+        format="coo",
+        shape=(3, 3),
+        data=[3.0, 4.0, 5.0, 1.0],
+        row=[0, 1, 2, 0],
+        col=[0, 1, 2, 2],
+    )
+
+    first = gaussian_elimination_method(coefficient_matrix, [1.0, 2.0, 3.0])
+    second = gaussian_elimination_method(coefficient_matrix, [1.0, 2.0, 3.0])
+
+    assert not first["factorization_cached"]
+    assert second["factorization_cached"]
+    assert second["roots"] == first["roots"]
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from core.linear_systems.fixed_point_iteration_system import (
+    estimate_spectral_radius,
+    FixedPointIterationSystemMethod,
+    fixed_point_iteration_system_method_implementation,
+)
+
+
+def poisson_matrix(n):
+    return 2 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+
+
+@pytest.mark.parametrize(
+    "method, expected",
+    [
+        (FixedPointIterationSystemMethod.JACOBI, np.cos(np.pi / 51)),
+        (FixedPointIterationSystemMethod.GAUSS_SEIDEL, np.cos(np.pi / 51) ** 2),
+    ],
+)
+def test_spectral_radius_of_poisson_matrix(method, expected):
+    assert np.isclose(
+        estimate_spectral_radius(poisson_matrix(50), method, 1.0), expected
+    )
+
+
+def test_non_normal_iteration_matrix_is_not_rejected():
+    # The Jacobi iteration matrix is nilpotent, so the method converges in n steps
+    n = 40
+    A = np.eye(n) - 2 * np.eye(n, k=1)
+
+    roots, iterations, diagnostics = fixed_point_iteration_system_method_implementation(
+        A, A @ np.ones(n), 1e-10, 100
+    )
+
+    assert np.allclose(roots, 1)
+    assert iterations <= n + 1
+    assert diagnostics["spectral_radius"] is None or diagnostics["spectral_radius"] < 1
+
+
+def test_divergence_is_detected():
+    with pytest.raises(ValueError):
+        fixed_point_iteration_system_method_implementation(
+            np.array([[1.0, 2.0], [3.0, 1.0]]), [1.0, 1.0], 1e-8, 5000
+        )
@@ -0,0 +1,52 @@
+import math
+
+import pytest
+
+from core.integration.gaussian_quadrature import (
+    gauss_nodes_and_weights,
+    GaussianQuadratureRule,
+    gaussian_quadrature,
+)
+
+
+@pytest.mark.parametrize(
+    "f_string, a, b, rule, expected",
+    [
+        ("x**39 + x**2", -1, 1, GaussianQuadratureRule.LEGENDRE, 2 / 3),
+        ("exp(-x)", 0, math.inf, GaussianQuadratureRule.LAGUERRE, 1.0),
+        ("exp(x)", -math.inf, 0, GaussianQuadratureRule.LAGUERRE, 1.0),
+        (
+            "exp(-x**2)",
+            -math.inf,
+            math.inf,
+            GaussianQuadratureRule.HERMITE,
+            math.sqrt(math.pi),
+        ),
+    ],
+)
+def test_gaussian_quadrature_is_exact_for_its_weight_function(
+    f_string, a, b, rule, expected
+):
+    result = gaussian_quadrature(f_string, a, b)
+
+    assert result["rule"] == rule
+    assert math.isclose(result["result"], expected, rel_tol=1e-12)
+    assert result["error_estimate"] <= 1e-12
+
+
+def test_gaussian_quadrature_error_estimate_bounds_error():
+    result = gaussian_quadrature("1/(1 + x**2)", 0, math.inf)
+
+    error = abs(result["result"] - math.pi / 2)
+    assert error > 1e-3
+    assert result["error_estimate"] >= error
+
+
+def test_non_finite_error_estimate_is_omitted():
+    # A pole at a node of the rule of half the order, but not at a node of the rule itself
+    pole = gauss_nodes_and_weights(GaussianQuadratureRule.LEGENDRE, 10)[0][0]
+
+    result = gaussian_quadrature(f"1/(x - ({float(pole)!r}))", -1, 1, order=20)
+
+    assert math.isfinite(result["result"])
+    assert result["error_estimate"] is None
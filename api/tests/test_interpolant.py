@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+from fastapi import HTTPException
+
+from api.constants import INTERPOLANT_EVALUATION_MAX_OPERATIONS
+from core.helpers.deadline import with_deadline
+from core.interpolation.interpolant import evaluate_interpolant
+from core.interpolation.lagranges_interpolation_method import LagrangeInterpolant
+from core.interpolation.newtons_interpolation_method import NewtonInterpolant
+
+X_VALUES = [0.0, 1.0, -1.5, 2.5, 0.5, -3.0, 4.0, 1.75]
+Y_VALUES = [np.cos(x) + x**2 for x in X_VALUES]
+POINTS = np.linspace(-3.0, 4.0, 57)
+
+
+@pytest.mark.parametrize("interpolant_class", [LagrangeInterpolant, NewtonInterpolant])
+@pytest.mark.parametrize("initial_nodes", [1, 2, 5])
+def test_add_point_matches_rebuild(interpolant_class, initial_nodes):
+    interpolant = interpolant_class(X_VALUES[:initial_nodes], Y_VALUES[:initial_nodes])
+    for x, y in zip(X_VALUES[initial_nodes:], Y_VALUES[initial_nodes:]):
+        interpolant.add_point(x, y)
+
+    rebuilt = interpolant_class(X_VALUES, Y_VALUES)
+
+    assert np.array_equal(interpolant.x_values, rebuilt.x_values)
+    assert np.allclose(interpolant(POINTS), rebuilt(POINTS), rtol=1e-10, atol=1e-10)
+    assert np.allclose(interpolant(np.array(X_VALUES)), Y_VALUES)
+
+
+def test_newton_add_point_matches_rebuilt_coefficients():
+    interpolant = NewtonInterpolant(X_VALUES[:3], Y_VALUES[:3])
+    for x, y in zip(X_VALUES[3:], Y_VALUES[3:]):
+        interpolant.add_point(x, y)
+
+    rebuilt = NewtonInterpolant(X_VALUES, Y_VALUES)
+
+    assert np.allclose(interpolant.coefficients, rebuilt.coefficients)
+
+
+@pytest.mark.parametrize("interpolant_class", [LagrangeInterpolant, NewtonInterpolant])
+def test_add_existing_point_is_rejected(interpolant_class):
+    interpolant = interpolant_class(X_VALUES, Y_VALUES)
+
+    with pytest.raises(ValueError):
+        interpolant.add_point(X_VALUES[2], 0.0)
+
+
+@pytest.mark.parametrize("interpolant_class", [LagrangeInterpolant, NewtonInterpolant])
+def test_evaluation_stops_at_deadline(interpolant_class):
+    interpolant = interpolant_class(np.arange(2000) / 2000, np.zeros(2000))
+    evaluate = with_deadline(0)(interpolant)
+
+    with pytest.raises(TimeoutError):
+        evaluate(np.zeros(1000))
+
+
+def test_too_large_evaluation_is_rejected():
+    nodes = 64
+    interpolant = NewtonInterpolant(np.arange(nodes), np.zeros(nodes))
+
+    with pytest.raises(HTTPException) as error:
+        evaluate_interpolant(
+            interpolant, [0.0] * (INTERPOLANT_EVALUATION_MAX_OPERATIONS // nodes + 1)
+        )
+
+    assert error.value.status_code == 422
@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from core.linear_systems.least_squares_method import lsmr_solve
+
+
+def test_lsmr_solves_sparse_system():
+    rng = np.random.default_rng(0)
+    A = sp.random(300, 50, density=0.1, random_state=0).tocsr() + sp.eye(300, 50)
+    b = rng.standard_normal(300)
+
+    expected = np.linalg.lstsq(A.toarray(), b, rcond=None)[0]
+
+    assert np.allclose(lsmr_solve(A.tocsr(), b), expected, atol=1e-6)
+
+
+def test_lsmr_iteration_limit_is_reported():
+    rng = np.random.default_rng(0)
+    n = 400
+    Q = np.linalg.qr(rng.standard_normal((n, n)))[0]
+    A = sp.csr_matrix(Q * np.logspace(0, 7, n))
+
+    with pytest.raises(ValueError, match="did not converge"):
+        lsmr_solve(A, rng.standard_normal(n))
@@ -0,0 +1,110 @@
+import asyncio
+import os
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from helpers.process_pool import ProcessPool
+
+
+async def run_on_pool(pool: ProcessPool, *tasks):
+    try:
+        return await asyncio.gather(
+            *(pool.run(func, *args) for func, *args in tasks), return_exceptions=True
+        )
+    finally:
+        pool.shutdown()
+
+
+def test_queued_tasks_get_their_own_deadline():
+    pool = ProcessPool(max_workers=1, max_queue_depth=2, task_deadline=1.5)
+
+    # Waiting for the busy worker does not count towards the deadline of a task
+    results = asyncio.run(
+        run_on_pool(pool, *[(time.sleep, 0.6)] * 3),
+    )
+
+    assert results == [None, None, None]
+
+
+def test_full_queue_is_rejected():
+    pool = ProcessPool(max_workers=1, max_queue_depth=1, task_deadline=5)
+
+    results = asyncio.run(run_on_pool(pool, *[(time.sleep, 0.5)] * 3))
+
+    assert results[:2] == [None, None]
+    assert isinstance(results[2], HTTPException)
+    assert results[2].status_code == 503
+
+
+def test_timeout_terminates_only_the_overrunning_worker():
+    pool = ProcessPool(max_workers=2, max_queue_depth=2, task_deadline=1)
+
+    async def run():
+        try:
+            first_pid, second_pid = await asyncio.gather(
+                pool.run(os.getpid), pool.run(os.getpid)
+            )
+            overrun, *pids = await asyncio.gather(
+                pool.run(time.sleep, 10),
+                pool.run(os.getpid),
+                pool.run(os.getpid),
+                return_exceptions=True,
+            )
+            # The terminated worker is replaced by a new process
+            workers = await pool.run_on_every_worker(os.getpid)
+            await asyncio.gather(pool.run(time.sleep, 0), pool.run(time.sleep, 0))
+            return {first_pid, second_pid}, overrun, pids, workers
+        finally:
+            pool.shutdown()
+
+    start_time = time.monotonic()
+    initial_pids, overrun, pids, workers = asyncio.run(run())
+
+    assert time.monotonic() - start_time < 5
+    assert isinstance(overrun, HTTPException)
+    assert overrun.status_code == 408
+    # The other tasks kept running on the worker that was not terminated
+    assert len(set(pids)) == 1
+    assert set(pids) < initial_pids
+    assert list(workers) == list(workers.values())
+
+
+def test_task_errors_are_raised_as_http_exceptions():
+    pool = ProcessPool(max_workers=1, max_queue_depth=1, task_deadline=5)
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(_run_failing_task(pool))
+
+    assert error.value.status_code == 422
+
+
+async def _run_failing_task(pool: ProcessPool):
+    from core.non_linear.brents_method import brents_method
+
+    try:
+        return await pool.run(brents_method, "x**2 + 1", -1, 1)
+    finally:
+        pool.shutdown()
+
+
+def test_finished_task_does_not_terminate_the_reused_worker():
+    pool = ProcessPool(max_workers=1, max_queue_depth=1, task_deadline=5)
+
+    async def run():
+        try:
+            pid = await pool.run(os.getpid)
+            worker = pool._workers[0]
+            finished = worker.submit(os.getpid)
+            finished.result()
+
+            # The timed out task finished just before its worker was to be terminated
+            pool._terminate_worker(0, worker, finished)
+            return pid, await pool.run(os.getpid)
+        finally:
+            pool.shutdown()
+
+    pid, next_pid = asyncio.run(run())
+
+    assert next_pid == pid
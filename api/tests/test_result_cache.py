@@ -0,0 +1,29 @@
+import numpy as np
+
+from core.interpolation.lagranges_interpolation_method import (
+    render_lagranges_interpolation_method_plot,
+)
+from helpers.result_cache import cache_result, get_cached_result
+
+
+def test_plot_arguments_are_cached_by_result_id():
+    plot_args = {"x": np.arange(1000.0), "y": np.zeros(1000), "x_value": 0.5}
+
+    result = cache_result(
+        {"root": 1.0, "plot_args": plot_args},
+        render_lagranges_interpolation_method_plot,
+    )
+
+    assert "plot_args" not in result
+    assert get_cached_result(result["result_id"]) == (
+        render_lagranges_interpolation_method_plot,
+        plot_args,
+    )
+
+
+def test_result_without_plot_arguments_is_not_cached():
+    result = cache_result(
+        {"root": 1.0, "plot_args": None}, render_lagranges_interpolation_method_plot
+    )
+
+    assert result == {"root": 1.0, "result_id": None}
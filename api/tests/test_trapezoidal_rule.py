@@ -0,0 +1,41 @@
+import math
+
+import pytest
+from fastapi import HTTPException
+
+from core.integration.trapezoidal_rule import TrapezoidalRuleMode, trapezoidal_rule
+
+
+def test_romberg_method_converges():
+    result = trapezoidal_rule("exp(x)", 0, 1, 4, TrapezoidalRuleMode.ROMBERG, tol=1e-12)
+
+    assert result["converged"]
+    assert math.isclose(result["result"], math.e - 1, rel_tol=1e-12)
+    assert result["error_estimate"] <= 1e-12
+
+
+@pytest.mark.parametrize(
+    "number_of_interval_partitions, max_romberg_levels",
+    [(1, 10**18), (100, 18), (1 << 25, 1)],
+)
+def test_too_many_romberg_partitions_are_rejected(
+    number_of_interval_partitions, max_romberg_levels
+):
+    with pytest.raises(HTTPException) as error:
+        trapezoidal_rule(
+            "x",
+            0,
+            1,
+            number_of_interval_partitions,
+            TrapezoidalRuleMode.ROMBERG,
+            max_romberg_levels=max_romberg_levels,
+        )
+
+    assert error.value.status_code == 422
+
+
+def test_non_finite_romberg_result_is_rejected():
+    with pytest.raises(HTTPException) as error:
+        trapezoidal_rule("log(x - 0.5)", 0, 1, 4, TrapezoidalRuleMode.ROMBERG)
+
+    assert error.value.status_code == 422